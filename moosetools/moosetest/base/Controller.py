@@ -30,6 +30,11 @@ class Controller(MooseTestObject):
     """
     AUTO_BUILD = False
 
+    # If True, the `moosetest.run` function evaluates the controller for each `Runner` prior to
+    # submitting the test cases to the workers. This should be False for a controller that depends
+    # on the state of the process executing the object.
+    PRE_DISPATCH = True
+
     @staticmethod
     def validParams():
         params = MooseTestObject.validParams()
@@ -88,6 +88,17 @@ class Formatter(MooseObject):
                 self.__progress_time[tc_obj.unique_id] = current
                 self._printState(tc_obj, tc_obj.runner, tc_obj.progress, None)
 
+    def nextProgressTime(self, tc_obj):
+        """
+        Return the time (in seconds) at which the progress of the running `TestCase` in *tc_obj*
+        should next be reported.
+
+        This allows the `moosetools.run` function to sleep until progress output is required,
+        rather than continuously calling the `reportProgress` method.
+        """
+        progress_time = self.__progress_time.get(tc_obj.unique_id, tc_obj.start_time)
+        return progress_time + self.__progress_interval
+
     def reportResults(self, tc_obj):
         """
         Print the results of the `TestCase` in *tc_obj*.
@@ -128,7 +139,10 @@ class Formatter(MooseObject):
 
         # Report Runner results
         r_data = tc_obj.results.get(tc_obj.runner.name())
-        self._printState(tc_obj, tc_obj.runner, tc_obj.state, r_data.reasons)
+        reasons = r_data.reasons
+        if (r_data.attempts or 1) > 1:
+            reasons = list(reasons or []) + [f'{r_data.attempts} attempts']
+        self._printState(tc_obj, tc_obj.runner, tc_obj.state, reasons)
         self._printResult(tc_obj, tc_obj.runner, r_data)
 
         # Report Differ results
@@ -170,6 +184,7 @@ class Formatter(MooseObject):
 
         kwargs['stdout'] = data.stdout
         kwargs['stderr'] = data.stderr
+        kwargs['resources'] = data.resources
 
         if obj is tc_obj.runner:
             txt = self.formatRunnerResult(**kwargs)
@@ -14,6 +14,14 @@ from moosetools.parameters import InputParameters
 from .MooseTestObject import MooseTestObject
 from .Differ import Differ
 
+# The environment variable containing the directory for the temporary output files of the `Runner`
+# objects, which the `moosetest.run` function creates and removes (see `Runner.getOutputFiles`)
+OUTPUT_DIR_VARIABLE = 'MOOSETEST_OUTPUT_DIR'
+
+# The environment variable containing the directory in which the files with the complete output of
+# the `Runner` objects are retained, which the `moosetest.run` function sets if requested
+RETAIN_DIR_VARIABLE = 'MOOSETEST_RETAIN_DIR'
+
 
 def make_runner(cls, controllers=None, **kwargs):
     """
@@ -65,6 +73,48 @@ class Runner(MooseTestObject):
                    vtype=Differ,
                    array=True,
                    doc="The 'Differ' object(s) to execute after execution of this object.")
+        params.add(
+            'depends_on',
+            vtype=str,
+            array=True,
+            doc=
+            "Name(s) of the `Runner` object(s) within the same test specification that must complete successfully prior to execution of this object. By default, the object depends on the previously defined object; an empty string removes all dependencies."
+        )
+        params.add(
+            'isolate',
+            vtype=bool,
+            default=False,
+            doc=
+            "Execute within a new subprocess rather than the persistent subprocess shared with other test cases. This should be enabled if execution alters the state of the process (e.g., environment variables or the working directory)."
+        )
+        params.add(
+            'n_procs',
+            vtype=int,
+            default=1,
+            verify=(Runner.verifyPositive, "The value must be greater than zero."),
+            doc=
+            "The number of processes used by execution (e.g., the number of MPI processes), see 'getSlots'."
+        )
+        params.add(
+            'n_threads',
+            vtype=int,
+            default=1,
+            verify=(Runner.verifyPositive, "The value must be greater than zero."),
+            doc="The number of threads used by each process during execution, see 'getSlots'.")
+        params.add(
+            'max_retries',
+            vtype=int,
+            verify=(Runner.verifyNotNegative, "The value must not be negative."),
+            doc=
+            "The number of times that an execution with a TIMEOUT, EXCEPTION, or FATAL state is repeated before the failure is reported, a DIFF or ERROR is not repeated. By default, the 'max_retries' argument of the `moosetest.run` function is used."
+        )
+        params.add(
+            'tags',
+            vtype=str,
+            array=True,
+            doc=
+            "Label(s) for selecting the test cases to execute, see the 'tags' argument of the `moosetest.discover` function."
+        )
 
         # Parameters associated with file names
         params.add(
@@ -123,11 +173,63 @@ class Runner(MooseTestObject):
         """
         return os.path.isdir(value) and os.path.isabs(value)
 
+    @staticmethod
+    def verifyPositive(value):
+        """
+        Verify function for 'n_procs' and 'n_threads' parameters, see `verifyBaseDirectory`.
+        """
+        return value > 0
+
+    @staticmethod
+    def verifyNotNegative(value):
+        """
+        Verify function for 'max_retries' parameter, see `verifyBaseDirectory`.
+        """
+        return value >= 0
+
     def __init__(self, *args, **kwargs):
         MooseTestObject.__init__(self, *args, **kwargs)
         self.__expected_files = None
         self.__pre_execute_files = None
 
+    def getSlots(self):
+        """
+        Return the number of processors (slots) required for execution of this object.
+
+        The `moosetest.run` function limits the test cases that execute concurrently such that the
+        total number of slots does not exceed the number of threads available.
+        """
+        return self.getParam('n_procs') * self.getParam('n_threads')
+
+    def getOutputFiles(self):
+        """
+        Return a `tuple` with the names of the files containing the complete sys.stdout and
+        sys.stderr of the last execution, each name is `None` if the output was retained in full.
+
+        A `Runner` that limits the output retained in memory (e.g., `RunCommand`) should override
+        this method. The `TestCase` object provides the names to the `Differ` objects along with the
+        output (see `OutputText`). Temporary files should be created in the directory given by the
+        `OUTPUT_DIR_VARIABLE` environment variable, if it is set, such that the files of a process
+        that is terminated are removed.
+        """
+        return None, None
+
+    def getResourceUsage(self):
+        """
+        Return a `dict` of the resource usage of the last execution measured by this object, or
+        `None`.
+
+        The usage is stored in the results (see `TestCase.Data`). A `Runner` that executes a process
+        should override this method to report the usage of that process (e.g., `RunCommand`), the
+        usage of the process executing the `Runner` is not reported, because it is shared with the
+        other test cases.
+
+        The `dict` may include the peak resident memory ('max_rss', in bytes), the CPU time in user
+        and system mode ('user_time' and 'sys_time', in seconds), and the bytes read from and
+        written to storage ('read_bytes' and 'write_bytes').
+        """
+        return None
+
     def preExecute(self):
         """
         Called prior to execution of this object.
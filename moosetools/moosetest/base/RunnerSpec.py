@@ -0,0 +1,88 @@
+#* This file is part of MOOSETOOLS repository
+#* https://www.github.com/idaholab/moosetools
+#*
+#* All rights reserved, see COPYRIGHT for full restrictions
+#* https://github.com/idaholab/moosetools/blob/main/COPYRIGHT
+#*
+#* Licensed under LGPL 2.1, please see LICENSE for details
+#* https://www.gnu.org/licenses/lgpl-2.1.html
+
+import functools
+import collections
+
+
+class RunnerSpec(collections.namedtuple('RunnerSpec',
+                                        'otype params hit_path filename line differs')):
+    """
+    A compact, immutable record of a `Runner` or `Differ` object to be created.
+
+    The record contains the type (*otype*), a `dict` of the parameter values that were supplied
+    (*params*), the location of the definition in the test specification file (*hit_path*,
+    *filename*, and *line*), and the records of the `Differ` objects (*differs*).
+
+    The `moosetest.discover` function creates these in place of the objects, if requested, such
+    that the objects are only created within the process that executes them (see
+    `TestCase.execute`). The methods required by the `moosetest.run` function and the `Formatter`
+    (`name`, `getParam`, and `getSlots`) are available without creating the object.
+    """
+    __slots__ = ()
+
+    def name(self):
+        """
+        Return the "name" parameter.
+        """
+        return self.params.get('name')
+
+    def getParam(self, *args):
+        """
+        Return the value of a parameter, the default of the type is returned if a value was not
+        supplied.
+
+        The names in *args* are as used by `InputParameters.getValue`. The `Differ` objects are
+        returned as `RunnerSpec` objects for the "differs" parameter.
+        """
+        if args == ('differs', ):
+            return self.differs or None
+
+        key = '_'.join(args)
+        if key in self.params:
+            return self.params[key]
+        return _default_params(self.otype).getValue(*args)
+
+    def getSlots(self):
+        """
+        Return the number of processors (slots) required for execution of the object.
+
+        The `getSlots` method of the type is used, thus it must only depend on the parameters.
+        """
+        return self.otype.getSlots(self)
+
+    def parameters(self, controllers=None):
+        """
+        Return the `InputParameters` of the object, with the `Controller` objects in *controllers*,
+        without creating the object.
+
+        The parameters are created by the `moosetest.discover.MooseTestFactory`, the 'differs'
+        parameter is not set.
+        """
+        from moosetools.moosetest.discover import MooseTestFactory  # avoid a circular import
+        return MooseTestFactory.specParams(self, controllers)
+
+    def create(self, controllers=None):
+        """
+        Return the `Runner` or `Differ` object, with the attached `Differ` objects, using the
+        `validObjectParams` of the `Controller` objects in *controllers*.
+
+        The objects are created by the `moosetest.discover.MooseTestFactory`.
+        """
+        from moosetools.moosetest.discover import MooseTestFactory  # avoid a circular import
+        return MooseTestFactory.createFromSpec(self, controllers)
+
+
+@functools.lru_cache(maxsize=None)
+def _default_params(otype):
+    """
+    Return the `InputParameters` from the `validParams` function of *otype*, see
+    `RunnerSpec.getParam`.
+    """
+    return otype.validParams()
@@ -27,6 +27,7 @@ from moosetools.base import MooseObject
 from .Runner import Runner
 from .Differ import Differ
 from .Controller import Controller
+from .RunnerSpec import RunnerSpec
 
 
 class State(enum.Enum):
@@ -145,6 +146,28 @@ class RedirectOutput(object):
             h.setFormatter(f)
 
 
+def max_rss_bytes(value):
+    """
+    Return the `ru_maxrss` *value* from `resource.getrusage` or `os.wait4` in bytes.
+    """
+    return value if sys.platform == 'darwin' else value * 1024
+
+
+class OutputText(str):
+    """
+    The sys.stdout or sys.stderr (`str`) supplied to the `Differ` objects, with the *filename* of
+    the complete output if only a portion of the output is retained in memory (see
+    `Runner.getOutputFiles`).
+
+    A `Differ` that inspects the output should also inspect the file, if it is provided (see
+    `moosetest.differs.ConsoleDiffer`).
+    """
+    def __new__(cls, text, filename=None):
+        obj = str.__new__(cls, text)
+        obj.filename = filename
+        return obj
+
+
 class TestCase(MooseObject):
     """
     An object for managing the data associated with the execution of a test, which is composed of
@@ -211,16 +234,27 @@ class TestCase(MooseObject):
             stderr: str = None
             #reasons: list[str] = None #Py3.9 only
             reasons: list = None
+            resources: dict = dataclasses.field(default=None, compare=False)
+            attempts: int = dataclasses.field(default=None, compare=False)
 
     else:
 
         class Data(object):
-            def __init__(self, state=None, returncode=None, stdout=None, stderr=None, reasons=None):
+            def __init__(self,
+                         state=None,
+                         returncode=None,
+                         stdout=None,
+                         stderr=None,
+                         reasons=None,
+                         resources=None,
+                         attempts=None):
                 self.state = state
                 self.returncode = returncode
                 self.stdout = stdout
                 self.stderr = stderr
                 self.reasons = reasons
+                self.resources = resources
+                self.attempts = attempts
 
             def __eq__(self, other):
                 return self.state == other.state and self.returncode == other.returncode and \
@@ -237,10 +271,10 @@ class TestCase(MooseObject):
         """
         params = MooseObject.validParams()
         params.add('runner',
-                   vtype=Runner,
+                   vtype=(Runner, RunnerSpec),
                    required=True,
                    mutable=False,
-                   doc="The `Runner` object to execute.")
+                   doc="The `Runner` object, or the `RunnerSpec` for creating it, to execute.")
         params.add('controllers',
                    vtype=Controller,
                    array=True,
@@ -315,14 +349,14 @@ class TestCase(MooseObject):
     @property
     def runner(self):
         """
-        Return the `Runner` object.
+        Return the `Runner` object, or the `RunnerSpec` if it has not been created (see `execute`).
         """
         return self._runner
 
     @property
     def differs(self):
         """
-        Return the `Differ` object(s).
+        Return the `Differ` object(s), or the `RunnerSpec` objects if not created.
         """
         return self._differs
 
@@ -483,12 +517,20 @@ class TestCase(MooseObject):
         The `execute` method is called via the `moosetest.run` function on a subprocess. The state
         and results returned from this method are communicated to the root process instance and
         stored there for reporting.
+
+        If the `Runner` was supplied as a `RunnerSpec`, the objects are created prior to execution.
+        Thus, the objects are only created within the process that executes them.
         """
+        if isinstance(self._runner, RunnerSpec):
+            self._runner = self._runner.create(self._controllers)
+            self._differs = self._runner.getParam('differs') or tuple()
+
         # The results to be returned
         results = dict()
 
         # Execute the runner, if it does not return a PASS state, then execution is complete
         r_data = self._executeObject(self._runner)
+        r_data.resources = self._runner.getResourceUsage()
         results[self._runner.name()] = r_data
         if r_data.state.level > 0:
             return r_data.state, results
@@ -497,8 +539,11 @@ class TestCase(MooseObject):
         # the state returned by each. The overall state is tracked and is always set to the largest
         # state level.
         state = r_data.state
+        out_file, err_file = self._runner.getOutputFiles()
+        stdout = OutputText(r_data.stdout, out_file)
+        stderr = OutputText(r_data.stderr, err_file)
         for obj in self._differs:
-            d_data = self._executeObject(obj, r_data.returncode, r_data.stdout, r_data.stderr)
+            d_data = self._executeObject(obj, r_data.returncode, stdout, stderr)
             results[obj.name()] = d_data
             if (d_data.state.level >= self._min_fail_state.level) and (d_data.state.level >
                                                                        state.level):
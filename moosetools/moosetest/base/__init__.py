@@ -12,5 +12,6 @@ from .Controller import Controller
 from .Runner import Runner, make_runner
 from .Differ import Differ, make_differ
 from .FileDiffer import FileDiffer
+from .RunnerSpec import RunnerSpec
 from .Formatter import Formatter
-from .TestCase import TestCase, State, RedirectOutput
+from .TestCase import TestCase, State, RedirectOutput, OutputText
@@ -0,0 +1,287 @@
+#* This file is part of MOOSETOOLS repository
+#* https://www.github.com/idaholab/moosetools
+#*
+#* All rights reserved, see COPYRIGHT for full restrictions
+#* https://github.com/idaholab/moosetools/blob/main/COPYRIGHT
+#*
+#* Licensed under LGPL 2.1, please see LICENSE for details
+#* https://www.gnu.org/licenses/lgpl-2.1.html
+
+import os
+import io
+import sys
+import json
+import time
+import pickle
+import random
+import logging
+import platform
+import contextlib
+from moosetools import mooseutils
+from moosetools.moosetest.base import TestCase, Formatter, RedirectOutput
+from moosetools.moosetest.base.TestCase import max_rss_bytes
+from moosetools.moosetest.run import run, fuzzer_objects
+from moosetools.moosetest.writers import ResultWriter
+
+try:
+    import resource
+except ImportError:  # pragma: no cover
+    resource = None
+
+# The metrics compared by `compare_benchmark`, for all a larger value is worse
+COMPARED_METRICS = ('per_testcase', 'parent_cpu_per_testcase', 'max_rss_growth', 'testcase_bytes',
+                    'message_bytes', 'per_call')
+
+
+def benchmark(n_threads=(1, 8, 64), n_groups=100, seed=1980, n_calls=2000):
+    """
+    Return a `dict` of measurements of the overhead of the `moosetest.run` function, which is
+    serializable to JSON (see `save_benchmark`).
+
+    The test cases are created with the `moosetest.run.fuzzer_objects` function with *n_groups*
+    groups, using *seed* for the `random` module such that the same test cases are executed each
+    time. The `Runner` and `Differ` objects do not sleep or fail, thus the time measured is the time
+    spent by the harness.
+
+    The 'threads' entry contains the measurements of a call to the `run` function for each of the
+    numbers of workers in *n_threads*: the time per test case and throughput, the CPU time of the
+    calling process per test case, and the growth in peak memory of the calling process. The
+    'payload' entry contains the average size (bytes) of a pickled `TestCase` object, as submitted
+    to the workers, and of the pickled results returned. The 'testcase' and 'redirect_output'
+    entries contain the time per call of `TestCase.execute` and of `RedirectOutput`, respectively,
+    from *n_calls* calls within the calling process.
+    """
+    out = dict(python=platform.python_version(),
+               system=platform.system(),
+               cpu_count=os.cpu_count(),
+               n_groups=n_groups,
+               seed=seed)
+
+    out['threads'] = dict()
+    for n in n_threads:
+        out['threads'][str(n)], testcases = _measure_run(n, n_groups, seed)
+
+    out['payload'] = dict(testcase_bytes=_average(len(pickle.dumps(tc)) for tc in testcases),
+                          message_bytes=_average(
+                              len(pickle.dumps((tc.unique_id, tc.progress, tc.state, tc.results)))
+                              for tc in testcases))
+
+    controllers, groups = _make_objects(1, seed)
+    runner = groups[0][0]
+    with contextlib.redirect_stdout(io.StringIO()):
+        out['testcase'] = dict(per_call=_time_calls(
+            lambda: TestCase(runner=runner, controllers=controllers).execute(), n_calls))
+
+    def redirect():
+        with RedirectOutput():
+            print('stdout')
+            sys.stderr.write('stderr')
+
+    out['redirect_output'] = dict(per_call=_time_calls(redirect, n_calls))
+    return out
+
+
+def save_benchmark(filename, results):
+    """
+    Write the *results* from the `benchmark` function to the JSON file *filename*.
+    """
+    try:
+        mooseutils.atomic_write(filename,
+                                lambda fid: json.dump(results, fid, indent=1, sort_keys=True))
+    except OSError:
+        logging.getLogger(__name__).warning("Failed to write the benchmark file '%s'.", filename)
+
+
+def load_benchmark(filename):
+    """
+    Return the results from the `benchmark` function stored in the JSON file *filename*.
+
+    An empty `dict` is returned if the file does not exist or cannot be read.
+    """
+    if (filename is None) or (not os.path.isfile(filename)):
+        return dict()
+
+    try:
+        with open(filename, 'r') as fid:
+            results = json.load(fid)
+    except (OSError, ValueError):
+        logging.getLogger(__name__).warning("Failed to read the benchmark file '%s'.", filename)
+        return dict()
+
+    return results if isinstance(results, dict) else dict()
+
+
+def compare_benchmark(results, baseline, tolerance=0.25):
+    """
+    Return a `list` of messages for the metrics in *results* that exceed the same metric in
+    *baseline* by more than the fraction *tolerance*, both are returned from the `benchmark`
+    function.
+
+    The metrics in `COMPARED_METRICS` that exist in both are compared, a metric with a baseline
+    value of zero is not compared.
+    """
+    current = _flatten(results)
+    previous = _flatten(baseline)
+    out = list()
+    for key in sorted(set(current).intersection(previous)):
+        if key.rsplit('.', 1)[-1] not in COMPARED_METRICS:
+            continue
+        value, base = current[key], previous[key]
+        if (base > 0) and (value > base * (1 + tolerance)):
+            out.append(f"{key}: {value:.6g} exceeds the baseline of {base:.6g} by " \
+                       f"{(value / base - 1) * 100:.1f}%")
+    return out
+
+
+def run_benchmark(filename, baseline=None, n_threads=(1, 8, 64), tolerance=0.25):
+    """
+    Execute the `benchmark` function with the numbers of workers in *n_threads*, print a summary,
+    and write the results to the JSON file *filename*.
+
+    If *baseline* is provided, the results are compared to those in the file (see
+    `compare_benchmark`) and 1 is returned if any metric exceeds the baseline by more than
+    *tolerance*, otherwise 0 is returned.
+    """
+    results = benchmark(n_threads)
+    save_benchmark(filename, results)
+
+    print(f"  {'Workers':<8} {'Tests':>6} {'Per test (ms)':>14} {'Tests/s':>9} " \
+          f"{'Parent CPU (ms)':>16}")
+    for n, item in results['threads'].items():
+        print(f"  {n:<8} {item['n_testcases']:>6} {item['per_testcase'] * 1000:>14.3f} " \
+              f"{item['throughput']:>9.1f} {item['parent_cpu_per_testcase'] * 1000:>16.3f}")
+    print(f"The benchmark results were written to '{filename}'.")
+
+    if baseline is None:
+        return 0
+
+    regressions = compare_benchmark(results, load_benchmark(baseline), tolerance)
+    if regressions:
+        print(f"The following metric(s) exceed the baseline '{baseline}':")
+        for msg in regressions:
+            print(f"  {msg}")
+        return 1
+    print(f"No metrics exceed the baseline '{baseline}'.")
+    return 0
+
+
+class _QuietFormatter(Formatter):
+    """
+    A `Formatter` that produces no output, such that the benchmark measures the harness.
+    """
+    def formatRunnerState(self, **kwargs):
+        return None
+
+    def formatRunnerResult(self, **kwargs):
+        return None
+
+    def formatDifferState(self, **kwargs):
+        return None
+
+    def formatDifferResult(self, **kwargs):
+        return None
+
+    def formatComplete(self, complete, **kwargs):
+        return None
+
+
+class _Collector(ResultWriter):
+    """
+    A `ResultWriter` that retains the finished `TestCase` objects.
+    """
+    def __init__(self):
+        ResultWriter.__init__(self, None)
+        self.testcases = list()
+
+    def write(self, tc):
+        self.testcases.append(tc)
+
+
+def _make_objects(n_groups, seed):
+    """
+    Return the `Controller` objects and groups for the benchmark, see `benchmark`.
+    """
+    random.seed(seed)
+    return fuzzer_objects(group_num=(n_groups, n_groups),
+                          controller_num=(1, 3),
+                          controller_skip=0,
+                          controller_raise=0,
+                          controller_error=0,
+                          differ_num=(0, 2),
+                          differ_raise=0,
+                          differ_error=0,
+                          differ_fatal=0,
+                          differ_platform=0,
+                          runner_raise=0,
+                          runner_error=0,
+                          runner_fatal=0,
+                          runner_sleep=(0, 0),
+                          runner_platform=0)
+
+
+def _measure_run(n_threads, n_groups, seed):
+    """
+    Return the measurements for a call to the `run` function with *n_threads* workers and the
+    finished `TestCase` objects, see `benchmark`.
+    """
+    controllers, groups = _make_objects(n_groups, seed)
+    collector = _Collector()
+    TestCase.__TOTAL__ = 0
+    TestCase.__FINISHED__ = 0
+
+    rss = _max_rss()
+    cpu = time.process_time()
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        run(groups, controllers, _QuietFormatter(), n_threads=n_threads, writers=(collector, ))
+    duration = time.perf_counter() - start
+    cpu = time.process_time() - cpu
+
+    n_testcases = len(collector.testcases)
+    return dict(n_testcases=n_testcases,
+                duration=duration,
+                per_testcase=duration / n_testcases,
+                throughput=n_testcases / duration,
+                parent_cpu_per_testcase=cpu / n_testcases,
+                max_rss_growth=_max_rss() - rss), collector.testcases
+
+
+def _time_calls(func, n_calls):
+    """
+    Return the average time (in seconds) of *n_calls* calls to *func*.
+    """
+    start = time.perf_counter()
+    for i in range(n_calls):
+        func()
+    return (time.perf_counter() - start) / n_calls
+
+
+def _max_rss():
+    """
+    Return the peak resident memory (in bytes) of the calling process, or zero if not available.
+    """
+    if resource is None:  # pragma: no cover
+        return 0
+    return max_rss_bytes(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+
+
+def _average(values):
+    """
+    Return the average of the *values*, or zero if empty.
+    """
+    values = list(values)
+    return sum(values) / len(values) if values else 0
+
+
+def _flatten(results, prefix=''):
+    """
+    Return a `dict` of the numeric values in the nested *results* keyed by the '.' separated path.
+    """
+    out = dict()
+    for key, value in results.items():
+        name = f'{prefix}{key}'
+        if isinstance(value, dict):
+            out.update(_flatten(value, f'{name}.'))
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            out[name] = value
+    return out
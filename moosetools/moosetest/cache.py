@@ -0,0 +1,224 @@
+#* This file is part of MOOSETOOLS repository
+#* https://www.github.com/idaholab/moosetools
+#*
+#* All rights reserved, see COPYRIGHT for full restrictions
+#* https://github.com/idaholab/moosetools/blob/main/COPYRIGHT
+#*
+#* Licensed under LGPL 2.1, please see LICENSE for details
+#* https://www.gnu.org/licenses/lgpl-2.1.html
+
+import os
+import json
+import shutil
+import hashlib
+import functools
+import logging
+from moosetools import mooseutils
+from moosetools.base import MooseObject
+from moosetools.parameters import InputParameters
+from moosetools.moosetest.base import Runner, FileDiffer, RunnerSpec
+
+# The parameter values included in the hash by `compute_key`
+HASHED_TYPES = (str, bytes, int, float, complex, bool, type(None))
+
+
+def compute_key(runner, controllers=None):
+    """
+    Return a hash (hex `str`) that identifies the inputs of the `Runner` object, or `RunnerSpec`,
+    in *runner*.
+
+    The hash includes the type and parameters of the `Runner` and attached `Differ` objects, the
+    content of the test specification file that created the object, the content of any existing
+    file referenced by a parameter value (relative paths are considered with respect to the
+    'file_base' parameter), and the modification time and size of any executable referenced by a
+    'command' parameter (e.g., `RunCommand`). The files created by the objects (the 'file_names'
+    parameter) are not inputs, so the content of these files is not included. Parameter values
+    that are not one of the `HASHED_TYPES` are included by type and the `Controller` objects are
+    not included.
+
+    The parameters of a `RunnerSpec` are created with the `Controller` objects in *controllers*,
+    without creating the object (see `object_params`).
+    """
+    sha = hashlib.sha1()
+    otype, params, differs = object_params(runner, controllers)
+    base_dir = params.getValue('file', 'base')
+    _update_hash_object(sha, otype, params, differs, base_dir, controllers)
+
+    spec_file = params.getValue('_hit_filename') if '_hit_filename' in params else None
+    if (spec_file is not None) and os.path.isfile(spec_file):
+        _update_hash_with_file(sha, spec_file)
+
+    return sha.hexdigest()
+
+
+def referenced_files(runner, controllers=None):
+    """
+    Return a `set` of the absolute paths of the existing files that are inputs to the `Runner`
+    object, or `RunnerSpec`, in *runner* and the attached `Differ` objects.
+
+    The files are those included in the hash by `compute_key`, which also describes the
+    *controllers*: the test specification file, files referenced by a parameter value, and
+    executables referenced by a 'command' parameter. The gold files of `FileDiffer` objects are
+    included.
+    """
+    files = set()
+    otype, params, differs = object_params(runner, controllers)
+    base_dir = params.getValue('file', 'base')
+    _update_hash_object(None, otype, params, differs, base_dir, controllers, files)
+
+    spec_file = params.getValue('_hit_filename') if '_hit_filename' in params else None
+    if (spec_file is not None) and os.path.isfile(spec_file):
+        files.add(spec_file)
+
+    for differ in differs or tuple():
+        d_type, d_params, _ = object_params(differ, controllers)
+        if issubclass(d_type, FileDiffer) and not d_params.isValid('file', 'goldnames'):
+            gold_dir = d_params.getValue('file', 'golddir')
+            for filename in Runner.filenames(differ):
+                d, f = os.path.split(filename)
+                filename = os.path.join(base_dir or '', d, gold_dir, f)
+                if os.path.isfile(filename):
+                    files.add(filename)
+
+    return set(os.path.abspath(f) for f in files)
+
+
+def object_params(obj, controllers=None):
+    """
+    Return the type, the `InputParameters`, and the attached `Differ` objects of the `Runner` or
+    `Differ` object in *obj*.
+
+    If *obj* is a `RunnerSpec`, the parameters are created with the `Controller` objects in
+    *controllers* without creating the object (see `RunnerSpec.parameters`) and the `RunnerSpec`
+    objects of the `Differ` objects are returned.
+    """
+    if isinstance(obj, RunnerSpec):
+        return obj.otype, obj.parameters(controllers), obj.differs or None
+    params = obj.parameters()
+    return type(obj), params, params.getValue('differs') if 'differs' in params else None
+
+
+def _update_hash(sha, value, base_dir, command=False, output=False, files=None, controllers=None):
+    """
+    Update the `hashlib` object in *sha* with the supplied parameter *value*.
+
+    If *command* is True, the value is from a 'command' parameter and items are also inspected for
+    executables on the system path. If *output* is True, the value is the name of a file created
+    during execution and the content is not included. If *files* is provided, the names of the
+    files included are added to the `set` and *sha* may be `None`. The *controllers* are used for
+    the parameters of a `RunnerSpec` (see `object_params`).
+
+    See `compute_key` and `referenced_files`.
+    """
+    if isinstance(value, (MooseObject, RunnerSpec)):
+        _update_hash_object(sha, *object_params(value, controllers), base_dir, controllers, files)
+
+    elif isinstance(value, InputParameters):
+        _update_hash_object(sha, None, value, None, base_dir, controllers, files)
+
+    elif isinstance(value, (tuple, list)):
+        for item in value:
+            _update_hash(sha, item, base_dir, command, output, files, controllers)
+
+    elif not isinstance(value, HASHED_TYPES):
+        # Other objects are identified by type, the `repr` may include the memory address
+        if sha is not None:
+            sha.update(f'{type(value).__module__}.{type(value).__qualname__}'.encode())
+
+    else:
+        if sha is not None:
+            sha.update(repr(value).encode())
+        if isinstance(value, str) and value and not output:
+            filename = os.path.join(base_dir, value) if base_dir else value
+            if not os.path.isfile(filename):
+                filename = shutil.which(value) if command else None
+            if filename is not None:
+                if sha is not None:
+                    _update_hash_with_file(sha, filename)
+                if files is not None:
+                    files.add(filename)
+
+
+def _update_hash_object(sha, otype, params, differs, base_dir, controllers=None, files=None):
+    """
+    Update the `hashlib` object in *sha* with the type *otype*, if provided, and the
+    `InputParameters` in *params*, as returned by `object_params`. The *differs* are used for the
+    'differs' parameter, if provided.
+
+    See `_update_hash` for the remaining arguments.
+    """
+    if (sha is not None) and (otype is not None):
+        sha.update(otype.__name__.encode())
+
+    for key, item in params.items():
+        if key == '_controllers':  # applied before the cache is used, see `moosetest.run`
+            continue
+        if sha is not None:
+            sha.update(key.encode())
+        if (key == 'differs') and (differs is not None):
+            item = differs
+        _update_hash(sha, item, base_dir, key == 'command', key == 'names', files, controllers)
+
+
+def _update_hash_with_file(sha, filename):
+    """
+    Update the `hashlib` object in *sha* with the content of *filename*.
+
+    Executable files are included by modification time and size, to avoid reading large binaries.
+    """
+    stat = os.stat(filename)
+    if os.access(filename, os.X_OK):
+        sha.update(f'{stat.st_mtime}:{stat.st_size}'.encode())
+    else:
+        sha.update(_file_digest(os.path.abspath(filename), stat.st_mtime, stat.st_size))
+
+
+@functools.lru_cache(maxsize=1024)
+def _file_digest(filename, mtime, size):
+    """
+    Return the hash of the content of *filename*.
+
+    The *mtime* and *size* are used to invalidate the memoized value when the file changes, which
+    avoids reading test specification files for each `Runner` object that it contains.
+    """
+    sha = hashlib.sha1()
+    with open(filename, 'rb') as fid:
+        for chunk in iter(lambda: fid.read(1 << 20), b''):
+            sha.update(chunk)
+    return sha.digest()
+
+
+def load_cache(filename):
+    """
+    Return a `dict` of hash keys (see `compute_key`) to last use time for `Runner` objects that
+    passed, as stored in the file *filename*.
+
+    An empty `dict` is returned if the file does not exist or cannot be read.
+    """
+    if (filename is None) or (not os.path.isfile(filename)):
+        return dict()
+
+    try:
+        with open(filename, 'r') as fid:
+            cache = json.load(fid)
+    except (OSError, ValueError):
+        logging.getLogger(__name__).warning("Failed to read the result cache '%s'.", filename)
+        return dict()
+
+    return cache if isinstance(cache, dict) else dict()
+
+
+def save_cache(filename, cache, max_size):
+    """
+    Write the *cache*, as returned by `load_cache`, to *filename*.
+
+    If the number of entries exceeds *max_size* the least recently used entries are removed.
+    """
+    if len(cache) > max_size:
+        keep = sorted(cache.items(), key=lambda item: item[1], reverse=True)[:max_size]
+        cache = dict(keep)
+
+    try:
+        mooseutils.atomic_write(filename, lambda fid: json.dump(cache, fid))
+    except OSError:
+        logging.getLogger(__name__).warning("Failed to write the result cache '%s'.", filename)
@@ -9,12 +9,17 @@
 
 import os
 import re
+import json
+import logging
 #import dataclasses # TODO: use when python 3.6 is dropped
 import typing
 from moosetools import mooseutils
 from moosetools.parameters import InputParameters
 from moosetools.moosetest.base import Controller
 
+# The parsed configuration files of the process, see `AutotoolsConfigController.loadConfig`
+_CONFIG_CACHE = dict()
+
 
 # TODO: Use this when python 3.6 is dropped
 #@dataclasses.dataclass
@@ -51,6 +56,12 @@ class AutotoolsConfigController(Controller):
                    verify=(AutotoolsConfigController.isFile,
                            "The supplied file name(s) must exist."),
                    doc="The file(s) to read for the current application configuration.")
+        params.add(
+            'cache_file',
+            vtype=str,
+            doc=
+            "File for storing the key/value pairs read from the 'config_files', which are read again only if modified."
+        )
         return params
 
     @staticmethod
@@ -70,10 +81,13 @@ class AutotoolsConfigController(Controller):
         return all(os.path.isfile(mooseutils.eval_path(f)) for f in config_files)
 
     @staticmethod
-    def loadConfig(filename):
+    def loadConfig(filename, cache_file=None):
         """
         Return a `dict` containing key/value pairs from supplied Autotools configure .h file.
 
+        The pairs are retained for the life of the process and, if provided, in the JSON file
+        *cache_file*. The file is read again only if the modification time or size changes.
+
         For example, the following has a key of "MOOSE_GLOBAL_AD_INDEXING" with a value of 1.
 
         ```c++
@@ -85,22 +99,44 @@ class AutotoolsConfigController(Controller):
         if not os.path.isfile(filename):
             raise IOError(f"The supplied file name, '{filename}', does not exist.")
 
+        key = os.path.abspath(filename)
+        stat = os.stat(key)
+        stamp = [stat.st_mtime_ns, stat.st_size]
+
+        entry = _CONFIG_CACHE.get(key)
+        if ((entry is None) or (entry['stamp'] != stamp)) and (cache_file is not None):
+            entry = _load_config_cache(cache_file).get(key)
+        if isinstance(entry, dict) and (entry.get('stamp') == stamp):
+            _CONFIG_CACHE[key] = entry
+            return dict(entry['items'])
+
         with open(filename, 'r') as fid:
             content = fid.read()
 
         output = dict()
         for match in AutotoolsConfigController.RE_DEFINE.finditer(content):
             output[match.group('key')] = match.group('value').strip(' \n"\'')
-        return output
+
+        _CONFIG_CACHE[key] = dict(stamp=stamp, items=output)
+        if cache_file is not None:
+            _save_config_cache(cache_file, key, _CONFIG_CACHE[key])
+        return dict(output)
 
     def __init__(self, *args, **kwargs):
         Controller.__init__(self, *args, **kwargs)
 
         # Build a map of configure options from the supplied files
+        cache_file = self.getParam('cache_file')
+        if cache_file is not None:
+            cache_file = mooseutils.eval_path(cache_file)
+
         self.__config_items = dict()
         for config_file in self.getParam('config_files') or set():
             self.__config_items.update(
-                AutotoolsConfigController.loadConfig(mooseutils.eval_path(config_file)))
+                AutotoolsConfigController.loadConfig(mooseutils.eval_path(config_file), cache_file))
+
+        # Map of parameter names to the values returned by `getConfigItem`
+        self.__mapped_items = dict()
 
     def getConfigItem(self, params, name):
         """
@@ -108,7 +144,14 @@ class AutotoolsConfigController(Controller):
 
         In general, this function should not be called. It is called automatically by the `execute`
         method of this object.
+
+        The values for each parameter are computed once and retained, because the lookup is repeated
+        for every object that this `Controller` is applied to.
         """
+        out = self.__mapped_items.get(name)
+        if out is not None:
+            return out
+
         item = params.getUserData(name)
         if item is None:
             raise RuntimeError(
@@ -122,7 +165,9 @@ class AutotoolsConfigController(Controller):
             msg = "The value of '{}' in the loaded file does not have a registered value in the mapping for '{}'. The available mapping values are: {}"
             raise RuntimeError(msg.format(name, raw_value, ', '.join(item.mapping.keys())))
 
-        return mapped_value, raw_value, item.key
+        out = (mapped_value, raw_value, item.key)
+        self.__mapped_items[name] = out
+        return out
 
     def checkConfig(self, params, param_name):
         """
@@ -151,3 +196,41 @@ class AutotoolsConfigController(Controller):
             user_data = params.getUserData(key)
             if isinstance(user_data, AutotoolsConfigItem):
                 self.checkConfig(params, key)
+
+
+def _load_config_cache(filename):
+    """
+    Return the `dict` of configuration file names to the entries stored in the JSON file *filename*
+    (see `AutotoolsConfigController.loadConfig`).
+
+    An empty `dict` is returned if the file does not exist or cannot be read.
+    """
+    if not os.path.isfile(filename):
+        return dict()
+
+    try:
+        with open(filename, 'r') as fid:
+            cache = json.load(fid)
+    except (OSError, ValueError):
+        logging.getLogger(__name__).warning("Failed to read the configuration cache '%s'.",
+                                            filename)
+        return dict()
+
+    return cache if isinstance(cache, dict) else dict()
+
+
+def _save_config_cache(filename, key, entry):
+    """
+    Update the *entry* for the configuration file *key* in the JSON file *filename*.
+
+    The entries for configuration files that no longer exist are removed.
+    """
+    cache = {k: v for k, v in _load_config_cache(filename).items() if os.path.isfile(k)}
+    cache[key] = entry
+
+    try:
+        mooseutils.atomic_write(filename,
+                                lambda fid: json.dump(cache, fid, indent=1, sort_keys=True))
+    except OSError:
+        logging.getLogger(__name__).warning("Failed to write the configuration cache '%s'.",
+                                            filename)
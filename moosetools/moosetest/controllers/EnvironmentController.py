@@ -10,13 +10,37 @@
 import io
 import platform
 import logging
+import functools
+import importlib.util
 #import mooseutils
 import packaging.version
-from moosetools import mooseutils
 from moosetools.parameters import InputParameters
 from moosetools.moosetest.base import Controller
 
 
+@functools.lru_cache(maxsize=None)
+def package_available(name):
+    """
+    Return `True` if the python package *name* can be imported, without importing it.
+
+    The result is retained for the life of the process. The `moosetest.run` function evaluates the
+    controllers in the calling process before the workers are created (see
+    `Controller.PRE_DISPATCH`), thus the workers inherit the results.
+    """
+    try:
+        return importlib.util.find_spec(name) is not None
+    except (ImportError, ValueError):
+        return False
+
+
+@functools.lru_cache(maxsize=None)
+def parse_version(version):
+    """
+    Return the `packaging.version.Version` for the *version* string, see `package_available`.
+    """
+    return packaging.version.parse(version)
+
+
 class EnvironmentController(Controller):
     """
     A controller to dictate if an object should run based on the environment.
@@ -67,8 +91,8 @@ class EnvironmentController(Controller):
 
         # Python min. version
         min_py_version = params.getValue('python_minimum_version')
-        if (min_py_version is not None) and (packaging.version.parse(min_py_version) >
-                                             packaging.version.parse(sys_py_version)):
+        if (min_py_version is not None) and \
+           (parse_version(min_py_version) > parse_version(sys_py_version)):
             self.skip('Python {} > {}', min_py_version, sys_py_version)
             self.debug(
                 "The system python version {} is less then the allowed minimum version of {}",
@@ -76,8 +100,8 @@ class EnvironmentController(Controller):
 
         # Python max. version
         max_py_version = params.getValue('python_maximum_version')
-        if (max_py_version is not None) and (packaging.version.parse(max_py_version) <
-                                             packaging.version.parse(sys_py_version)):
+        if (max_py_version is not None) and \
+           (parse_version(max_py_version) < parse_version(sys_py_version)):
             self.skip('Python {} < {}', max_py_version, sys_py_version)
             self.debug(
                 "The system python version {} is greater then the allowed maximum version of {}",
@@ -86,7 +110,7 @@ class EnvironmentController(Controller):
         # Check python packages
         py_packages = params.getValue('python_required_packages')
         if py_packages is not None:
-            missing = mooseutils.check_configuration(py_packages, message=False)
+            missing = [p for p in py_packages if not package_available(p)]
             if missing:
                 self.skip('missing python package(s)')
                 self.debug("Missing required python package(s): {}", ', '.join(missing))
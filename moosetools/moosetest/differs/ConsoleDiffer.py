@@ -7,13 +7,66 @@
 #* Licensed under LGPL 2.1, please see LICENSE for details
 #* https://www.gnu.org/licenses/lgpl-2.1.html
 
+import os
 import re
+import mmap
 from moosetools.moosetest.base import Differ
 
 
+def _contains(text, value):
+    """
+    Return True if *value* exists in the output *text*.
+
+    If *text* is a `moosetest.base.OutputText` with a file containing the complete output, the file
+    is searched as well. The file is memory mapped, thus it is never read into memory in full.
+    """
+    if value in text:
+        return True
+    with _MappedOutput(text) as buf:
+        return (buf is not None) and (buf.find(value.encode()) != -1)
+
+
+def _search(func, pattern, text, flags):
+    """
+    Return True if the regular expression function *func* (e.g., `re.search`) produces a match of
+    *pattern* in the output *text*, see `_contains`.
+    """
+    if func(pattern, text, flags=flags):
+        return True
+    with _MappedOutput(text) as buf:
+        return (buf is not None) and (func(pattern.encode(), buf, flags=flags & ~re.UNICODE)
+                                      is not None)
+
+
+class _MappedOutput(object):
+    """
+    A context object that provides a read-only memory map of the file with the complete output of
+    a `moosetest.base.OutputText`, or `None` if the file does not exist or is empty.
+    """
+    def __init__(self, text):
+        self._filename = getattr(text, 'filename', None)
+        self._fid = None
+        self._buf = None
+
+    def __enter__(self):
+        if (self._filename is not None) and os.path.isfile(self._filename) and \
+           (os.path.getsize(self._filename) > 0):
+            self._fid = open(self._filename, 'rb')
+            self._buf = mmap.mmap(self._fid.fileno(), 0, access=mmap.ACCESS_READ)
+        return self._buf
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if self._buf is not None:
+            self._buf.close()
+            self._fid.close()
+
+
 class ConsoleDiffer(Differ):
     """
     A tool for testing for the existence of text within `sys.stdour` and/or `sys.stderr`.
+
+    If the output supplied is a `moosetest.base.OutputText` that refers to a file with the complete
+    output (e.g., `RunCommand` with the 'max_output' parameter), the file is also inspected.
     """
     @staticmethod
     def validParams():
@@ -87,34 +140,36 @@ class ConsoleDiffer(Differ):
 
         # STDOUT/STDERR
         text_in = self.getParam('text_in')
-        if (text_in is not None) and (text_in not in stdout) and (text_in not in stderr):
+        if (text_in is not None) and (not _contains(stdout, text_in)) and \
+           (not _contains(stderr, text_in)):
             msg = "The content of 'text_in' parameter, '{}', was not located in the output of sys.stdout or sys.stderr:\n{}\n{}"
             self.error(msg, text_in, stdout, stderr)
 
         text_not_in = self.getParam('text_not_in')
-        if (text_not_in is not None) and ((text_not_in in stdout) or (text_not_in in stderr)):
+        if (text_not_in is not None) and \
+           (_contains(stdout, text_not_in) or _contains(stderr, text_not_in)):
             msg = "The content of 'text_not_in' parameter, '{}', was located in the output sys.stdout or sys.stderr:\n{}\n{}"
             self.error(msg, text_not_in, stdout, stderr)
 
         # STDOUT
         text_in = self.getParam('text_in_stdout')
-        if (text_in is not None) and (text_in not in stdout):
+        if (text_in is not None) and (not _contains(stdout, text_in)):
             msg = "The content of 'text_in_stdout' parameter, '{}', was not located in the output of sys.stdout:\n{}"
             self.error(msg, text_in, stdout)
 
         text_not_in = self.getParam('text_not_in_stdout')
-        if (text_not_in is not None) and (text_not_in in stdout):
+        if (text_not_in is not None) and _contains(stdout, text_not_in):
             msg = "The content of 'text_not_in_stdout' parameter, '{}', was located in the output of sys.stdout:\n{}"
             self.error(msg, text_not_in, stdout)
 
         # STDERR
         text_in = self.getParam('text_in_stderr')
-        if (text_in is not None) and (text_in not in stderr):
+        if (text_in is not None) and (not _contains(stderr, text_in)):
             msg = "The content of 'text_in_stderr' parameter, '{}', was not located in the output of sys.stderr:\n{}"
             self.error(msg, text_in, stderr)
 
         text_not_in = self.getParam('text_not_in_stderr')
-        if (text_not_in is not None) and (text_not_in in stderr):
+        if (text_not_in is not None) and _contains(stderr, text_not_in):
             msg = "The content of 'text_not_in_stderr' parameter, '{}', was located in the output of sys.stderr:\n{}"
             self.error(msg, text_not_in, stderr)
 
@@ -125,16 +180,16 @@ class ConsoleDiffer(Differ):
 
         re_match = self.getParam('re_match')
         if re_match is not None:
-            match = re.search(re_match, stdout, flags=flags) or re.match(
-                re_match, stderr, flags=flags)
+            match = _search(re.search, re_match, stdout, flags) or _search(
+                re.match, re_match, stderr, flags)
             if not match:
                 msg = "The regular expression of 're_match' parameter, '{}', did not produce a match in the output of sys.stdout or sys.stderr:\n{}\n{}"
                 self.error(msg, re_match, stdout, stderr)
 
         re_match = self.getParam('re_not_match')
         if re_match is not None:
-            match = re.search(re_match, stdout, flags=flags) or re.match(
-                re_match, stderr, flags=flags)
+            match = _search(re.search, re_match, stdout, flags) or _search(
+                re.match, re_match, stderr, flags)
             if match:
                 msg = "The regular expression of 're_not_match' parameter, '{}', did produce a match in the output of sys.stdout or sys.stderr:\n{}\n{}"
                 self.error(msg, re_match, stdout, stderr)
@@ -142,14 +197,14 @@ class ConsoleDiffer(Differ):
         # RE STDOUT
         re_match = self.getParam('re_match_stdout')
         if re_match is not None:
-            match = re.search(re_match, stdout, flags=flags)
+            match = _search(re.search, re_match, stdout, flags)
             if not match:
                 msg = "The regular expression of 're_match_stdout' parameter, '{}', did not produce a match in the output of sys.stdout:\n{}"
                 self.error(msg, re_match, stdout)
 
         re_match = self.getParam('re_not_match_stdout')
         if re_match is not None:
-            match = re.search(re_match, stdout, flags=flags)
+            match = _search(re.search, re_match, stdout, flags)
             if match:
                 msg = "The regular expression of 're_not_match_stdout' parameter, '{}', did produce a match in the output of sys.stdout:\n{}"
                 self.error(msg, re_match, stdout)
@@ -157,14 +212,14 @@ class ConsoleDiffer(Differ):
         # RE STDERR
         re_match = self.getParam('re_match_stderr')
         if re_match is not None:
-            match = re.search(re_match, stderr, flags=flags)
+            match = _search(re.search, re_match, stderr, flags)
             if not match:
                 msg = "The regular expression of 're_match_stderr' parameter, '{}', did not produce a match in the output of sys.stderr:\n{}"
                 self.error(msg, re_match, stderr)
 
         re_match = self.getParam('re_not_match_stderr')
         if re_match is not None:
-            match = re.search(re_match, stderr, flags=flags)
+            match = _search(re.search, re_match, stderr, flags)
             if match:
                 msg = "The regular expression of 're_not_match_stderr' parameter, '{}', did produce a match in the output of sys.stderr:\n{}"
                 self.error(msg, re_match, stdout)
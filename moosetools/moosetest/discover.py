@@ -8,16 +8,28 @@
 #* https://www.gnu.org/licenses/lgpl-2.1.html
 
 import os
+import re
+import fnmatch
+import multiprocessing
 import concurrent.futures
 from moosetools import moosetree
 from moosetools import pyhit
 from moosetools import factory
 from moosetools.moosetest.base import Controller, TestCase
-from moosetools.moosetest.base import Runner, Differ
+from moosetools.moosetest.base import Runner, Differ, RunnerSpec
+from moosetools.moosetest.run import MULTIPROCESSING_CONTEXT
+from moosetools.moosetest.speccache import factory_fingerprint, spec_key, load_spec, save_spec
+from moosetools.moosetest.speccache import prune_spec_cache
 
 # TODO:
 # - Perform factory.status() checks() and make sure error messages are usable
 
+# Directories that are not searched for test specification files, see `iter_spec_files`
+DEFAULT_IGNORE_PATTERNS = ('.git', '__pycache__')
+
+# The factory used by the worker processes of the `discover` function, see `_init_parse_process`
+_PARSE_FACTORY = None
+
 
 class MooseTestFactory(factory.Factory):
     """
@@ -39,26 +51,71 @@ class MooseTestFactory(factory.Factory):
         Creates the parameters with sub-parameters for each `Controller` object.
         """
         params = factory.Factory.params(self, *args, **kwargs)
+        MooseTestFactory.addControllerParams(params, self.getParam('controllers'))
+        return params
+
+    def create(self, otype, params):
+        MooseTestFactory.setDefaults(params)
+        return factory.Factory.create(self, otype, params)
 
+    @staticmethod
+    def addControllerParams(params, controllers):
+        """
+        Add the parameters for the `Controller` objects in *controllers* to the `InputParameters`
+        in *params*.
+        """
         # Add the controllers, this allows Runner objects to pragmatically add a Differ object
-        params.add('_controllers', default=self.getParam('controllers'), private=True)
+        params.add('_controllers', default=controllers, private=True)
 
         # Add the Controller object parameters with the correct prefix from the Controller object
-        for controller in self.getParam('controllers') or list():
+        for controller in controllers or list():
             params.add(
                 controller.getParam('prefix'),
                 default=controller.validObjectParams(),
                 doc="Parameters for determining execute state from the '{}' control object.".format(
                     type(controller).__name__))
-        return params
-
-    def create(self, otype, params):
 
+    @staticmethod
+    def setDefaults(params):
+        """
+        Set the default values of the `InputParameters` in *params* that depend on the test
+        specification file.
+        """
         # Set the "file_base", if not set, to location of HIT file that created the object
         if not params.isValid('file', 'base') and ('_hit_filename' in params):
-            params.setValue('file', 'base', os.path.dirname(params.getValue('_hit_filename')))
+            file_base = os.path.dirname(params.getValue('_hit_filename') or '')
+            if file_base:
+                params.setValue('file', 'base', file_base)
 
-        return factory.Factory.create(self, otype, params)
+    @staticmethod
+    def specParams(spec, controllers=None):
+        """
+        Return the `InputParameters` for the object defined by the `RunnerSpec` in *spec*, with
+        the `Controller` objects in *controllers*, as created by the factory.
+
+        The 'differs' parameter is not set, the `RunnerSpec` objects of the `Differ` objects are
+        available from *spec*.
+        """
+        params = spec.otype.validParams()
+        MooseTestFactory.addControllerParams(params, controllers)
+        params.add('_hit_path', default=spec.hit_path, private=True)
+        params.add('_hit_filename', default=spec.filename, private=True)
+        params.update(**spec.params)
+        MooseTestFactory.setDefaults(params)
+        return params
+
+    @staticmethod
+    def createFromSpec(spec, controllers=None):
+        """
+        Return the `Runner` or `Differ` object, with the attached `Differ` objects, defined by the
+        `RunnerSpec` in *spec* (see `specParams`).
+        """
+        params = MooseTestFactory.specParams(spec, controllers)
+        if spec.differs:
+            params.setValue(
+                'differs',
+                tuple(MooseTestFactory.createFromSpec(d, controllers) for d in spec.differs))
+        return spec.otype(params)
 
 
 class MooseTestWarehouse(factory.Warehouse):
@@ -97,23 +154,161 @@ class MooseTestWarehouse(factory.Warehouse):
             self.objects[-1].parameters().setValue('differs', tuple(differs))
 
         else:
-            base = obj.getParam('_hit_path').strip(os.sep)
-            prefix = self.getParam('specfile').replace(self.getParam('root_dir'), '').strip(os.sep)
-            obj.parameters().setValue('name', f"{prefix}:{base}")
+            name = MooseTestWarehouse.runnerName(self.getParam('root_dir'),
+                                                 self.getParam('specfile'),
+                                                 obj.getParam('_hit_path'))
+            obj.parameters().setValue('name', name)
             factory.Warehouse.append(self, obj)
 
         # Set the "file_base", if not set, to location of HIT file that created the object
-        if not obj.isParamValid('file', 'base') and ('_hit_filename' in obj.parameters()):
-            obj.parameters().setValue('file', 'base',
-                                      os.path.dirname(obj.getParam('_hit_filename')))
+        MooseTestFactory.setDefaults(obj.parameters())
 
         # Propagate construction errors of object
         if obj.status():
             msg = "The '{}' object produced error(s) during construction."
             self.critical(msg, obj.name())
 
+    @staticmethod
+    def runnerName(root_dir, specfile, hit_path):
+        """
+        Return the name of a `Runner` object defined in the block *hit_path* of the test
+        specification *specfile*, which is prefixed with the location of the file within *root_dir*
+        (e.g., "tests:Tests/runner").
+        """
+        prefix = specfile.replace(root_dir, '').strip(os.sep)
+        return f"{prefix}:{hit_path.strip(os.sep)}"
+
+
+class MooseTestSpecParser(factory.Parser):
+    """
+    Custom `Parser` that creates `RunnerSpec` objects in place of the `Runner` and `Differ` objects.
+
+    The records are created in the same manner as the objects created by the `Parser` and
+    `MooseTestWarehouse`: the parameter values are converted and checked against the parameters
+    from the `MooseTestFactory`, the name of the `Runner` is prefixed with the test specification
+    file, and the `Differ` objects are attached to the preceding `Runner`. The objects are created
+    by the `MooseTestFactory` (see `MooseTestFactory.createFromSpec`), thus errors that occur during
+    the construction of the objects are not reported until the objects are created (see
+    `TestCase.execute`).
+
+    This parser is used within the `_create_specs` function and is designed to operate on a per
+    specification file basis.
+    """
+    @staticmethod
+    def validParams():
+        params = factory.Parser.validParams()
+        params.add('root_dir',
+                   vtype=str,
+                   required=True,
+                   doc="The root directory for loading test specification files.")
+        return params
+
+    def _parseNode(self, filename, node):
+        """
+        Create a `RunnerSpec` for the supplied `pyhit.Node` in *node*, see `Parser._parseNode`.
+        """
+        otype = node.get('type', None)
+        if otype is None:
+            msg = "{}:{}\nMissing 'type' in block '{}'"
+            self.error(msg, filename, node.line(-1), node.fullpath)
+            return
+
+        params = self.factory.params(otype)
+        if params is None:
+            msg = "{}:{}\nFailed to extract parameters from '{}' object in block '{}'"
+            self.error(msg, filename, node.line(-1), otype, node.fullpath, stack_info=True)
+            return
+
+        # Retain the values supplied in the HIT node, after conversion to the correct type, and the
+        # default values that depend on the file
+        params.add('_hit_filename', default=filename, private=True)
+        self.setParameters(params, filename, node, otype)
+        MooseTestFactory.setDefaults(params)
+        values = {key: params.getValue(key) for key, _ in node.params() if key in params}
+        values.pop('type', None)
+        values['name'] = node.name
+        if params.isValid('file', 'base'):
+            values['file_base'] = params.getValue('file', 'base')
+
+        otype = self.factory._registered_types.get(otype)
+        specs = self.warehouse
+        if issubclass(otype, Differ):
+            if len(specs) == 0:
+                msg = "The `Differ` object '{}' is being added without the existence of a `Runner`, which is not supported."
+                self.critical(msg, node.name)
+                return
+            spec = RunnerSpec(otype, values, node.fullpath, filename, node.line(), tuple())
+            specs[-1] = specs[-1]._replace(differs=specs[-1].differs + (spec, ))
+
+        else:
+            values['name'] = MooseTestWarehouse.runnerName(self.getParam('root_dir'), filename,
+                                                           node.fullpath)
+            specs.append(RunnerSpec(otype, values, node.fullpath, filename, node.line(), tuple()))
+
 
-def _create_runners(root_dir, filename, spec_file_blocks, obj_factory):
+def select_blocks(root_dir, filename, nodes, obj_factory, pattern=None, tags=None):
+    """
+    Remove the HIT blocks that define `Runner` objects, within the `pyhit.Node` objects in *nodes*
+    from the test specification *filename*, that are not selected. Thus, the objects are never
+    created for the blocks that are not selected.
+
+    A block is selected if the name of the `Runner` (e.g., "tests:Tests/runner", see
+    `MooseTestWarehouse`) matches the regular expression *pattern* (see `re.search`) and the 'tags'
+    parameter of the block includes any of the *tags*, a `None` or empty value is not considered.
+    The blocks that a selected block depends upon are also selected, these are the blocks named in
+    the 'depends_on' parameter or, if the parameter is not supplied, the previous block (see
+    `moosetest.run`). The type of each block is used to identify the `Differ` blocks, which are
+    retained with the `Runner`.
+    """
+    if (pattern is None) and (not tags):
+        return
+
+    prefix = filename.replace(root_dir, '').strip(os.sep)
+    blocks = dict()  # name of the Runner to the pyhit.Node
+    for node in nodes:
+        for child in moosetree.findall(node, func=lambda n: 'type' in n):
+            otype = obj_factory._registered_types.get(child.get('type'))
+            if (otype is None) or (not issubclass(otype, Differ)):
+                blocks[f"{prefix}:{child.fullpath.strip(os.sep)}"] = child
+
+    selected = [
+        name for name, child in blocks.items() if _block_matches(name, child, pattern, tags)
+    ]
+    previous = dict(zip(list(blocks)[1:], blocks))
+    stack = list(selected)
+    selected = set(selected)
+    while stack:
+        current = stack.pop()
+        child = blocks[current]
+        if ('depends_on' not in child) and (current in previous):
+            deps = [previous[current]]
+        else:
+            deps = str(child.get('depends_on', '')).split()
+        for dep in deps:
+            for name in blocks:
+                if (name not in selected) and \
+                   ((name == dep) or name.endswith((f':{dep}', f'/{dep}'))):
+                    selected.add(name)
+                    stack.append(name)
+
+    for name, child in blocks.items():
+        if name not in selected:
+            child.remove()
+
+
+def _block_matches(name, node, pattern, tags):
+    """
+    Return True if the HIT block in the `pyhit.Node` *node*, for the `Runner` *name*, matches the
+    *pattern* and *tags*, see `select_blocks`.
+    """
+    if (pattern is not None) and (re.search(pattern, name) is None):
+        return False
+    if tags and not set(tags).intersection(str(node.get('tags', '')).split()):
+        return False
+    return True
+
+
+def _create_runners(root_dir, filename, spec_file_blocks, obj_factory, pattern=None, tags=None):
     """
     Return the `Runner` objects, with attached `Differ` objects, as defined in HIT file given in
     *filename*.
@@ -122,16 +317,19 @@ def _create_runners(root_dir, filename, spec_file_blocks, obj_factory):
     only extracted from the HIT blocks in *spec_file_blocks*. The *obj_factory* is used to by the
     HIT parser to create the desired object type.
 
-    TODO: This should return a list of lists and allow for each `Runner` to optionally, have a
-          separate entry in the outer list. This will allow handling of intra-file dependencies
-          if needed or the ability to run without any dependencies. For example, the `Runner`
-          could have a `depends_on`, that defaults to the previously defined runner. Supply `None`
-          would put it in its own entry in the outer list.
+    The `Runner` objects are returned as a single group, the dependencies within the group are
+    defined by the 'depends_on' parameter of each object and handled by the `moosetest.run`
+    function.
+
+    If *pattern* or *tags* are provided, only the selected blocks are parsed (see
+    `select_blocks`).
     """
     root = pyhit.load(filename)
     wh = MooseTestWarehouse(root_dir=root_dir, specfile=filename)
     parser = factory.Parser(obj_factory, wh)
-    for node in moosetree.findall(root, func=lambda n: n.name in spec_file_blocks):
+    nodes = list(moosetree.findall(root, func=lambda n: n.name in spec_file_blocks))
+    select_blocks(root_dir, filename, nodes, obj_factory, pattern, tags)
+    for node in nodes:
         parser.parse(
             filename,
             node,
@@ -139,12 +337,220 @@ def _create_runners(root_dir, filename, spec_file_blocks, obj_factory):
     return wh.objects, max(parser.status(), wh.status())
 
 
+def _create_specs(root_dir, filename, spec_file_blocks, obj_factory, pattern=None, tags=None):
+    """
+    Return the `RunnerSpec` objects, in place of the objects returned by `_create_runners`, as
+    defined in the HIT file given in *filename*.
+
+    The arguments are as defined for the `_create_runners` function.
+    """
+    root = pyhit.load(filename)
+    specs = list()
+    parser = MooseTestSpecParser(obj_factory, specs, root_dir=root_dir)
+    nodes = list(moosetree.findall(root, func=lambda n: n.name in spec_file_blocks))
+    select_blocks(root_dir, filename, nodes, obj_factory, pattern, tags)
+    for node in nodes:
+        parser.parse(filename, node)
+    return specs, parser.status()
+
+
+def _load_runners(root_dir,
+                  filename,
+                  spec_file_blocks,
+                  obj_factory,
+                  cache_dir,
+                  fingerprint,
+                  lazy=False,
+                  pattern=None,
+                  tags=None):
+    """
+    Return the `Runner` objects and status from `_create_runners`, or the `RunnerSpec` objects from
+    `_create_specs` if *lazy* is True, using the objects stored in *cache_dir* for the
+    *fingerprint* (see `moosetest.speccache`), if available.
+
+    The objects are stored only if no errors occurred. The cache is not used if the blocks are
+    limited by *pattern* or *tags* (see `select_blocks`).
+    """
+    create = _create_specs if lazy else _create_runners
+    if (cache_dir is None) or (pattern is not None) or tags:
+        return create(root_dir, filename, spec_file_blocks, obj_factory, pattern, tags)
+
+    key = spec_key(filename, root_dir, spec_file_blocks, fingerprint)
+    runners = load_spec(cache_dir, key) if key is not None else None
+    if runners is not None:
+        # The stored objects reference copies of the Controller objects, use the current objects
+        _set_controllers(runners, obj_factory.getParam('controllers'))
+        return runners, 0
+
+    runners, status = create(root_dir, filename, spec_file_blocks, obj_factory)
+    if (status == 0) and (key is not None):
+        save_spec(cache_dir, key, runners)
+    return runners, status
+
+
+def _set_controllers(runners, controllers):
+    """
+    Set the private '_controllers' parameter of the `Runner` objects in *runners*, and the attached
+    `Differ` objects, to the `Controller` objects in *controllers*.
+
+    The `RunnerSpec` objects are not altered, the `Controller` objects are supplied when the objects
+    are created.
+    """
+    for obj in runners + [d for r in runners for d in (r.getParam('differs') or tuple())]:
+        if (not isinstance(obj, RunnerSpec)) and ('_controllers' in obj.parameters()):
+            obj.parameters().setValue('_controllers', controllers)
+
+
+def _init_parse_process(obj_factory):
+    """
+    Store the *obj_factory* for use by `_parse_in_process` within a worker process, such that the
+    factory is loaded once per worker rather than for each file.
+    """
+    global _PARSE_FACTORY
+    _PARSE_FACTORY = obj_factory
+
+
+def _parse_in_process(root_dir,
+                      filename,
+                      spec_file_blocks,
+                      cache_dir,
+                      fingerprint,
+                      lazy=False,
+                      pattern=None,
+                      tags=None):
+    """
+    Return the `Runner` (or `RunnerSpec`) objects and status from `_load_runners` within a worker
+    process.
+
+    The '_controllers' parameter is removed from the objects, the `discover` function restores it
+    with the `Controller` objects of the calling process.
+    """
+    runners, status = _load_runners(root_dir, filename, spec_file_blocks, _PARSE_FACTORY, cache_dir,
+                                    fingerprint, lazy, pattern, tags)
+    _set_controllers(runners, None)
+    return runners, status
+
+
+def iter_spec_files(start,
+                    spec_file_names,
+                    ignore_patterns=DEFAULT_IGNORE_PATTERNS,
+                    prune_submodules=True,
+                    n_threads=None,
+                    directories=None):
+    """
+    Yield the test specification files, with a name in *spec_file_names*, within the *start*
+    directory as they are found.
+
+    The directories are read with `os.scandir` within a thread pool, with *n_threads* threads (see
+    `concurrent.futures.ThreadPoolExecutor`), thus the order of the files is not defined (see
+    `spec_file_order`). A directory is not searched if the name or the path relative to *start*
+    matches a pattern in *ignore_patterns* (see the python `fnmatch` module) or, if
+    *prune_submodules* is True, it contains a '.git' file or directory (i.e., it is a git
+    submodule or another repository). As with `os.walk`, symbolic links to directories are not
+    followed, so a link cannot cause a loop.
+
+    If *directories* is provided, a `dict`, the directories searched are added with the
+    modification time from prior to reading the directory (see `moosetest.watch.SpecWatcher`).
+    """
+    names = set(spec_file_names)
+    patterns = tuple(ignore_patterns or tuple())
+    with concurrent.futures.ThreadPoolExecutor(n_threads) as pool:
+        pending = {pool.submit(_scan_directory, start, start, names, patterns, prune_submodules)}
+        while pending:
+            done, pending = concurrent.futures.wait(pending,
+                                                    return_when=concurrent.futures.FIRST_COMPLETED)
+            for future in done:
+                path, mtime, files, dirs = future.result()
+                if directories is not None:
+                    directories[path] = mtime
+                yield from files
+                pending.update(
+                    pool.submit(_scan_directory, d, start, names, patterns, prune_submodules)
+                    for d in dirs)
+
+
+def find_spec_files(start, spec_file_names, **kwargs):
+    """
+    Return the test specification files, with a name in *spec_file_names*, within the *start*
+    directory in the order of `spec_file_order`.
+
+    The *kwargs* are passed to the `iter_spec_files` function.
+    """
+    return sorted(iter_spec_files(start, spec_file_names, **kwargs),
+                  key=lambda f: spec_file_order(start, f))
+
+
+def spec_file_order(start, filename):
+    """
+    Return a key for sorting test specification files within *start*, the files within a directory
+    are first followed by the files in the sub-directories in order of name (i.e., the top-down
+    order of `os.walk` with sorted directories).
+    """
+    directory, name = os.path.split(os.path.relpath(filename, start))
+    return (directory.split(os.sep) if directory else list()), name
+
+
+def _scan_directory(path, start, names, patterns, prune_submodules):
+    """
+    Return *path*, the modification time of *path*, the files in *path* with a name in *names*, and
+    the sub-directories to search.
+
+    See `iter_spec_files` for use.
+    """
+    files = list()
+    dirs = list()
+    mtime = None
+    try:
+        mtime = os.stat(path).st_mtime  # prior to reading, so later changes are detected
+        with os.scandir(path) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        rel = os.path.relpath(entry.path, start)
+                        if any(
+                                fnmatch.fnmatch(entry.name, p) or fnmatch.fnmatch(rel, p)
+                                for p in patterns):
+                            continue
+                        if prune_submodules and os.path.lexists(os.path.join(entry.path, '.git')):
+                            continue
+                        dirs.append(entry.path)
+                    elif (entry.name in names) and entry.is_file():
+                        files.append(entry.path)
+                except OSError:
+                    pass
+    except OSError:  # ignored, as done by `os.walk`
+        pass
+    return path, mtime, files, dirs
+
+
+def make_factory(plugin_dirs=None, controllers=None):
+    """
+    Return a `MooseTestFactory` for creating the `Runner` and `Differ` objects, with the types
+    loaded from the python paths and *plugin_dirs*, and the parameters of the `Controller` objects
+    in *controllers*.
+    """
+    obj_factory = MooseTestFactory(plugin_dirs=tuple(plugin_dirs or []),
+                                   plugin_types=(Runner, Differ),
+                                   controllers=tuple(controllers or []))
+    obj_factory.load()
+    return obj_factory
+
+
 def discover(start,
              spec_file_names,
              spec_file_blocks,
              plugin_dirs=None,
              controllers=None,
-             n_threads=None):
+             n_threads=None,
+             ignore_patterns=DEFAULT_IGNORE_PATTERNS,
+             prune_submodules=True,
+             cache_dir=None,
+             cache_size=1000,
+             processes=False,
+             lazy=False,
+             pattern=None,
+             tags=None,
+             paths=None):
     """
     Return groups of `Runner` objects to execute by recursively searching from the *start* directory.
 
@@ -157,24 +563,48 @@ def discover(start,
 
     The parsing of the files occurs within a thread pool, with the given number of threads provided
     in *n_threads*. If not provide the default is used from `concurrent.futures.ThreadPoolExecutor`.
+    The parsing of a file begins when it is found, while the search continues (see
+    `iter_spec_files`, which is passed *n_threads*, *ignore_patterns*, and *prune_submodules*). The
+    groups are returned in the order of `spec_file_order`.
+
+    If *cache_dir* is provided, the objects created from each file are stored in the directory
+    and, in subsequent calls, loaded rather than parsing the file again if the content of the file
+    and the available types are unchanged (see `moosetest.speccache`). The *cache_size* least
+    recently used entries are retained.
+
+    If *processes* is True, the files are parsed within a process pool, with *n_threads* processes,
+    rather than a thread pool. The parsing is then not limited by the global interpreter lock,
+    which benefits a large number of specification files. The factory is loaded once for each
+    process and the created objects are returned to the calling process. The search completes
+    before the process pool is created, because forking while the threads of the search are
+    running may deadlock the child processes.
+
+    If *lazy* is True, `RunnerSpec` objects are returned in place of the `Runner` objects (see
+    `MooseTestSpecParser`). The objects are then created by the `TestCase` that executes them,
+    within the worker processes of the `moosetest.run` function, which reduces the memory of the
+    calling process and the data sent to the workers for a large number of test cases.
+
+    The test cases may be limited, prior to the creation of the objects, to the files within the
+    directories or the files in *paths* and to the HIT blocks that match the regular expression
+    *pattern* and the *tags* (see `select_blocks`).
     """
-    # Create a list of files
-    spec_files = list()
-    for root, _, files in os.walk(start):
-        spec_files += [os.path.join(root, f) for f in files if f in spec_file_names]
-
     # Factory for creating the test objects
-    obj_factory = MooseTestFactory(plugin_dirs=tuple(plugin_dirs),
-                                   plugin_types=(Runner, Differ),
-                                   controllers=tuple(controllers or []))
-    obj_factory.load()
-
-    # Build the objects for each file
-    with concurrent.futures.ThreadPoolExecutor(n_threads) as pool:
-        futures = [
-            pool.submit(_create_runners, start, filename, spec_file_blocks, obj_factory)
-            for filename in spec_files
-        ]
+    obj_factory = make_factory(plugin_dirs, controllers)
+    fingerprint = cache_fingerprint(obj_factory, plugin_dirs, controllers, cache_dir, lazy)
+
+    # Build the objects for each file, as the files are found
+    spec_files = iter_spec_files(start,
+                                 spec_file_names,
+                                 ignore_patterns=ignore_patterns,
+                                 prune_submodules=prune_submodules,
+                                 n_threads=n_threads)
+    if paths:
+        spec_files = filter(lambda f: _in_paths(f, paths), spec_files)
+    futures = parse_spec_files(start, spec_files, spec_file_blocks, obj_factory, n_threads,
+                               cache_dir, fingerprint, processes, lazy, pattern, tags)
+    futures = [futures[f] for f in sorted(futures, key=lambda f: spec_file_order(start, f))]
+    if cache_dir is not None:
+        prune_spec_cache(cache_dir, cache_size)
 
     # Raise an exception if an error occurred during parsing
     if any(f.result()[1] for f in futures):
@@ -183,3 +613,75 @@ def discover(start,
         )
 
     return [f.result()[0] for f in futures]
+
+
+def cache_fingerprint(obj_factory, plugin_dirs=None, controllers=None, cache_dir=None, lazy=False):
+    """
+    Return the fingerprint of the objects stored in *cache_dir* by `_load_runners` (see
+    `moosetest.speccache.factory_fingerprint`), or `None` if *cache_dir* is not provided.
+    """
+    if cache_dir is None:
+        return None
+    fingerprint = factory_fingerprint(obj_factory, plugin_dirs, controllers)
+    if lazy:
+        fingerprint += ':lazy'  # the RunnerSpec and Runner objects are stored separately
+    return fingerprint
+
+
+def parse_spec_files(root_dir,
+                     spec_files,
+                     spec_file_blocks,
+                     obj_factory,
+                     n_threads=None,
+                     cache_dir=None,
+                     fingerprint=None,
+                     processes=False,
+                     lazy=False,
+                     pattern=None,
+                     tags=None):
+    """
+    Return a `dict` of the test specification files in *spec_files* to a
+    `concurrent.futures.Future` of the objects and status from `_load_runners`.
+
+    The parsing of a file is submitted to a thread pool, or a process pool if *processes* is True,
+    as it is supplied, thus *spec_files* may be a generator (e.g., `iter_spec_files`). The pool is
+    complete when the `dict` is returned. Refer to the `discover` function for the arguments.
+    """
+    if processes:
+        # Forking while the threads of `iter_spec_files` are running may deadlock the processes
+        spec_files = list(spec_files)
+        ctx = multiprocessing.get_context(MULTIPROCESSING_CONTEXT)
+        pool = concurrent.futures.ProcessPoolExecutor(n_threads,
+                                                      mp_context=ctx,
+                                                      initializer=_init_parse_process,
+                                                      initargs=(obj_factory, ))
+        func, args = _parse_in_process, tuple()
+    else:
+        pool = concurrent.futures.ThreadPoolExecutor(n_threads)
+        func, args = _load_runners, (obj_factory, )
+
+    with pool:
+        futures = {
+            filename: pool.submit(func, root_dir, filename, spec_file_blocks, *args, cache_dir,
+                                  fingerprint, lazy, pattern, tags)
+            for filename in spec_files
+        }
+
+    if processes:
+        for future in futures.values():
+            if future.exception() is None:
+                _set_controllers(future.result()[0], obj_factory.getParam('controllers'))
+    return futures
+
+
+def _in_paths(filename, paths):
+    """
+    Return True if the test specification *filename* is one of, or within a directory of, the
+    *paths*, see `discover`.
+    """
+    filename = os.path.abspath(filename)
+    for path in paths:
+        path = os.path.abspath(path)
+        if (filename == path) or filename.startswith(path.rstrip(os.sep) + os.sep):
+            return True
+    return False
@@ -0,0 +1,462 @@
+#* This file is part of MOOSETOOLS repository
+#* https://www.github.com/idaholab/moosetools
+#*
+#* All rights reserved, see COPYRIGHT for full restrictions
+#* https://github.com/idaholab/moosetools/blob/main/COPYRIGHT
+#*
+#* Licensed under LGPL 2.1, please see LICENSE for details
+#* https://www.gnu.org/licenses/lgpl-2.1.html
+import os
+import time
+import shutil
+import tempfile
+import logging
+import threading
+import functools
+import itertools
+import collections
+import concurrent.futures
+import multiprocessing
+from multiprocessing.connection import Listener, Client
+from moosetools.moosetest.base import TestCase
+from moosetools.moosetest.base.Runner import OUTPUT_DIR_VARIABLE, RETAIN_DIR_VARIABLE
+
+# Interval (in seconds) between messages sent by an agent to indicate that it is alive
+HEARTBEAT_INTERVAL = 2
+
+# Time (in seconds) without a message from an agent before it is considered lost
+HEARTBEAT_TIMEOUT = 30
+
+
+def parse_address(address):
+    """
+    Return the `tuple` (host, port) from the 'host:port' string in *address*.
+
+    If the host is omitted (e.g., ':8642' or '8642'), 'localhost' is used.
+    """
+    host, sep, port = address.rpartition(':')
+    if not port.isdigit():
+        raise ValueError(f"The address '{address}' must be in the form 'host:port'.")
+    return host or 'localhost', int(port)
+
+
+def check_authkey(authkey):
+    """
+    Raise an exception if the *authkey* for the connections between the coordinator and the agents
+    is not provided.
+
+    The messages are pickled objects, thus an agent that accepts unauthenticated connections would
+    allow anyone able to reach it to execute arbitrary code.
+    """
+    if not authkey:
+        raise RuntimeError("An authentication key is required for the connections between the " \
+                           "coordinator and the worker agents (see MOOSETEST_AUTHKEY).")
+
+
+def serve(address, n_threads=os.cpu_count(), authkey=None):
+    """
+    Listen on *address* ('host:port') for a coordinator and execute the groups of `TestCase` objects
+    that it sends, using a process pool with *n_threads* workers. The *authkey* (`bytes`) is
+    required, see `check_authkey`.
+
+    A single coordinator is served at a time, when it disconnects the agent waits for the next one.
+    This function does not return, the agent is stopped by terminating the process.
+
+    !alert warning title=Trusted networks only
+    The messages between the coordinator and the agent are pickled objects, which allows arbitrary
+    code execution. The same *authkey* should be supplied to the agents and the coordinator (see
+    `RemoteExecutor`) and the agents should only listen on trusted networks.
+    """
+    check_authkey(authkey)
+    log = logging.getLogger(__name__)
+    with Listener(parse_address(address), authkey=authkey) as listener:
+        log.info("Listening for a coordinator on %s:%s.", *listener.address)
+        while True:
+            try:
+                conn = listener.accept()
+            except (multiprocessing.AuthenticationError, OSError) as ex:
+                log.warning("Failed to accept a connection: %s", ex)
+                continue
+
+            with conn:
+                _serve_connection(conn, n_threads)
+
+
+def _serve_connection(conn, n_threads):
+    """
+    Execute the groups sent by the coordinator on the connection *conn* until it is closed.
+
+    The progress and results of the `TestCase` objects are collected from the process pool through
+    a single queue and forwarded to the coordinator by a thread, followed by a message indicating
+    that the group is complete.
+
+    The temporary output files of the `Runner` objects are written to a directory that is removed
+    when the coordinator disconnects, in the same fashion as the `run` function. The files are not
+    retained, since the coordinator cannot access them, thus the results do not refer to the files.
+
+    See the `serve` function for use.
+    """
+    # Import here to avoid a circular import, `run` uses this module for the coordinator
+    from moosetools.moosetest.run import MULTIPROCESSING_CONTEXT
+
+    # Set before the process pool is created, such that the workers inherit the environment
+    temp_dir = tempfile.mkdtemp(prefix='moosetest_')
+    previous_environ = {n: os.environ.get(n) for n in (OUTPUT_DIR_VARIABLE, RETAIN_DIR_VARIABLE)}
+    os.environ[OUTPUT_DIR_VARIABLE] = temp_dir
+    os.environ.pop(RETAIN_DIR_VARIABLE, None)
+
+    ctx = multiprocessing.get_context(MULTIPROCESSING_CONTEXT)
+    manager = ctx.Manager()
+    local_queue = manager.Queue()
+    executor = concurrent.futures.ProcessPoolExecutor(mp_context=ctx, max_workers=n_threads)
+    lock = threading.Lock()
+    stop = threading.Event()
+
+    def send(message):
+        with lock:
+            conn.send(message)
+
+    def forward():
+        while True:
+            message = local_queue.get()
+            if message is None:
+                return
+            try:
+                send(message)
+            except OSError:  # coordinator is gone, continue to empty the queue
+                pass
+
+    def heartbeat():
+        while not stop.wait(HEARTBEAT_INTERVAL):
+            try:
+                send(('heartbeat', ))
+            except OSError:
+                return
+
+    send(('ready', n_threads))
+    threads = [threading.Thread(target=forward), threading.Thread(target=heartbeat, daemon=True)]
+    for thread in threads:
+        thread.start()
+
+    futures = list()
+    try:
+        while True:
+            message = conn.recv()
+            if message[0] == 'close':
+                break
+            _, job_id, fn, testcases, args = message
+            future = executor.submit(fn, testcases, _JobQueue(local_queue, job_id), *args)
+            future.add_done_callback(functools.partial(_job_done, local_queue, job_id))
+            futures.append(future)
+    except (EOFError, OSError):
+        logging.getLogger(__name__).warning("The connection to the coordinator was lost.")
+
+    # Running groups are allowed to complete, in the same fashion as the `run` function
+    for future in futures:
+        future.cancel()
+    executor.shutdown()
+    local_queue.put(None)
+    stop.set()
+    for thread in threads:
+        thread.join()
+    manager.shutdown()
+
+    shutil.rmtree(temp_dir, ignore_errors=True)
+    for name, value in previous_environ.items():
+        if value is None:
+            os.environ.pop(name, None)
+        else:
+            os.environ[name] = value
+
+
+def _job_done(local_queue, job_id, future):
+    """
+    Add the message indicating that the group with *job_id* is complete to *local_queue*.
+
+    This is called when the *future* is done, after all messages from the group were added to the
+    queue, thus it is always forwarded to the coordinator after the messages of the group.
+    """
+    exc = None if future.cancelled() else future.exception()
+    local_queue.put(('done', job_id, exc))
+
+
+class _JobQueue(object):
+    """
+    Queue supplied to the function executing a group on an agent, the messages are tagged with the
+    *job_id* and added to the *local_queue* for forwarding to the coordinator.
+    """
+    def __init__(self, local_queue, job_id):
+        self._queue = local_queue
+        self._job_id = job_id
+
+    def put(self, message):
+        self._queue.put(('message', self._job_id, message))
+
+
+class _Worker(object):
+    """
+    State of an agent connected to a `RemoteExecutor`.
+    """
+    def __init__(self, address, conn, n_threads):
+        self.address = address
+        self.conn = conn
+        self.n_threads = n_threads
+        self.alive = True
+        self.jobs = dict()  # job_id to _Job in-flight on the agent
+        self.thread = None
+
+    def available(self):
+        """Return the number of slots of the agent that are not used by the in-flight groups."""
+        return self.n_threads - sum(min(job.slots, self.n_threads) for job in self.jobs.values())
+
+
+class _Job(object):
+    """
+    A group of `TestCase` objects submitted to a `RemoteExecutor`.
+    """
+    def __init__(self, job_id, future, fn, testcases, result_send, args):
+        self.job_id = job_id
+        self.future = future
+        self.fn = fn
+        self.testcases = testcases
+        self.slots = max((tc.runner.getSlots() for tc in testcases), default=1)
+        self.result_send = result_send
+        self.args = args
+        self.started = False
+        self.finished = dict()  # unique_id to state of the finished TestCase objects
+
+    def remaining(self):
+        """Return the `TestCase` objects that have not reported as finished."""
+        return [tc for tc in self.testcases if tc.unique_id not in self.finished]
+
+
+class RemoteExecutor(object):
+    """
+    An executor, with the interface used by the `run` function from
+    `concurrent.futures.ProcessPoolExecutor`, that executes groups with the agents at the
+    'host:port' *addresses* (see `serve`).
+
+    The function submitted is called on an agent as `fn(testcases, result_send, *args)`, where the
+    *result_send* is replaced with a queue that forwards the messages, which must be in the form
+    sent by `moosetest.run._execute_testcases`, to the queue supplied on the coordinator.
+
+    Each agent is given groups such that the slots required (see `Runner.getSlots`) do not exceed
+    the number of workers it reports, in the same fashion as the `run` function does for the local
+    process pool: a group that does not fit is passed over for later groups that do and a group that
+    requires more than the number of workers is executed alone. If an agent disconnects, the
+    groups in-flight on the agent are submitted again to the remaining agents without the `TestCase`
+    objects that finished. If an agent does not send a message within *heartbeat_timeout* seconds,
+    it may still be executing the groups (e.g., the network stalled), so the `TestCase` objects that
+    did not finish are reported as FATAL rather than executed again.
+
+    The *authkey* (`bytes`) is required, see `check_authkey`.
+    """
+    def __init__(self,
+                 addresses,
+                 authkey=None,
+                 connect_timeout=10,
+                 heartbeat_timeout=HEARTBEAT_TIMEOUT):
+        check_authkey(authkey)
+        self._lock = threading.RLock()
+        self._pending = collections.deque()
+        self._count = itertools.count()
+        self._heartbeat_timeout = heartbeat_timeout
+        self._closed = False
+
+        self._workers = list()
+        for address in addresses:
+            conn = _connect(address, authkey, connect_timeout)
+            _, n_threads = conn.recv()
+            self._workers.append(_Worker(address, conn, n_threads))
+
+        for worker in self._workers:
+            worker.thread = threading.Thread(target=self._receive, args=(worker, ), daemon=True)
+            worker.thread.start()
+
+    def submit(self, fn, testcases, result_send, *args):
+        """
+        Submit the `TestCase` objects in *testcases* for execution by *fn* and return a
+        `concurrent.futures.Future` object.
+        """
+        future = concurrent.futures.Future()
+        with self._lock:
+            job = _Job(next(self._count), future, fn, list(testcases), result_send, args)
+            self._pending.append(job)
+            self._dispatch()
+        return future
+
+    def shutdown(self, wait=True):
+        """
+        Disconnect from the agents, if *wait* is True this waits for the agents to complete the
+        groups that are running.
+        """
+        with self._lock:
+            self._closed = True
+            for job in self._pending:
+                job.future.cancel()
+            self._pending.clear()
+            for worker in filter(lambda w: w.alive, self._workers):
+                try:
+                    worker.conn.send(('close', ))
+                except OSError:
+                    pass
+
+        if wait:
+            for worker in self._workers:
+                worker.thread.join()
+        for worker in self._workers:
+            worker.conn.close()
+
+    def _dispatch(self):
+        """
+        Send pending groups to the agents with available slots, the lock must be held.
+        """
+        index = 0
+        while index < len(self._pending):
+            alive = [w for w in self._workers if w.alive and (w.available() > 0)]
+            if not alive:
+                break
+
+            job = self._pending[index]
+            fits = [w for w in alive if w.available() >= min(job.slots, w.n_threads)]
+            if not fits:
+                index += 1
+                continue
+
+            del self._pending[index]
+            if (not job.started) and (not job.future.set_running_or_notify_cancel()):
+                continue
+            job.started = True
+
+            # The job is stored before sending, the agent may reply before the send returns
+            worker = max(fits, key=lambda w: w.available() / w.n_threads)
+            worker.jobs[job.job_id] = job
+            try:
+                worker.conn.send(('submit', job.job_id, job.fn, job.remaining(), job.args))
+            except OSError:
+                worker.jobs.pop(job.job_id)
+                worker.alive = False
+                self._pending.insert(index, job)
+                continue
+            except Exception as ex:
+                worker.jobs.pop(job.job_id)
+                job.future.set_exception(ex)
+                continue
+
+        if self._pending and not any(w.alive for w in self._workers):
+            msg = "The connection to all of the workers was lost."
+            while self._pending:
+                job = self._pending.popleft()
+                if job.started or job.future.set_running_or_notify_cancel():
+                    job.future.set_exception(RuntimeError(msg))
+
+    def _receive(self, worker):
+        """
+        Function for a thread receiving the messages from the agent in *worker*.
+        """
+        conn = worker.conn
+        lost = False  # the agent closed the connection, otherwise it stopped responding
+        try:
+            while conn.poll(self._heartbeat_timeout):
+                message = conn.recv()
+                if message[0] == 'message':
+                    with self._lock:
+                        job = worker.jobs.get(message[1])
+                    if job is not None:
+                        unique_id, progress, state, _ = message[2]
+                        if progress == TestCase.Progress.FINISHED:
+                            job.finished[unique_id] = state
+                        job.result_send.put(message[2])
+
+                elif message[0] == 'done':
+                    with self._lock:
+                        job = worker.jobs.pop(message[1], None)
+                        self._dispatch()
+                    if job is not None:
+                        if message[2] is None:
+                            job.future.set_result(None)
+                        else:
+                            job.future.set_exception(message[2])
+        except (EOFError, OSError):
+            lost = True
+
+        with self._lock:
+            worker.alive = False
+            if not self._closed:
+                conn.close()
+                if lost:
+                    self._requeue(worker)
+                else:
+                    self._abandon(worker)
+                self._dispatch()
+
+    def _requeue(self, worker):
+        """
+        Submit the groups in-flight on the lost agent in *worker* again, the lock must be held.
+        """
+        logging.getLogger(__name__).warning(
+            "The connection to the worker '%s' was lost, %d group(s) will be executed again.",
+            worker.address, len(worker.jobs))
+
+        for job in worker.jobs.values():
+            remaining = job.remaining()
+            failed = [
+                tc for tc in job.testcases
+                if (tc.unique_id in job.finished) and (job.finished[tc.unique_id].level > 0)
+            ]
+            if remaining and failed:  # the agent did not report the skipped TestCase objects
+                msg = f"A previous test case ({failed[-1].name()}) in the group returned a non-zero state of {job.finished[failed[-1].unique_id]}."
+                for tc in remaining:
+                    results = {
+                        tc.name(): TestCase.Data(TestCase.Result.SKIP, None, '', msg,
+                                                 ['dependency'])
+                    }
+                    job.result_send.put(
+                        (tc.unique_id, TestCase.Progress.FINISHED, TestCase.Result.SKIP, results))
+                remaining = list()
+
+            if remaining:
+                self._pending.appendleft(job)
+            else:
+                job.future.set_result(None)
+        worker.jobs.clear()
+
+    def _abandon(self, worker):
+        """
+        Report the `TestCase` objects in-flight on the unresponsive agent in *worker* as FATAL, the
+        lock must be held.
+
+        The agent may still be executing these, thus executing them again could result in the same
+        `TestCase` executing twice at once. The connection is closed, so any later messages from the
+        agent are not received.
+        """
+        msg = f"The worker '{worker.address}' did not respond within {self._heartbeat_timeout} " \
+              "seconds, the test case is not executed again because the worker may still be " \
+              "executing it."
+        logging.getLogger(__name__).warning(msg)
+
+        for job in worker.jobs.values():
+            for tc in job.remaining():
+                results = {
+                    tc.name(): TestCase.Data(TestCase.Result.FATAL, None, '', msg, ['worker lost'])
+                }
+                job.result_send.put(
+                    (tc.unique_id, TestCase.Progress.FINISHED, TestCase.Result.FATAL, results))
+            job.future.set_result(None)
+        worker.jobs.clear()
+
+
+def _connect(address, authkey, timeout):
+    """
+    Return a connection to the agent at *address*, retrying for *timeout* seconds to allow for
+    agents that are starting.
+    """
+    end = time.time() + timeout
+    while True:
+        try:
+            return Client(parse_address(address), authkey=authkey)
+        except ConnectionRefusedError:
+            if time.time() > end:
+                msg = f"Unable to connect to the worker at '{address}'."
+                raise RuntimeError(msg) from None
+            time.sleep(0.1)
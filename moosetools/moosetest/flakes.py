@@ -0,0 +1,90 @@
+#* This file is part of MOOSETOOLS repository
+#* https://www.github.com/idaholab/moosetools
+#*
+#* All rights reserved, see COPYRIGHT for full restrictions
+#* https://github.com/idaholab/moosetools/blob/main/COPYRIGHT
+#*
+#* Licensed under LGPL 2.1, please see LICENSE for details
+#* https://www.gnu.org/licenses/lgpl-2.1.html
+
+import os
+import json
+import logging
+from moosetools import mooseutils
+from moosetools.moosetest.base import TestCase
+
+# Test cases with a flake rate at or above this value are executed before the others
+FLAKY_RATE = 0.05
+
+
+def load_flakes(filename):
+    """
+    Return a `dict` of test case names to a `dict` with the number of 'runs' and 'flakes' from the
+    flake database *filename*.
+
+    An empty `dict` is returned if the file does not exist or cannot be read.
+    """
+    if (filename is None) or (not os.path.isfile(filename)):
+        return dict()
+
+    try:
+        with open(filename, 'r') as fid:
+            flakes = json.load(fid)
+    except (OSError, ValueError):
+        logging.getLogger(__name__).warning("Failed to read the flake database '%s'.", filename)
+        return dict()
+
+    return flakes if isinstance(flakes, dict) else dict()
+
+
+def save_flakes(filename, testcases, flakes=None):
+    """
+    Update the flake database *filename* with the finished `TestCase` objects in *testcases*.
+
+    A test case that passed after more than one attempt (see `TestCase.Data.attempts`) is counted as
+    a flake, a test case that failed every attempt is not. The existing counts in *flakes*, as
+    returned by `load_flakes`, are retained for test cases that did not execute. Skipped test cases
+    are not recorded.
+    """
+    flakes = {name: dict(item) for name, item in (flakes or dict()).items()}
+    for tc in testcases:
+        if tc.finished and (tc.state is not None) and (tc.state != TestCase.Result.SKIP):
+            item = flakes.setdefault(tc.name(), dict(runs=0, flakes=0))
+            item['runs'] += 1
+            item['flakes'] += int((tc.state == TestCase.Result.PASS) and (attempts(tc) > 1))
+
+    try:
+        mooseutils.atomic_write(filename,
+                                lambda fid: json.dump(flakes, fid, indent=1, sort_keys=True))
+    except OSError:
+        logging.getLogger(__name__).warning("Failed to write the flake database '%s'.", filename)
+
+
+def attempts(tc):
+    """
+    Return the number of times that the finished `TestCase` in *tc* was executed.
+    """
+    data = (tc.results or dict()).get(tc.name())
+    return (data.attempts if data is not None else None) or 1
+
+
+def flake_rate(name, flakes):
+    """
+    Return the fraction of the recorded runs of the test case *name* in *flakes* that were flakes.
+    """
+    item = flakes.get(name)
+    if not item or not item.get('runs'):
+        return 0.
+    return item.get('flakes', 0) / item['runs']
+
+
+def sort_flaky(groups, flakes):
+    """
+    Return the *groups* of `Runner` objects with the groups that contain a test case with a flake
+    rate of at least `FLAKY_RATE` first, the supplied order is otherwise retained.
+
+    Executing these groups early keeps a repeated execution from extending the end of the run.
+    """
+    return sorted(
+        groups,
+        key=lambda runners: not any(flake_rate(r.name(), flakes) >= FLAKY_RATE for r in runners))
@@ -70,6 +70,34 @@ def shorten_text(text, max_lines=10, mode=ShortenMode.MIDDLE, replace='...'):
                                           replace=replace)
 
 
+def format_bytes(value):
+    """
+    Return a human readable string of the number of bytes in *value* (e.g., '1.5 MB').
+    """
+    for unit in ('B', 'KB', 'MB', 'GB'):
+        if value < 1024:
+            break
+        value /= 1024
+    else:
+        unit = 'TB'
+    return f"{value:.0f} {unit}" if unit == 'B' else f"{value:.1f} {unit}"
+
+
+def format_resources(resources):
+    """
+    Return a single line summary of the *resources* `dict`, as stored in `TestCase.Data`.
+    """
+    out = list()
+    if resources.get('max_rss') is not None:
+        out.append(f"max RSS {format_bytes(resources['max_rss'])}")
+    if 'user_time' in resources:
+        out.append(f"CPU {resources['user_time']:.2f}s user {resources['sys_time']:.2f}s sys")
+    if 'read_bytes' in resources:
+        out.append(f"I/O {format_bytes(resources['read_bytes'])} read " \
+                   f"{format_bytes(resources['write_bytes'])} written")
+    return ', '.join(out)
+
+
 class BasicFormatter(Formatter):
     """
     The default `Formatter` for reporting progress and results of test cases.
@@ -96,6 +124,18 @@ class BasicFormatter(Formatter):
                    default=5,
                    vtype=int,
                    doc="Print the given number of the longest running test cases.")
+        params.add('print_largest_memory_tests',
+                   default=0,
+                   vtype=int,
+                   doc="Print the given number of test cases with the largest peak memory.")
+        params.add('print_most_cpu_tests',
+                   default=0,
+                   vtype=int,
+                   doc="Print the given number of test cases with the most CPU time.")
+        params.add('print_resources',
+                   default=False,
+                   vtype=bool,
+                   doc="Include the resource usage (memory, CPU time, and I/O) in result output.")
         return params
 
     def __init__(self, *args, **kwargs):
@@ -199,6 +239,38 @@ class BasicFormatter(Formatter):
                 if shown > longest:
                     break
 
+        # Test cases executed more than once, see the 'max_retries' parameter of the Runner
+        retried = list()
+        for tc in complete:
+            data = tc.results.get(tc.name()) if tc.results else None
+            if (data is not None) and ((data.attempts or 1) > 1):
+                retried.append((tc, data.attempts))
+        if retried:
+            out.append('\nRetried test(s):')
+            for tc, attempts in retried:
+                out.append(f'  {attempts} attempts {tc.state.text} {tc.name()}')
+
+        # Largest resource usage, for the test cases with usage reported by the Runner
+        usage = list()
+        for tc in complete:
+            data = tc.results.get(tc.name()) if tc.results else None
+            if (data is not None) and data.resources:
+                usage.append((tc, data.resources))
+
+        largest = self.getParam('print_largest_memory_tests')
+        memory = [(tc, r['max_rss']) for tc, r in usage if r.get('max_rss') is not None]
+        if (largest is not None) and (largest > 0) and memory:
+            out.append('\nLargest memory test(s):')
+            for tc, value in sorted(memory, key=lambda x: x[1], reverse=True)[:largest]:
+                out.append(f'  {format_bytes(value)} {tc.name()}')
+
+        most = self.getParam('print_most_cpu_tests')
+        cpu = [(tc, r['user_time'] + r['sys_time']) for tc, r in usage if 'user_time' in r]
+        if (most is not None) and (most > 0) and cpu:
+            out.append('\nMost CPU time test(s):')
+            for tc, value in sorted(cpu, key=lambda x: x[1], reverse=True)[:most]:
+                out.append(f'  {value:.2f}s {tc.name()}')
+
         return '\n'.join(out)
 
     def _formatState(self, **kwargs):
@@ -256,4 +328,9 @@ class BasicFormatter(Formatter):
                 stderr = textwrap.indent(self.shortenLines(kwargs.get('stderr')), prefix,
                                          lambda *args: True)
 
-            return (stdout + stderr).strip('\n')
+            out = (stdout + stderr).strip('\n')
+            resources = kwargs.get('resources')
+            if resources and self.getParam('print_resources'):
+                prefix = indent + state.format(name) + ' '
+                out += ('\n' if out else '') + prefix + format_resources(resources)
+            return out
@@ -8,3 +8,4 @@
 #* https://www.gnu.org/licenses/lgpl-2.1.html
 
 from .BasicFormatter import shorten_line, shorten_text, ShortenMode, BasicFormatter
+from .BasicFormatter import format_bytes, format_resources
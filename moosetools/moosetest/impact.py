@@ -0,0 +1,113 @@
+#* This file is part of MOOSETOOLS repository
+#* https://www.github.com/idaholab/moosetools
+#*
+#* All rights reserved, see COPYRIGHT for full restrictions
+#* https://github.com/idaholab/moosetools/blob/main/COPYRIGHT
+#*
+#* Licensed under LGPL 2.1, please see LICENSE for details
+#* https://www.gnu.org/licenses/lgpl-2.1.html
+
+import os
+import inspect
+import fnmatch
+import collections
+from moosetools import pyhit
+from moosetools import moosetree
+from moosetools.moosetest.base import RunnerSpec
+from moosetools.moosetest.cache import object_params, referenced_files
+
+
+def dependency_index(groups, controllers=None):
+    """
+    Return the files and directories that each of the *groups* of `Runner` objects depends upon.
+
+    Two `dict` objects are returned, the first maps files (real paths, see `os.path.realpath`) to
+    the indices of the groups in *groups* that depend on the file and the second maps directories in
+    the same manner. The files include the test specification file, the files included by it, the
+    files referenced by the objects (see `moosetest.cache.referenced_files`), and the python files
+    that define the types of the `Runner` and `Differ` objects. The directories are the 'file_base'
+    of the objects, any file for which this is the nearest such directory is considered a
+    dependency.
+
+    The parameters of the `RunnerSpec` objects within *groups* are inspected, with the `Controller`
+    objects in *controllers*, without creating the objects (see `moosetest.cache.object_params`).
+    """
+    files = collections.defaultdict(set)
+    dirs = collections.defaultdict(set)
+    spec_files = dict()  # avoid loading a specification file for each object that it contains
+    for index, runners in enumerate(groups):
+        for runner in runners:
+            for filename in referenced_files(runner, controllers):
+                files[os.path.realpath(filename)].add(index)
+
+            otype, params, differs = object_params(runner, controllers)
+            types = [d.otype if isinstance(d, RunnerSpec) else type(d) for d in differs or tuple()]
+            for otype in [otype] + types:
+                filename = inspect.getsourcefile(otype)
+                if filename is not None:
+                    files[os.path.realpath(filename)].add(index)
+
+            base_dir = params.getValue('file', 'base')
+            if base_dir is not None:
+                dirs[os.path.realpath(base_dir)].add(index)
+
+            spec_file = params.getValue('_hit_filename') if '_hit_filename' in params else None
+            if spec_file not in spec_files:
+                spec_files[spec_file] = _spec_files(spec_file)
+            for filename in spec_files[spec_file]:
+                files[filename].add(index)
+    return files, dirs
+
+
+def select_groups(groups, changed, ignore_patterns=None, controllers=None):
+    """
+    Return the *groups* of `Runner` objects affected by the files (absolute paths) in *changed* and
+    the changed files that could not be associated with a group.
+
+    All of the groups are returned if any changed file is not associated with a group (see
+    `dependency_index`), unless the file matches a pattern in *ignore_patterns* (see `fnmatch`),
+    since the impact of the change is not known. The groups are returned in the supplied order. The
+    *controllers* are passed to `dependency_index`.
+    """
+    files, dirs = dependency_index(groups, controllers)
+    selected = set()
+    unmapped = list()
+    for filename in sorted(os.path.realpath(f) for f in changed):
+        if any(fnmatch.fnmatch(filename, p) for p in (ignore_patterns or tuple())):
+            continue
+
+        # Files within the nearest 'file_base' directory
+        indices = set(files.get(filename, set()))
+        directory = os.path.dirname(filename)
+        while directory not in dirs:
+            parent = os.path.dirname(directory)
+            if parent == directory:
+                break
+            directory = parent
+        indices.update(dirs.get(directory, set()))
+
+        if indices:
+            selected.update(indices)
+        else:
+            unmapped.append(filename)
+
+    if unmapped:
+        return list(groups), unmapped
+    return [runners for index, runners in enumerate(groups) if index in selected], unmapped
+
+
+def _spec_files(spec_file):
+    """
+    Return the `set` of files, the test specification *spec_file* and the files it includes, that
+    define the HIT nodes.
+    """
+    if (spec_file is None) or (not os.path.isfile(spec_file)):
+        return set()
+
+    out = {os.path.realpath(spec_file)}
+    spec_dir = os.path.dirname(spec_file)
+    for node in moosetree.iterate(pyhit.load(spec_file)):
+        filename = node.filename()
+        if filename:
+            out.add(os.path.realpath(os.path.join(spec_dir, filename)))
+    return out
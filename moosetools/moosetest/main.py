@@ -9,7 +9,9 @@
 
 import os
 import sys
+import time
 import logging
+import functools
 import argparse
 from moosetools import parameters
 from moosetools import moosetree
@@ -18,12 +20,21 @@ from moosetools import factory
 from moosetools import base
 from moosetools import mooseutils
 from moosetools.moosetest import discover, run, fuzzer
+from moosetools.moosetest.discover import DEFAULT_IGNORE_PATTERNS
 from moosetools.moosetest.base import Controller, Formatter, make_runner, make_differ
 from moosetools.moosetest.base import make_runner, make_differ
 from moosetools.moosetest.runners import RunCommand
 from moosetools.moosetest.differs import ConsoleDiffer
 from moosetools.moosetest.controllers import EnvironmentController
 from moosetools.moosetest.formatters import BasicFormatter
+from moosetools.moosetest.timing import load_timing, shard_groups, shard_summary
+from moosetools.moosetest.distributed import serve, check_authkey
+from moosetools.moosetest.writers import JSONLinesWriter, JUnitWriter
+from moosetools.moosetest.profiling import HarnessProfiler
+from moosetools.moosetest.watch import SpecWatcher, watch
+from moosetools.moosetest.impact import select_groups
+from moosetools.moosetest.throttle import LoadThrottle
+from moosetools.moosetest.benchmark import run_benchmark
 
 # Local directory, to be used for getting the included Controller/Formatter objects
 LOCAL_DIR = os.path.abspath(os.path.dirname(__file__))
@@ -37,13 +48,100 @@ def cli_args():
     parser.add_argument('--demo',
                         action='store_true',
                         help="Ignore all other arguments and run a demonstration.")
+    parser.add_argument('--benchmark', metavar='FILE',
+                        help="Ignore all other arguments, except '--baseline' and " \
+                             "'--benchmark-threads', and measure the overhead of the harness. " \
+                             "The results are written to FILE in the JSON format.")
+    parser.add_argument('--baseline', metavar='FILE',
+                        help="Compare the '--benchmark' results to those in FILE and fail if the " \
+                             "overhead increased.")
+    parser.add_argument('--benchmark-threads', type=int, nargs='+', default=[1, 8, 64],
+                        metavar='N',
+                        help="The numbers of workers measured by '--benchmark' " \
+                             "(default: %(default)s).")
     parser.add_argument('--config', default=os.getcwd(), type=str,
                         help="The configuration file or directory. If a directory is provided a " \
                              "'.moosetest' file is searched up the directory tree beginning at " \
                              "the supplied location (default: %(default)s).")
+    parser.add_argument('--force',
+                        action='store_true',
+                        help="Execute all tests, including those that passed in a previous run " \
+                             "with identical inputs (see the 'cache_file' configuration option).")
+    parser.add_argument('--shard', type=_shard_arg, metavar='INDEX/COUNT',
+                        help="Execute only a portion of the tests, by splitting the tests into " \
+                             "COUNT shards of similar duration and executing the shard INDEX " \
+                             "(1 to COUNT). The durations are taken from the 'timing_file' " \
+                             "configuration option, so the same file must be available on each " \
+                             "machine to produce the same partition.")
+    parser.add_argument('--results-file', metavar='FILE',
+                        help="Append the results of each test case, as it finishes, to FILE in " \
+                             "the JSON Lines format (see the 'results_file' configuration option).")
+    parser.add_argument('--junit-file', metavar='FILE',
+                        help="Write the results to FILE in the JUnit XML format when the tests " \
+                             "are complete (see the 'junit_file' configuration option).")
+    parser.add_argument('--output-dir', metavar='DIR',
+                        help="Retain the complete output of the tests that exceeds the limit " \
+                             "kept in memory within DIR, rather than removing it (see the " \
+                             "'output_dir' configuration option).")
+    parser.add_argument('--changed-since', metavar='REF',
+                        help="Execute only the tests affected by the files that differ from the " \
+                             "git commit REF, including uncommitted changes. All tests are " \
+                             "executed if a changed file cannot be associated with a test (see " \
+                             "the 'changed_ignore_patterns' configuration option).")
+    parser.add_argument('--re', metavar='PATTERN', dest='pattern',
+                        help="Execute only the tests with a name (e.g., 'tests:Tests/runner') " \
+                             "that matches the regular expression PATTERN. The blocks of the " \
+                             "test specifications that do not match are not parsed.")
+    parser.add_argument('--tags', action='append', metavar='TAG',
+                        help="Execute only the tests with any of the supplied TAG values in the " \
+                             "'tags' parameter, the option may be repeated (e.g., '--tags fast " \
+                             "--tags unit').")
+    parser.add_argument('paths', nargs='*', metavar='PATH',
+                        help="Execute only the tests in the test specification files or within " \
+                             "the directories supplied.")
+    parser.add_argument('--watch',
+                        action='store_true',
+                        help="After executing the tests, continue to execute the tests affected " \
+                             "by changes to the test specifications, the files they reference, " \
+                             "and the plugins until interrupted (Ctrl-C).")
+    parser.add_argument('--profile-harness',
+                        action='store_true',
+                        help="Report the time spent in each phase of the harness (e.g., loading " \
+                             "the configuration, discovering, and executing tests).")
+    parser.add_argument('--profile-dir', metavar='DIR',
+                        help="Also profile each phase with cProfile and write the statistics to " \
+                             "'DIR/<phase>.pstats', this implies '--profile-harness'.")
+    parser.add_argument('--worker',
+                        action='store_true',
+                        help="Start a worker agent that executes tests for a coordinator on " \
+                             "another machine, see '--listen' and '--workers'. The connection is " \
+                             "authenticated with the MOOSETEST_AUTHKEY environment variable, " \
+                             "which is required.")
+    parser.add_argument('--listen',
+                        default='localhost:8642',
+                        metavar='HOST:PORT',
+                        help="The address the worker agent listens on (default: %(default)s).")
+    parser.add_argument('--workers', nargs='+', metavar='HOST:PORT',
+                        help="Execute the tests with the worker agents at the supplied " \
+                             "addresses, rather than on this machine (see the 'workers' " \
+                             "configuration option).")
     return parser.parse_args()
 
 
+def _shard_arg(value):
+    """
+    Convert the '--shard' argument from 'INDEX/COUNT' to a `tuple` of `int` values.
+    """
+    try:
+        index, count = (int(v) for v in value.split('/'))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid value '{value}', expected INDEX/COUNT")
+    if (count < 1) or (index < 1) or (index > count):
+        raise argparse.ArgumentTypeError(
+            f"invalid value '{value}', INDEX must be in the range 1 to COUNT")
+    return index, count
+
+
 class TestHarness(base.MooseObject):
     """
     Object for extracting general configuration options from a HIT file.
@@ -79,6 +177,45 @@ class TestHarness(base.MooseObject):
                    array=True,
                    default=('Tests', ),
                    doc="List of top-level test specifications (e.g., `[Tests]`) HIT blocks to run.")
+        params.add(
+            'discover_ignore_patterns',
+            vtype=str,
+            array=True,
+            default=DEFAULT_IGNORE_PATTERNS,
+            doc=
+            "Patterns of directory names or paths, relative to the starting directory, that are not searched for test specifications (see the python `fnmatch` module), e.g., build directories."
+        )
+        params.add(
+            'prune_submodules',
+            vtype=bool,
+            default=True,
+            doc=
+            "Do not search directories that contain a '.git' file or directory (i.e., git submodules) for test specifications."
+        )
+        params.add(
+            'spec_cache_dir',
+            vtype=str,
+            doc=
+            "Directory for storing the objects created from each test specification, which are loaded rather than parsing the specification again if it is unchanged. The location should be relative to the configure file."
+        )
+        params.add('spec_cache_size',
+                   default=1000,
+                   vtype=int,
+                   doc="The maximum number of entries retained in the 'spec_cache_dir'.")
+        params.add(
+            'discover_processes',
+            vtype=bool,
+            default=False,
+            doc=
+            "Parse the test specifications within a process pool rather than a thread pool, which is faster for a large number of specifications."
+        )
+        params.add(
+            'discover_lazy',
+            vtype=bool,
+            default=False,
+            doc=
+            "Create compact records of the test objects during discovery, the objects are created by the process that executes them. This reduces the memory used for a large number of tests."
+        )
         params.add('timeout',
                    default=300.,
                    vtype=float,
@@ -87,6 +224,118 @@ class TestHarness(base.MooseObject):
                    default=50,
                    vtype=int,
                    doc="The maximum number of failures allowed before terminating all test cases.")
+        params.add(
+            'timing_file',
+            vtype=str,
+            doc=
+            "File for recording the duration of test cases, which is used to execute the longest running test specifications first in subsequent runs. The location should be relative to the configure file."
+        )
+        params.add(
+            'cache_file',
+            vtype=str,
+            doc=
+            "File for recording the test cases that pass, test cases that passed in a previous run with identical inputs are not executed. The location should be relative to the configure file."
+        )
+        params.add('cache_size',
+                   default=10000,
+                   vtype=int,
+                   doc="The maximum number of entries retained in the 'cache_file'.")
+        params.add('force',
+                   default=False,
+                   vtype=bool,
+                   doc="Execute all test cases, regardless of the entries in the 'cache_file'.")
+        params.add(
+            'workers',
+            vtype=str,
+            array=True,
+            doc=
+            "List of addresses (host:port) of worker agents, started with 'moosetest --worker', that execute the test cases rather than the local machine."
+        )
+        params.add('shard_count',
+                   default=1,
+                   vtype=int,
+                   verify=(lambda v: v > 0, "The value must be greater than zero."),
+                   doc="The number of shards that the tests are divided into.")
+        params.add('shard_index',
+                   default=1,
+                   vtype=int,
+                   verify=(lambda v: v > 0, "The value must be greater than zero."),
+                   doc="The shard to execute, in the range 1 to 'shard_count'.")
+        params.add(
+            'results_file',
+            vtype=str,
+            doc=
+            "File for appending the results of each test case, as it finishes, in the JSON Lines format. The location should be relative to the configure file."
+        )
+        params.add(
+            'junit_file',
+            vtype=str,
+            doc=
+            "File for writing the results in the JUnit XML format when the tests are complete. The location should be relative to the configure file."
+        )
+        params.add(
+            'output_dir',
+            vtype=str,
+            doc=
+            "Directory for retaining the complete output of the tests that exceeds the limit kept in memory (e.g., the 'max_output' parameter of `RunCommand`), by default the output is removed when the tests are complete. The location should be relative to the configure file."
+        )
+        params.add('changed_since',
+                   vtype=str,
+                   doc="Execute only the tests affected by the files that differ from this git " \
+                       "commit, see '--changed-since'.")
+        params.add('pattern',
+                   vtype=str,
+                   doc="Execute only the tests with a name that matches this regular " \
+                       "expression, see '--re'.")
+        params.add('tags',
+                   vtype=str,
+                   array=True,
+                   doc="Execute only the tests with any of these values in the 'tags' " \
+                       "parameter, see '--tags'.")
+        params.add('paths',
+                   vtype=str,
+                   array=True,
+                   doc="Execute only the tests in these test specification files or " \
+                       "directories (absolute paths), see the 'PATH' arguments.")
+        params.add(
+            'changed_ignore_patterns',
+            vtype=str,
+            array=True,
+            doc=
+            "Patterns of changed files (see the python `fnmatch` module) that do not affect any tests (e.g., '*.md'), when selecting tests with '--changed-since'."
+        )
+        params.add(
+            'max_retries',
+            default=0,
+            vtype=int,
+            verify=(lambda v: v >= 0, "The value must not be negative."),
+            doc=
+            "The number of times that a test case with a TIMEOUT, EXCEPTION, or FATAL state is executed again before the failure is reported, unless the 'max_retries' parameter is set for the test case. A DIFF or ERROR is not repeated."
+        )
+        params.add(
+            'flake_file',
+            vtype=str,
+            doc=
+            "File for recording the test cases that required more than one attempt, which is used to execute the flaky test specifications first in subsequent runs. The location should be relative to the configure file."
+        )
+        params.add(
+            'max_load',
+            vtype=float,
+            doc=
+            "Delay starting tests while the one minute load average of the machine exceeds this value."
+        )
+        params.add(
+            'max_cpu_pressure',
+            vtype=float,
+            doc=
+            "Delay starting tests while the percentage of time that tasks are stalled waiting for the CPU exceeds this value, see '/proc/pressure/cpu' on Linux."
+        )
+        params.add(
+            'max_memory_pressure',
+            vtype=float,
+            doc=
+            "Delay starting tests while the percentage of time that tasks are stalled waiting for memory exceeds this value, see '/proc/pressure/memory' on Linux."
+        )
         return params
 
     def __init__(self, *args, **kwargs):
@@ -99,11 +348,34 @@ class TestHarness(base.MooseObject):
             plugin_dirs.append(os.path.abspath(p_dir))
         self.parameters().setValue('plugin_dirs', tuple(plugin_dirs))
 
+        # Update the output files to be absolute paths
+        for name in ('timing_file', 'cache_file', 'flake_file', 'results_file', 'junit_file',
+                     'output_dir', 'spec_cache_dir'):
+            if self.isParamValid(name):
+                self.parameters().setValue(name, os.path.abspath(self.getParam(name)))
+
     def applyCommandLineArguments(self, args):
         """
         Apply options provided via the command line to the TestHarness object parameters.
         """
-        pass
+        if getattr(args, 'force', False):
+            self.parameters().setValue('force', True)
+        if getattr(args, 'changed_since', None) is not None:
+            self.parameters().setValue('changed_since', args.changed_since)
+        if getattr(args, 'workers', None):
+            self.parameters().setValue('workers', tuple(args.workers))
+        if getattr(args, 'pattern', None) is not None:
+            self.parameters().setValue('pattern', args.pattern)
+        if getattr(args, 'tags', None):
+            self.parameters().setValue('tags', tuple(args.tags))
+        if getattr(args, 'paths', None):
+            self.parameters().setValue('paths', tuple(os.path.abspath(p) for p in args.paths))
+        for name in ('results_file', 'junit_file', 'output_dir'):
+            if getattr(args, name, None) is not None:
+                self.parameters().setValue(name, os.path.abspath(getattr(args, name)))
+        if getattr(args, 'shard', None) is not None:
+            self.parameters().setValue('shard_index', args.shard[0])
+            self.parameters().setValue('shard_count', args.shard[1])
 
 
 def main():
@@ -118,31 +390,153 @@ def main():
     args = cli_args()
     if args.demo:
         return fuzzer()
+    if getattr(args, 'benchmark', None):
+        return run_benchmark(args.benchmark, args.baseline, args.benchmark_threads)
 
-    # Locate the config
-    filename = _locate_config(args.config)
+    # Measure the phases of the harness, this does nothing unless requested
+    profile_dir = getattr(args, 'profile_dir', None)
+    profile = getattr(args, 'profile_harness', False) or bool(profile_dir)
+    profiler = HarnessProfiler(profile, profile_dir)
 
-    # Load the config (pyhit.Node)
-    root = _load_config(filename)
+    # Locate and load the config (pyhit.Node)
+    with profiler.phase('_load_config'):
+        filename = _locate_config(args.config)
+        root = _load_config(filename)
 
     # Create the TestHarness object from the configuration, after this point the cli_args should
     # no longer be used. They are applied to the TestHarness object in this function by calling
     # the TestHarness.applyCommandLineArguments method.
-    harness = make_harness(filename, root, args)
+    with profiler.phase('make_harness'):
+        harness = make_harness(filename, root, args)
+
+    # Serve a coordinator on another machine, the plugins are loaded so that the objects it sends
+    # can be created
+    authkey = os.environ.get('MOOSETEST_AUTHKEY')
+    authkey = authkey.encode() if authkey else None
+    if getattr(args, 'worker', False):
+        factory.Factory(plugin_dirs=harness.getParam('plugin_dirs')).load()
+        return serve(args.listen, harness.getParam('n_threads'), authkey)
+    if harness.getParam('workers'):
+        check_authkey(authkey)
+    watch_mode = getattr(args, 'watch', False)
     del args  # just to avoid accidental use in the future
 
     # Create the Controller objects and Formatter
-    controllers = make_controllers(filename, root, harness.getParam('plugin_dirs'))
-    formatter = make_formatter(filename, root, harness.getParam('plugin_dirs'))
+    with profiler.phase('make_controllers'):
+        controllers = make_controllers(filename, root, harness.getParam('plugin_dirs'))
+    with profiler.phase('make_formatter'):
+        formatter = make_formatter(filename, root, harness.getParam('plugin_dirs'))
 
     # Locate the tests to execute
-    groups = discover(os.getcwd(), harness.getParam('spec_file_names'),
-                      harness.getParam('spec_file_blocks'), harness.getParam('plugin_dirs'),
-                      controllers, harness.getParam('n_threads'))
-
-    # Execute the tests
-    rcode = run(groups, controllers, formatter, harness.getParam('n_threads'),
-                harness.getParam('timeout'), harness.getParam('max_failures'))
+    with profiler.phase('discover'):
+        if watch_mode:
+            watcher = SpecWatcher(os.getcwd(),
+                                  harness.getParam('spec_file_names'),
+                                  harness.getParam('spec_file_blocks'),
+                                  harness.getParam('plugin_dirs'),
+                                  controllers,
+                                  harness.getParam('n_threads'),
+                                  ignore_patterns=harness.getParam('discover_ignore_patterns'),
+                                  prune_submodules=harness.getParam('prune_submodules'),
+                                  cache_dir=harness.getParam('spec_cache_dir'),
+                                  cache_size=harness.getParam('spec_cache_size'),
+                                  processes=harness.getParam('discover_processes'),
+                                  lazy=harness.getParam('discover_lazy'),
+                                  pattern=harness.getParam('pattern'),
+                                  tags=harness.getParam('tags'),
+                                  paths=harness.getParam('paths'))
+            groups = watcher.groups()
+        else:
+            groups = discover(os.getcwd(),
+                              harness.getParam('spec_file_names'),
+                              harness.getParam('spec_file_blocks'),
+                              harness.getParam('plugin_dirs'),
+                              controllers,
+                              harness.getParam('n_threads'),
+                              ignore_patterns=harness.getParam('discover_ignore_patterns'),
+                              prune_submodules=harness.getParam('prune_submodules'),
+                              cache_dir=harness.getParam('spec_cache_dir'),
+                              cache_size=harness.getParam('spec_cache_size'),
+                              processes=harness.getParam('discover_processes'),
+                              lazy=harness.getParam('discover_lazy'),
+                              pattern=harness.getParam('pattern'),
+                              tags=harness.getParam('tags'),
+                              paths=harness.getParam('paths'))
+
+    # Limit the tests to those affected by the changed files
+    if harness.isParamValid('changed_since'):
+        if watch_mode:
+            raise RuntimeError("The '--watch' option cannot be used with '--changed-since'.")
+        ref = harness.getParam('changed_since')
+        changed = mooseutils.git_changed_files(ref)
+        n_groups = len(groups)
+        groups, unmapped = select_groups(groups, changed,
+                                         harness.getParam('changed_ignore_patterns'), controllers)
+        if unmapped:
+            print(f"Executing all tests, the changed file '{unmapped[0]}' is not associated " \
+                  f"with a test.")
+        else:
+            print(f"Executing {len(groups)} of {n_groups} test specification(s) affected by " \
+                  f"the changes since '{ref}'.")
+
+    # Limit the tests to the requested shard, the partition depends only on the discovered tests and
+    # the timing database so each machine computes the same shards without coordination
+    shard_index = harness.getParam('shard_index') - 1
+    shard_count = harness.getParam('shard_count')
+    if shard_index >= shard_count:
+        msg = f"The 'shard_index' ({shard_index + 1}) must not exceed the 'shard_count' ({shard_count})."
+        raise RuntimeError(msg)
+    if watch_mode and (shard_count > 1):
+        raise RuntimeError("The '--watch' option cannot be used with sharding.")
+    if shard_count > 1:
+        timing = load_timing(harness.getParam('timing_file'))
+        shards = shard_groups(groups, timing, shard_count)
+        groups = shards[shard_index]
+
+    # Record the results to files, in addition to the Formatter output
+    writers = list()
+    if harness.isParamValid('results_file'):
+        writers.append(JSONLinesWriter(harness.getParam('results_file')))
+    if harness.isParamValid('junit_file'):
+        writers.append(JUnitWriter(harness.getParam('junit_file')))
+
+    # Delay starting tests while the machine is overloaded
+    limits = ('max_load', 'max_cpu_pressure', 'max_memory_pressure')
+    throttle = None
+    if any(harness.isParamValid(name) for name in limits):
+        throttle = LoadThrottle(**{name: harness.getParam(name) for name in limits})
+
+    # Execute the tests, the reporting is measured separately but is included in the 'run' phase
+    profiler.wrap(formatter, 'reporting', 'reportProgress', 'reportResults', 'reportComplete')
+    start = time.time()
+    with profiler.phase('run'):
+        if watch_mode:
+            execute = functools.partial(watch, watcher)
+        else:
+            execute = functools.partial(run, groups)
+        rcode = execute(controllers,
+                        formatter,
+                        n_threads=harness.getParam('n_threads'),
+                        timeout=harness.getParam('timeout'),
+                        max_fails=harness.getParam('max_failures'),
+                        timing_file=harness.getParam('timing_file'),
+                        cache_file=harness.getParam('cache_file'),
+                        cache_size=harness.getParam('cache_size'),
+                        force=harness.getParam('force'),
+                        workers=harness.getParam('workers'),
+                        authkey=authkey,
+                        writers=writers,
+                        throttle=throttle,
+                        max_retries=harness.getParam('max_retries'),
+                        flake_file=harness.getParam('flake_file'),
+                        output_dir=harness.getParam('output_dir'))
+
+    if shard_count > 1:
+        print(shard_summary(shards, timing, shard_index, time.time() - start))
+
+    summary = profiler.summary()
+    if summary:
+        print(summary)
 
     return rcode
 
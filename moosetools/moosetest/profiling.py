@@ -0,0 +1,113 @@
+#* This file is part of MOOSETOOLS repository
+#* https://www.github.com/idaholab/moosetools
+#*
+#* All rights reserved, see COPYRIGHT for full restrictions
+#* https://github.com/idaholab/moosetools/blob/main/COPYRIGHT
+#*
+#* Licensed under LGPL 2.1, please see LICENSE for details
+#* https://www.gnu.org/licenses/lgpl-2.1.html
+
+import os
+import time
+import pstats
+import cProfile
+import functools
+import contextlib
+import collections
+
+
+class HarnessProfiler(object):
+    """
+    Tool for measuring the time spent in the phases of the `moosetest.main` function (e.g., loading
+    the configuration, discovering tests, and executing tests).
+
+    If *enabled* is False the `phase` method does nothing, such that the phases may be marked
+    without checking if profiling is requested. If *directory* is provided, each phase is also
+    profiled with `cProfile` and the statistics are written to '<directory>/<phase>.pstats' by the
+    `summary` method, the files can be inspected with the `pstats` module or tools such as snakeviz.
+    """
+    def __init__(self, enabled=True, directory=None):
+        self._enabled = enabled
+        self._directory = directory
+        self._start = time.perf_counter()
+        self._times = collections.OrderedDict()  # phase name to [calls, seconds]
+        self._stats = dict()  # phase name to pstats.Stats object
+        self._depth = 0
+
+    @contextlib.contextmanager
+    def phase(self, name):
+        """
+        Context manager for measuring the phase *name*, a phase may be entered many times and the
+        time is accumulated.
+
+        Phases may be nested, the time of the inner phase is included in the outer phase. Only the
+        outer phase is profiled with `cProfile`, since a single profiler may be active at a time.
+        """
+        if not self._enabled:
+            yield
+            return
+
+        profiler = None
+        if (self._directory is not None) and (self._depth == 0):
+            profiler = cProfile.Profile()
+            profiler.enable()
+
+        self._depth += 1
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            duration = time.perf_counter() - start
+            self._depth -= 1
+            if profiler is not None:
+                profiler.disable()
+                if name in self._stats:
+                    self._stats[name].add(profiler)
+                else:
+                    self._stats[name] = pstats.Stats(profiler)
+
+            item = self._times.setdefault(name, [0, 0.])
+            item[0] += 1
+            item[1] += duration
+
+    def wrap(self, obj, name, *methods):
+        """
+        Replace the *methods* (`str`) of the object in *obj* with methods that are measured as the
+        phase *name*, for phases that are called from within other functions (e.g., the reporting
+        by a `Formatter` object).
+        """
+        if not self._enabled:
+            return
+
+        for method in methods:
+            func = getattr(obj, method)
+
+            @functools.wraps(func)
+            def wrapper(*args, _func=func, **kwargs):
+                with self.phase(name):
+                    return _func(*args, **kwargs)
+
+            setattr(obj, method, wrapper)
+
+    def summary(self):
+        """
+        Return a table of the number of calls and time spent in each phase and write the `cProfile`
+        statistics, if enabled. An empty `str` is returned if profiling is not enabled.
+        """
+        if not self._enabled:
+            return ''
+
+        total = time.perf_counter() - self._start
+        out = ['Harness profile:', f"  {'Phase':<20} {'Calls':>8} {'Time (s)':>10} {'Percent':>8}"]
+        for name, (calls, duration) in self._times.items():
+            percent = duration / total * 100 if total > 0 else 0
+            out.append(f"  {name:<20} {calls:>8} {duration:>10.3f} {percent:>7.1f}%")
+        out.append(f"  {'total':<20} {'':>8} {total:>10.3f}")
+
+        if self._directory is not None:
+            os.makedirs(self._directory, exist_ok=True)
+            for name, stats in self._stats.items():
+                filename = os.path.join(self._directory, f'{name}.pstats')
+                stats.dump_stats(filename)
+            out.append(f"The cProfile statistics were written to '{self._directory}'.")
+        return '\n'.join(out)
@@ -10,6 +10,8 @@
 import os
 import sys
 import time
+import shutil
+import tempfile
 import traceback
 import queue
 import platform
@@ -18,7 +20,13 @@ import threading
 import multiprocessing
 import time
 import enum
-from moosetools.moosetest.base import TestCase
+import collections
+from moosetools.moosetest.base import TestCase, RunnerSpec, RedirectOutput
+from moosetools.moosetest.base.Runner import OUTPUT_DIR_VARIABLE, RETAIN_DIR_VARIABLE
+from moosetools.moosetest.timing import load_timing, save_timing, sort_groups
+from moosetools.moosetest.flakes import load_flakes, save_flakes, sort_flaky
+from moosetools.moosetest.cache import compute_key, load_cache, save_cache
+from moosetools.moosetest.distributed import RemoteExecutor
 
 # By default macOS use 'spawn' for creating processes. However, I had problems with the following
 # warning being produced. I couldn't figure out that root cause of the warning with respect to the
@@ -28,6 +36,14 @@ from moosetools.moosetest.base import TestCase
 # UserWarning: resource_tracker: There appear to be 5 leaked semaphore objects to clean up at shutdown
 MULTIPROCESSING_CONTEXT = 'fork'
 
+# The states of a `TestCase` that may be transient (e.g., a stalled machine), which are executed
+# again if retries are requested (see `_execute_testcases`)
+RETRY_STATES = (TestCase.Result.TIMEOUT, TestCase.Result.EXCEPTION, TestCase.Result.FATAL)
+
+# Storage for the persistent process used by each worker for executing `TestCase` objects, see the
+# `_execute_persistent` function.
+_PERSISTENT_PROCESS = None
+
 
 def run(groups,
         controllers,
@@ -36,13 +52,27 @@ def run(groups,
         timeout=None,
         max_fails=sys.maxsize,
         min_fail_state=TestCase.Result.TIMEOUT,
-        method=None):
+        method=None,
+        isolate=False,
+        timing_file=None,
+        cache_file=None,
+        cache_size=10000,
+        force=False,
+        workers=None,
+        authkey=None,
+        writers=tuple(),
+        throttle=None,
+        max_retries=0,
+        flake_file=None,
+        output_dir=None):
     """
     Primary function for running tests.
 
     The *groups* is a `list` of `list` of `Runner` object to be executed. The outer list is
-    distributed for execution using a process pool. The inner list is executed sequentially within
-    that pool.
+    distributed for execution using a process pool. By default, the inner list is executed
+    sequentially within that pool. The 'depends_on' parameter of the `Runner` objects may be used
+    to alter the dependencies within the inner list, allowing independent objects to execute
+    concurrently (see `_build_chains`).
 
     The *controllers* is a list of `Controller` objects to be used during execution. The
     sub-parameters for each should already be injected into the `Runner` objects (i.e., they
@@ -56,6 +86,56 @@ def run(groups,
     objects had executed or timeout, unless the number of failures exceeds *max_fails*. If this
     is triggered all running objects will continue to run and all objects waiting will be canceled.
 
+    The *n_threads* is also the number of processors (slots) available; the groups are submitted
+    such that the total slots required by the running `Runner` objects (see `Runner.getSlots`) does
+    not exceed this number. Groups that fit within the available slots are submitted ahead of those
+    that do not, thus small groups execute alongside large ones rather than waiting.
+
+    Each worker of the process pool executes the `TestCase` objects within a persistent subprocess,
+    which is only replaced if a test case exceeds the *timeout* or the subprocess exits
+    unexpectedly. If *isolate* is True, each `TestCase` is executed within a new subprocess, this
+    may also be enabled for individual `Runner` objects with the 'isolate' parameter.
+
+    If *timing_file* is provided, the durations of the test cases recorded in the file from previous
+    runs are used to submit the groups to the process pool in order of the estimated duration,
+    longest first. The file is updated with the durations of the test cases executed (see
+    `moosetest.timing`).
+
+    If *cache_file* is provided, test cases that passed in a previous run with identical inputs (see
+    `moosetest.cache.compute_key`) are not executed and are reported as passing with a "cached"
+    reason. The file is updated with the test cases that pass, retaining the *cache_size* most
+    recently used entries. If *force* is True, all test cases are executed but the cache is still
+    updated.
+
+    If *workers* is provided, it should be a `list` of addresses ('host:port') of worker agents
+    (see `moosetest.distributed.serve`), which are used to execute the groups in place of the local
+    process pool. The *authkey* (`bytes`) is used to authenticate the connection with the agents.
+    The groups in-flight on an agent that disconnects are executed again by the remaining agents.
+
+    The *writers* are `ResultWriter` objects (see `moosetest.writers`) that record the results of
+    each test case as it finishes, in addition to the output of the *formatter*.
+
+    If *throttle* is provided, it should be a `LoadThrottle` object (see `moosetest.throttle`). The
+    submission of groups is delayed while it reports that the machine is overloaded, except that a
+    group is always submitted if none are executing, and resumes when the load drops.
+
+    The `Controller` objects with `Controller.PRE_DISPATCH` set are evaluated for each `Runner`
+    prior to submitting the groups, a `TestCase` that is skipped is reported without being submitted
+    to the workers (see `_skip_controlled`).
+
+    A `TestCase` that fails with a state that may be transient (TIMEOUT, EXCEPTION, or FATAL, see
+    `RETRY_STATES`) is executed again, up to *max_retries* times or the number in the 'max_retries'
+    parameter of the `Runner`, before the failure is reported. A DIFF or ERROR is not repeated. Only
+    the failed `TestCase` is repeated, not the group, and the number of executions is recorded in
+    the 'attempts' of the `TestCase.Data` for the `Runner`. If *flake_file* is provided, the number
+    of runs and of runs that required more than one attempt are recorded in the file for each test
+    case and groups with a high rate of these flakes are submitted first (see `moosetest.flakes`).
+
+    The `Runner` objects write temporary output files (e.g., the complete output of a `RunCommand`
+    that exceeds the 'max_output' parameter) within a directory that is removed when the tests are
+    complete. If *output_dir* is provided, the files with the complete output are retained within
+    it, rather than removed, and the names of the files are included in the reasons.
+
     The function will return 1 if any test case has a state with a level greater than
     *min_fail_state*, otherwise a 0 is returned.
     """
@@ -70,43 +150,196 @@ def run(groups,
     tc_kwargs['controllers'] = controllers
     tc_kwargs['min_fail_state'] = min_fail_state
 
-    # Setup process pool, the result_map is used to collecting results returned from workers
-    ctx = multiprocessing.get_context(MULTIPROCESSING_CONTEXT)
-    manager = ctx.Manager()
-    executor = concurrent.futures.ProcessPoolExecutor(mp_context=ctx, max_workers=n_threads)
+    # Submit the longest running groups first, based on the durations from previous runs
+    if timing_file is not None:
+        timing = load_timing(timing_file)
+        groups = sort_groups(groups, timing)
 
-    futures = list()  # pool workers
+    # Submit the groups containing flaky test cases first, so a repeated execution is not last
+    if flake_file is not None:
+        flakes = load_flakes(flake_file)
+        groups = sort_flaky(groups, flakes)
+
+    # Create the TestCase objects and the sequences of TestCase objects to execute
     testcases = dict()  # unique_id to TestCase object
-    readers = list()
+    chains = list()
     for runners in groups:
-        result_send = manager.Queue()
-        readers.append(result_send)
         local = [TestCase(runner=runner, **tc_kwargs) for runner in runners]
-        futures.append(executor.submit(_execute_testcases, local, result_send, timeout))
         testcases.update({tc.unique_id: tc for tc in local})
+        chains += _build_chains(local)
+
+    # Remove the TestCase objects skipped by the Controller objects, the sequences that depend on
+    # these are handled when the workers start (see `finish` below). This is done before the cache
+    # is applied, such that a cached result does not replace a skip due to a change in environment.
+    chains, skipped = _skip_controlled(chains, controllers, formatter, writers)
+
+    # Remove the TestCase objects that passed with the same inputs in a previous run
+    hits = set()
+    if cache_file is not None:
+        cache = load_cache(cache_file)
+        keys = {
+            tc.unique_id: compute_key(tc.runner, controllers)
+            for local, _ in chains for tc in local
+        }
+        if not force:
+            chains, hits = _remove_cached(chains, keys, cache)
+        for tc in filter(lambda tc: tc.unique_id in hits, testcases.values()):
+            results = {tc.name(): TestCase.Data(TestCase.Result.PASS, None, '', '', ['cached'])}
+            _report_progress_and_results(tc, formatter, TestCase.Progress.FINISHED,
+                                         TestCase.Result.PASS, results, writers)
+
+    # Directory for the temporary output files of the Runner objects, it is removed when the workers
+    # are complete such that the files are removed if a worker is terminated (e.g., a timeout)
+    temp_dir = tempfile.mkdtemp(prefix='moosetest_')
+    previous_environ = {n: os.environ.get(n) for n in (OUTPUT_DIR_VARIABLE, RETAIN_DIR_VARIABLE)}
+    os.environ[OUTPUT_DIR_VARIABLE] = temp_dir
+    os.environ.pop(RETAIN_DIR_VARIABLE, None)
+    if output_dir is not None:
+        os.makedirs(output_dir, exist_ok=True)
+        os.environ[RETAIN_DIR_VARIABLE] = output_dir
+
+    # Setup process pool, all workers report progress and results through a single queue
+    ctx = multiprocessing.get_context(MULTIPROCESSING_CONTEXT)
+    manager = ctx.Manager()
+    result_queue = manager.Queue()
+    if workers:
+        executor = RemoteExecutor(workers, authkey)
+    else:
+        executor = concurrent.futures.ProcessPoolExecutor(mp_context=ctx, max_workers=n_threads)
 
-    # Loop until the Future objects are complete
-    n_fails = 0
-    while any(f.running() for f in futures):
-        for reader in readers:
-            try:
-                unique_id, progress, state, results = reader.get_nowait()
-                tc = testcases.get(unique_id)
-                _report_progress_and_results(tc, formatter, progress, state, results)
-                if tc.finished:
-                    n_fails += int(tc.state.level >= min_fail_state.level)
-            except queue.Empty:
-                pass
+    futures = list()  # pool workers
 
-            for tc in filter(lambda obj: obj.running, testcases.values()):
-                formatter.reportProgress(tc)
+    # The sequences are submitted such that the slots required do not exceed the number of threads.
+    # A sequence that does not fit is passed over for later sequences that do (backfill) and a
+    # sequence that requires more than the number of threads is executed alone. For a distributed
+    # run the `RemoteExecutor` applies the limit with the number of workers of each agent.
+    n_slots = sys.maxsize if workers else (n_threads or os.cpu_count())
+    ready = list()  # (slots, sequence) ready for submission, in the order they became ready
+    in_flight = dict()  # Future object to the slots of the sequence executing
+
+    def make_ready(local):
+        """Add the sequence of `TestCase` objects in *local* to the sequences ready to submit."""
+        ready.append((min(max(tc.runner.getSlots() for tc in local), n_slots), local))
+
+    def dispatch():
+        """Submit the ready sequences that fit within the available slots."""
+        available = n_slots - sum(in_flight.values())
+        index = 0
+        while (index < len(ready)) and (available > 0) and (n_fails < max_fails):
+            if in_flight and (throttle is not None) and throttle.overloaded():
+                break
+            slots, local = ready[index]
+            if (slots <= available) or (not in_flight):
+                ready.pop(index)
+                in_flight[submit(local)] = slots
+                available -= slots
+            else:
+                index += 1
+
+    def submit(local):
+        """Submit the `TestCase` objects in *local* for sequential execution by the pool."""
+        future = executor.submit(_execute_testcases, local, result_queue, timeout, isolate,
+                                 max_retries)
+
+        # A `None` is added to the queue when the group is complete (or cancelled), the messages
+        # from the group are always ahead of this message because `_execute_testcases` sends them
+        # before returning.
+        future.add_done_callback(lambda f: result_queue.put(None))
+        futures.append(future)
+        return future
+
+    # Submit the sequences without dependencies, the others are submitted when the TestCase
+    # objects they depend upon finish (see `finish` below)
+    waiting = collections.defaultdict(list)  # unique_id to sequences that depend upon the TestCase
+    for local, depends in chains:
+        for unique_id in depends:
+            waiting[unique_id].append((local, depends))
+        if not depends:
+            make_ready(local)
 
-        if n_fails >= max_fails:
-            for f in futures:
-                f.cancel()
+    n_fails = 0
+    dispatch()
+
+    def finish(tc):
+        """Update failure count and handle the sequences depending on the finished *tc*."""
+        nonlocal n_fails
+        stack = [tc]
+        while stack:
+            tc = stack.pop()
+            n_fails += int(tc.state.level >= min_fail_state.level)
+            if n_fails >= max_fails:
+                for f in futures:
+                    f.cancel()
+
+            for local, depends in waiting.pop(tc.unique_id, list()):
+                if not local[0].waiting:  # already skipped due to another dependency
+                    continue
+
+                if tc.state.level > 0:
+                    msg = f"A previous test case ({tc.name()}) in the group returned a non-zero state of {tc.state}."
+                    for skip_tc in local:
+                        results = {
+                            skip_tc.name():
+                            TestCase.Data(TestCase.Result.SKIP, None, '', msg, ['dependency'])
+                        }
+                        _report_progress_and_results(skip_tc, formatter, TestCase.Progress.FINISHED,
+                                                     TestCase.Result.SKIP, results, writers)
+                        stack.append(skip_tc)
+                else:
+                    depends.discard(tc.unique_id)
+                    if not depends:
+                        make_ready(local)
+
+    for tc in skipped:
+        finish(tc)
+    dispatch()
+
+    # Wait for messages from the workers, the wait is limited to the next time that the progress of
+    # a running TestCase should be reported and, while throttled, the next check of the load.
+    n_done = 0
+    running = dict()  # unique_id to running TestCase object
+    while n_done < len(futures):
+        wait = None
+        if running:
+            wait = min(formatter.nextProgressTime(tc) for tc in running.values())
+            wait = max(wait - time.time(), 0)
+        if ready and (throttle is not None) and throttle.active:
+            wait = throttle.interval if wait is None else min(wait, throttle.interval)
+
+        try:
+            message = result_queue.get(timeout=wait)
+        except queue.Empty:
+            message = False
+            dispatch()
+
+        if message is None:
+            n_done += 1
+            for f in [f for f in in_flight if f.done()]:
+                in_flight.pop(f)
+            dispatch()
+        elif message:
+            unique_id, progress, state, results = message
+            tc = testcases.get(unique_id)
+            _report_progress_and_results(tc, formatter, progress, state, results, writers)
+            if tc.running:
+                running[unique_id] = tc
+            elif tc.finished:
+                running.pop(unique_id, None)
+                finish(tc)
+                dispatch()
+
+        for tc in running.values():
+            formatter.reportProgress(tc)
 
     # Shutdown the pool of workers.
     executor.shutdown()
+    manager.shutdown()
+    shutil.rmtree(temp_dir, ignore_errors=True)
+    for name, value in previous_environ.items():
+        if value is None:
+            os.environ.pop(name, None)
+        else:
+            os.environ[name] = value
 
     # Raise any exceptions from Future objects
     for f_obj in filter(lambda f: not f.cancelled(), futures):
@@ -114,13 +347,6 @@ def run(groups,
         if exc is not None:
             raise exc
 
-    # Report any messages that remain in the Queues
-    while any(not r.empty() for r in readers):
-        for reader in [r for r in readers if not r.empty()]:
-            unique_id, progress, state, results = reader.get_nowait()
-            tc = testcases.get(unique_id)
-            _report_progress_and_results(tc, formatter, progress, state, results)
-
     # If there are test cases not finished they must have been skipped because of the early max
     # failures exit, So, mark them as finished and report.
     for tc in filter(lambda tc: not tc.finished, testcases.values()):
@@ -133,13 +359,217 @@ def run(groups,
         })
         formatter.reportProgress(tc)
         formatter.reportResults(tc)
+        for writer in writers:
+            writer.write(tc)
+
+    # Record the durations for ordering of groups in subsequent runs
+    executed = [tc for tc in testcases.values() if tc.unique_id not in hits]
+    if timing_file is not None:
+        save_timing(timing_file, executed, timing)
+
+    # Record the flakes for ordering of groups in subsequent runs
+    if flake_file is not None:
+        save_flakes(flake_file, executed, flakes)
+
+    # Record the passing test cases
+    if cache_file is not None:
+        current = time.time()
+        for unique_id, tc in testcases.items():
+            if tc.state == TestCase.Result.PASS:
+                cache[keys[unique_id]] = current
+        save_cache(cache_file, cache, cache_size)
 
     # Produce exit code and return
+    for writer in writers:
+        writer.complete(testcases.values(), time.time() - start_time)
     print(formatter.reportComplete(testcases.values(), start_time))
     failed = sum(tc.state.level >= min_fail_state.level for tc in testcases.values())
     return 1 if failed > 0 else 0
 
 
+def _build_chains(testcases):
+    """
+    Return the sequences of `TestCase` objects from a group, *testcases*, to be executed.
+
+    The dependencies are defined by the 'depends_on' parameter of the `Runner` objects, which by
+    default is the previous `Runner` in the group. The names in the parameter are matched to the
+    name of the `Runner` objects in the group, the name may exclude the test specification prefix
+    (e.g., "runner" matches "tests:Tests/runner"). An empty name indicates no dependency.
+
+    The dependency graph is separated into sequences of `TestCase` objects that can be executed
+    in order by a single worker; a `TestCase` is added to a sequence if it depends only upon the
+    last item of the sequence and it is the only dependent of that item. A `list` of `tuple` is
+    returned, each containing a `list` of the `TestCase` objects within the sequence and a `set`
+    of the `TestCase.unique_id` values that the sequence depends upon.
+
+    See the `run` function for use.
+    """
+    # Resolve the names to the index within the group
+    depends = list()
+    for index, tc in enumerate(testcases):
+        names = tc.runner.getParam('depends_on')
+        if names is None:
+            depends.append([index - 1] if index > 0 else [])
+            continue
+
+        local = list()
+        for name in filter(None, names):
+            matches = [
+                i for i, other in enumerate(testcases)
+                if (other.name() == name) or other.name().endswith((f':{name}', f'/{name}'))
+            ]
+            if len(matches) != 1:
+                msg = "The 'depends_on' parameter of '{}' includes '{}', which must match exactly one test case within the group, {} matches were found."
+                raise RuntimeError(msg.format(tc.name(), name, len(matches)))
+            local.append(matches[0])
+        depends.append(local)
+
+    # Order the TestCase objects such that dependencies are first, the original order is retained
+    # when possible.
+    order = list()
+    remaining = {index: set(local) for index, local in enumerate(depends)}
+    while remaining:
+        ready = [index for index, local in remaining.items() if not local]
+        if not ready:
+            msg = "A cyclic dependency exists within the 'depends_on' parameter of the following: {}"
+            raise RuntimeError(msg.format(', '.join(testcases[i].name() for i in remaining)))
+        remaining.pop(ready[0])
+        for local in remaining.values():
+            local.discard(ready[0])
+        order.append(ready[0])
+
+    # Build the sequences
+    n_dependents = collections.Counter(i for local in depends for i in local)
+    chains = list()
+    chain_map = dict()  # index to sequence containing the TestCase
+    for index in order:
+        local = depends[index]
+        if (len(local) == 1) and (n_dependents[local[0]] == 1) and \
+           (chain_map[local[0]][0][-1] is testcases[local[0]]):
+            chain = chain_map[local[0]]
+            chain[0].append(testcases[index])
+        else:
+            chain = ([testcases[index]], set(testcases[i].unique_id for i in local))
+            chains.append(chain)
+        chain_map[index] = chain
+
+    return chains
+
+
+def _remove_cached(chains, keys, cache):
+    """
+    Remove the `TestCase` objects with a hash in *cache* from the sequences in *chains*.
+
+    The *chains* are the sequences returned from `_build_chains` and *keys* is a `dict` of
+    `TestCase.unique_id` to the hash computed by `moosetest.cache.compute_key`. A `TestCase` is
+    only removed if all of the `TestCase` objects it depends upon were also removed, since the
+    inputs for the `TestCase` may be created by those objects.
+
+    The updated sequences and a `set` of the `TestCase.unique_id` values removed are returned.
+
+    See the `run` function for use.
+    """
+    hits = set()
+    output = list()
+    for local, depends in chains:  # sequences are ordered such that dependencies are first
+        index = 0
+        if depends.issubset(hits):
+            while (index < len(local)) and (keys[local[index].unique_id] in cache):
+                hits.add(local[index].unique_id)
+                index += 1
+        if index < len(local):
+            output.append((local[index:], depends.difference(hits)))
+    return output, hits
+
+
+def _skip_controlled(chains, controllers, formatter, writers=tuple()):
+    """
+    Remove the `TestCase` objects that are skipped by the *controllers* from the sequences in
+    *chains*, without executing them.
+
+    The *chains* are the sequences returned from `_build_chains`. A `TestCase` that is skipped (see
+    `_controller_skip`) and the `TestCase` objects that follow it within the sequence are reported
+    as skipped, using the *formatter* and *writers*, as done by the `_execute_testcases` function.
+
+    The updated sequences and a `list` of the skipped `TestCase` objects are returned, the sequences
+    that depend on the skipped objects are not altered.
+
+    See the `run` function for use.
+    """
+    skipped = list()
+    output = list()
+    for local, depends in chains:
+        for index, tc in enumerate(local):
+            data = _controller_skip(tc.runner, controllers)
+            if data is not None:
+                break
+        else:
+            output.append((local, depends))
+            continue
+
+        results = {tc.name(): data}
+        _report_progress_and_results(tc, formatter, TestCase.Progress.FINISHED, data.state, results,
+                                     writers)
+        msg = f"A previous test case ({tc.name()}) in the group returned a non-zero state of {data.state}."
+        for skip_tc in local[index + 1:]:
+            results = {
+                skip_tc.name(): TestCase.Data(TestCase.Result.SKIP, None, '', msg, ['dependency'])
+            }
+            _report_progress_and_results(skip_tc, formatter, TestCase.Progress.FINISHED,
+                                         TestCase.Result.SKIP, results, writers)
+        skipped += local[index:]
+        if index > 0:
+            output.append((local[:index], depends))
+    return output, skipped
+
+
+def _controller_skip(runner, controllers):
+    """
+    Return the `TestCase.Data` for the *runner* (a `Runner` or `RunnerSpec`) if it is skipped by
+    one of the *controllers*, otherwise `None` is returned.
+
+    The *controllers* are evaluated in order, as done by `TestCase.execute`, until a controller
+    that does not have the `Controller.PRE_DISPATCH` flag is reached. If an error or exception
+    occurs, `None` is returned such that it is reported by the worker that executes the `TestCase`.
+    """
+    for controller in controllers or tuple():
+        if not controller.PRE_DISPATCH:
+            return None
+
+        with RedirectOutput() as out:
+            try:
+                controller.reset()
+                controller.execute(runner, _controller_params(runner, controller))
+                if controller.status() or \
+                   ((not isinstance(runner, RunnerSpec)) and runner.status()):
+                    return None
+                if not controller.isRunnable():
+                    return TestCase.Data(TestCase.Result.SKIP, None, out.stdout, out.stderr,
+                                         controller.getReasons())
+            except Exception:
+                return None
+            finally:
+                controller.reset()
+    return None
+
+
+def _controller_params(runner, controller):
+    """
+    Return the parameters of *runner* added by the *controller*, see `Controller.validObjectParams`.
+
+    The parameters are created from the supplied values if *runner* is a `RunnerSpec`.
+    """
+    prefix = controller.getParam('prefix')
+    if not isinstance(runner, RunnerSpec):
+        return runner.getParam(prefix)
+
+    params = controller.validObjectParams()
+    for key, value in runner.params.items():
+        if key.startswith(f'{prefix}_'):
+            params.setValue(key[len(prefix) + 1:], value)
+    return params
+
+
 def _execute_testcase(tc, conn):
     """
     Function for executing the `TestCase` *tc* with exception handling from within a subprocess.
@@ -160,17 +590,24 @@ def _execute_testcase(tc, conn):
     conn.send((state, results))
 
 
-def _execute_testcases(testcases, result_send, timeout):
+def _execute_testcases(testcases, result_send, timeout, isolate=False, max_retries=0):
     """
     Function for executing groups of `TestCase` objects, *testcases*, each within a subprocess.
 
-    This function is expected to be called from `concurrent.futures.ProcessPoolExecutor`. The *q*,
-    which is a `multiprocessing.Queue` is used to send the results from the run of +each+ `TestCase`
-    to the main process. This is done to allow the main process to report the results without
-    waiting for the entire group to complete.
+    This function is expected to be called from `concurrent.futures.ProcessPoolExecutor`. The
+    *result_send*, which is a `multiprocessing.Queue` is used to send the results from the run of
+    +each+ `TestCase` to the main process. This is done to allow the main process to report the
+    results without waiting for the entire group to complete.
 
     The *timeout* is the number of seconds that each `TestCase` is allowed to run before it is
-    aborted. This is accomplished by running the cases in another process.
+    aborted. This is accomplished by running the cases in another process. By default, this is a
+    persistent process that is reused for all cases executed by the calling process (see
+    `_execute_persistent`). If *isolate* is True or the 'isolate' parameter of the `Runner` is
+    set, a new process is created for the case (see `_execute_isolated`).
+
+    A case that fails with one of the `RETRY_STATES` is executed again, up to *max_retries* times
+    unless the 'max_retries' parameter of the `Runner` is set, and the number of executions is
+    stored in the results of the `Runner` when it is greater than one.
 
     See the `run` function for use.
     """
@@ -189,37 +626,128 @@ def _execute_testcases(testcases, result_send, timeout):
             continue
 
         result_send.put((unique_id, TestCase.Progress.RUNNING, None, None))
+        retries = tc.runner.getParam('max_retries')
+        retries = max_retries if retries is None else retries
+        for attempt in range(1, retries + 2):
+            if isolate or tc.runner.getParam('isolate'):
+                state, results = _execute_isolated(tc, timeout)
+            else:
+                state, results = _execute_persistent(tc, timeout)
+            if (state not in RETRY_STATES) or (attempt > retries):
+                break
+
+        if (attempt > 1) and (tc.name() in results):
+            results[tc.name()].attempts = attempt
+
+        result_send.put((unique_id, TestCase.Progress.FINISHED, state, results))
+        if (state.level > 0):
+            skip_message = f"A previous test case ({tc.name()}) in the group returned a non-zero state of {state}."
+
+
+def _execute_isolated(tc, timeout):
+    """
+    Function for executing the `TestCase` *tc* within a new subprocess.
+
+    The process is terminated if it does not complete within *timeout* seconds.
+
+    See the `_execute_testcases` for use.
+    """
+    ctx = multiprocessing.get_context(MULTIPROCESSING_CONTEXT)
+    conn_recv, conn_send = ctx.Pipe(False)
+    proc = ctx.Process(target=_execute_testcase, args=(tc, conn_send))
+    proc.start()
+
+    if conn_recv.poll(timeout):
+        state, results = conn_recv.recv()
+    else:
+        proc.terminate()
+        state = TestCase.Result.TIMEOUT
+        results = {
+            tc.name():
+            TestCase.Data(TestCase.Result.TIMEOUT, None, '', '', [f'max time ({timeout}) exceeded'])
+        }
+
+    proc.join()
+    proc.close()
+    return state, results
+
+
+def _execute_persistent(tc, timeout):
+    """
+    Function for executing the `TestCase` *tc* within a persistent subprocess.
+
+    The subprocess is created on the first call and reused by subsequent calls from the same
+    process, which avoids the cost of creating a process for each `TestCase`. The calling process
+    acts as a watchdog: if *tc* does not complete within *timeout* seconds or the subprocess exits
+    unexpectedly, the subprocess is terminated and a new one is created on the next call.
+
+    See the `_execute_testcases` for use.
+    """
+    global _PERSISTENT_PROCESS
+
+    # The process is stored with the id of the creating process, a copy inherited by a forked
+    # process (e.g., the workers of the process pool) is not usable and must be replaced.
+    if (_PERSISTENT_PROCESS is None) or (_PERSISTENT_PROCESS[0] != os.getpid()) or \
+       (not _PERSISTENT_PROCESS[1].is_alive()):
         ctx = multiprocessing.get_context(MULTIPROCESSING_CONTEXT)
-        conn_recv, conn_send = ctx.Pipe(False)
-        proc = ctx.Process(target=_execute_testcase, args=(tc, conn_send))
+        conn, child_conn = ctx.Pipe()
+        proc = ctx.Process(target=_persistent_target, args=(child_conn, ), daemon=True)
         proc.start()
+        child_conn.close()
+        _PERSISTENT_PROCESS = (os.getpid(), proc, conn)
+    _, proc, conn = _PERSISTENT_PROCESS
 
-        if conn_recv.poll(timeout):
-            state, results = conn_recv.recv()
-        else:
-            proc.terminate()
-            state = TestCase.Result.TIMEOUT
-            results = {
-                tc.name():
-                TestCase.Data(TestCase.Result.TIMEOUT, None, '', '',
-                              [f'max time ({timeout}) exceeded'])
-            }
+    try:
+        conn.send(tc)
+        if conn.poll(timeout):
+            return conn.recv()
 
-        proc.join()
-        proc.close()
+        state = TestCase.Result.TIMEOUT
+        results = {
+            tc.name():
+            TestCase.Data(TestCase.Result.TIMEOUT, None, '', '', [f'max time ({timeout}) exceeded'])
+        }
 
-        result_send.put((unique_id, TestCase.Progress.FINISHED, state, results))
-        if (state.level > 0):
-            skip_message = f"A previous test case ({tc.name()}) in the group returned a non-zero state of {state}."
+    except (EOFError, OSError):
+        state = TestCase.Result.FATAL
+        results = {
+            tc.name():
+            TestCase.Data(TestCase.Result.FATAL, None, '',
+                          "The process executing the test case exited unexpectedly.", None)
+        }
+
+    # The process is hung or has crashed, so stop it such that a new one is created
+    proc.terminate()
+    proc.join()
+    proc.close()
+    conn.close()
+    _PERSISTENT_PROCESS = None
+    return state, results
+
+
+def _persistent_target(conn):
+    """
+    Function for executing `TestCase` objects received on *conn* within a persistent subprocess.
+
+    The function returns when the connection is closed by the creating process.
+
+    See the `_execute_persistent` for use.
+    """
+    try:
+        while True:
+            _execute_testcase(conn.recv(), conn)
+    except EOFError:
+        pass
 
 
-def _report_progress_and_results(tc, formatter, progress, state, results):
+def _report_progress_and_results(tc, formatter, progress, state, results, writers=tuple()):
     """
     Helper function for reporting results/progress during a call to the `run` function.
 
     The `TestCase` object in *tc* if updated with *progress*, *state*, and *results* if the supplied
     progress differs from the existing progress in the object. The progress and results are
-    displayed to the screen using the `Formatter` object supplied in *formatter*.
+    displayed to the screen using the `Formatter` object supplied in *formatter* and the results are
+    recorded by the `ResultWriter` objects in *writers*.
     """
     if (progress is not None) and (tc.progress != progress):
         tc.setProgress(progress)
@@ -227,39 +755,63 @@ def _report_progress_and_results(tc, formatter, progress, state, results):
             tc.setState(state)
             tc.setResults(results)
             formatter.reportResults(tc)
+            for writer in writers:
+                writer.write(tc)
 
 
-def fuzzer(seed=1980,
-           timeout=(3, 10),
-           max_fails=(15, 100),
-           progress_interval=(3, 15),
-           group_num=(15, 50),
-           group_name_len=(6, 25),
-           controller_num=(1, 6),
-           controller_skip=0.05,
-           controller_raise=0.05,
-           controller_error=0.1,
-           differ_num=(0, 3),
-           differ_raise=0.01,
-           differ_error=0.1,
-           differ_fatal=0.1,
-           differ_platform=0.1,
-           differ_name_len=(6, 15),
-           runner_num=(1, 3),
-           runner_raise=0.01,
-           runner_error=0.1,
-           runner_fatal=0.05,
-           runner_sleep=(0.5, 10),
-           runner_platform=0.1,
-           runner_name_len=(4, 29)):
+def fuzzer(seed=1980, timeout=(3, 10), max_fails=(15, 100), progress_interval=(3, 15), **kwargs):
     """
     A tool for calling `run` function with randomized test cases.
+
+    The *kwargs* are passed to the `fuzzer_objects` function to create the test cases.
     """
     # This is more of a test object, so I wanted to keep the testing related import out of the
     # main functions for the run command.
     import random
-    import string
     from moosetools.moosetest.formatters import BasicFormatter
+    controllers, groups = fuzzer_objects(**kwargs)
+
+    # Formatter
+    kwargs = dict()
+    kwargs['progress_interval'] = random.randint(*progress_interval)
+    formatter = BasicFormatter(**kwargs)
+
+    # Run
+    kwargs = dict()
+    kwargs['timeout'] = random.randint(*timeout)
+    kwargs['max_fails'] = random.randint(*max_fails)
+    kwargs['min_fail_state'] = random.choice([r for r in TestCase.Result])
+    return run(groups, controllers, formatter, **kwargs)
+
+
+def fuzzer_objects(group_num=(15, 50),
+                   group_name_len=(6, 25),
+                   controller_num=(1, 6),
+                   controller_skip=0.05,
+                   controller_raise=0.05,
+                   controller_error=0.1,
+                   differ_num=(0, 3),
+                   differ_raise=0.01,
+                   differ_error=0.1,
+                   differ_fatal=0.1,
+                   differ_platform=0.1,
+                   differ_name_len=(6, 15),
+                   runner_num=(1, 3),
+                   runner_raise=0.01,
+                   runner_error=0.1,
+                   runner_fatal=0.05,
+                   runner_sleep=(0.5, 10),
+                   runner_platform=0.1,
+                   runner_name_len=(4, 29)):
+    """
+    Return randomized `Controller` objects and groups of `Runner` objects for the `fuzzer` function.
+
+    The ranges (e.g., *group_num*) are the inclusive limits of a random integer and the other
+    numbers are the probability of the option being enabled for each object. The objects are
+    created from the `random` module, thus `random.seed` may be used to create the same objects.
+    """
+    import random
+    import string
     from moosetools.moosetest.base import make_runner, make_differ
     sys.path.append(os.path.join(os.path.dirname(__file__), 'tests'))
     from _helpers import TestController, TestRunner, TestDiffer
@@ -323,17 +875,7 @@ def fuzzer(seed=1980,
 
         groups.append(runners)
 
-    # Formatter
-    kwargs = dict()
-    kwargs['progress_interval'] = random.randint(*progress_interval)
-    formatter = BasicFormatter(**kwargs)
-
-    # Run
-    kwargs = dict()
-    kwargs['timeout'] = random.randint(*timeout)
-    kwargs['max_fails'] = random.randint(*max_fails)
-    kwargs['min_fail_state'] = random.choice([r for r in TestCase.Result])
-    return run(groups, controllers, formatter, **kwargs)
+    return controllers, groups
 
 
 if __name__ == '__main__':  # pragma: no cover
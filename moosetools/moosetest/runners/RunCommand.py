@@ -8,11 +8,16 @@
 #* https://www.gnu.org/licenses/lgpl-2.1.html
 
 import os
+import io
 import sys
+import shutil
+import tempfile
 import threading
 import multiprocessing
 import subprocess
 from moosetools.moosetest.base import Runner
+from moosetools.moosetest.base.TestCase import max_rss_bytes
+from moosetools.moosetest.base.Runner import OUTPUT_DIR_VARIABLE, RETAIN_DIR_VARIABLE
 
 
 class RunCommand(Runner):
@@ -33,19 +38,168 @@ class RunCommand(Runner):
             doc=
             "Do not raise exception if the process fails; implemented via 'check' flag in `subprocess.run` command."
         )
+        params.add(
+            'max_output',
+            vtype=int,
+            default=1000000,
+            doc=
+            "The maximum number of bytes of sys.stdout and sys.stderr, each, retained in memory. If the output exceeds this size the beginning and end are retained and the complete output is kept in a file, which is removed after the tests unless the 'output_dir' of the `moosetest.run` function is supplied (e.g., '--output-dir'), in which case the name of the file is included in the reasons."
+        )
         return params
 
-    def execute(self):
-        kwargs = dict()
-        kwargs['capture_output'] = True  # MOOSE executable output is not captured without this
-        kwargs['encoding'] = 'utf-8'
-        kwargs['check'] = self.getParam('allow_exception')
-        kwargs['timeout'] = self.getParam('timeout')
+    def __init__(self, *args, **kwargs):
+        Runner.__init__(self, *args, **kwargs)
+        self.__output_files = (None, None)
+        self.__omitted = list()
+        self.__resource_usage = None
+
+    def getResourceUsage(self):
+        """
+        Return the peak resident memory, CPU time, and storage I/O of the command, as reported by
+        `os.wait4` (see `Runner.getResourceUsage`).
+        """
+        return self.__resource_usage
+
+    def getOutputFiles(self):
+        """
+        Return a `tuple` with the names of the files with the complete sys.stdout and sys.stderr of
+        the command, each name is `None` unless the output exceeded the 'max_output' parameter (see
+        `Runner.getOutputFiles`).
+        """
+        return self.__output_files
 
+    def execute(self):
         cmd = self.getParam('command')
         str_cmd = ' '.join(cmd)
         print('RUNNING COMMAND:\n{0}\n{1}\n{0}'.format('-' * len(str_cmd), str_cmd))
-        out = subprocess.run(cmd, **kwargs)
-        sys.stdout.write(out.stdout)
-        sys.stderr.write(out.stderr)
-        return out.returncode
+
+        # The output is written directly to files by the process, rather than through pipes, such
+        # that the output is never held in memory in full
+        self.__output_files = (None, None)
+        self.__omitted = list()
+        self.__resource_usage = None
+        with RunCommand._spillFile('.stdout') as stdout, RunCommand._spillFile('.stderr') as stderr:
+            try:
+                proc = subprocess.Popen(cmd, stdout=stdout, stderr=stderr)
+                rcode = self._wait(proc, self.getParam('timeout'))
+                out, out_file = self._readOutput(stdout, 'sys.stdout')
+                err, err_file = self._readOutput(stderr, 'sys.stderr')
+                self.__output_files = (out_file, err_file)
+            finally:
+                for fid in (stdout, stderr):
+                    if (fid.name not in self.__output_files) and os.path.exists(fid.name):
+                        os.remove(fid.name)
+
+        if self.getParam('allow_exception') and (rcode != 0):
+            raise subprocess.CalledProcessError(rcode, cmd, out, err)
+
+        sys.stdout.write(out)
+        sys.stderr.write(err)
+        return rcode
+
+    def postExecute(self):
+        """
+        Add a reason for each output that exceeded the 'max_output' parameter, with the name of the
+        file containing the complete output if it is retained (see `_readOutput`).
+        """
+        Runner.postExecute(self)
+        for msg in self.__omitted:
+            self.reason(msg)
+
+    def _wait(self, proc, timeout):
+        """
+        Wait for the process in *proc* to complete and return the return code. If *timeout* (in
+        seconds) is exceeded, the process is killed and `subprocess.TimeoutExpired` is raised.
+
+        The process is reaped with `os.wait4`, if available, to measure the resource usage of the
+        process. The waiting is performed by a thread to allow for the *timeout*.
+        """
+        if not hasattr(os, 'wait4'):
+            try:
+                return proc.wait(timeout=timeout)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+                proc.wait()
+                raise
+
+        status = list()
+        thread = threading.Thread(target=lambda: status.append(os.wait4(proc.pid, 0)), daemon=True)
+        thread.start()
+        thread.join(timeout)
+        timed_out = thread.is_alive()
+        if timed_out:
+            proc.kill()
+            thread.join()
+
+        if status:
+            _, code, rusage = status[0]
+            proc.returncode = -os.WTERMSIG(code) if os.WIFSIGNALED(code) else os.WEXITSTATUS(code)
+            self.__resource_usage = dict(max_rss=max_rss_bytes(rusage.ru_maxrss),
+                                         user_time=rusage.ru_utime,
+                                         sys_time=rusage.ru_stime)
+            if sys.platform.startswith('linux'):  # counted in blocks of 512 bytes
+                self.__resource_usage['read_bytes'] = rusage.ru_inblock * 512
+                self.__resource_usage['write_bytes'] = rusage.ru_oublock * 512
+        else:  # the process was reaped elsewhere
+            proc.wait()
+
+        if timed_out:
+            raise subprocess.TimeoutExpired(proc.args, timeout)
+        return proc.returncode
+
+    @staticmethod
+    def _spillFile(suffix):
+        """
+        Return a new named file object, opened for reading and writing, for the output of a command.
+
+        The file is created in the directory given by the `OUTPUT_DIR_VARIABLE` environment
+        variable, which is removed by the `moosetest.run` function, or the system temporary
+        directory.
+        """
+        return tempfile.NamedTemporaryFile(prefix='moosetest_',
+                                           suffix=suffix,
+                                           dir=os.environ.get(OUTPUT_DIR_VARIABLE),
+                                           delete=False)
+
+    def _readOutput(self, fid, stream):
+        """
+        Return the output in the file object *fid* and the name of the file if it is to be retained.
+
+        If the size exceeds the 'max_output' parameter, the beginning and end of the output are
+        returned and the file is not removed by the caller. The file remains in the directory given
+        by the `OUTPUT_DIR_VARIABLE` environment variable, which is removed by the `moosetest.run`
+        function, unless the `RETAIN_DIR_VARIABLE` environment variable is set, in which case it is
+        moved to that directory. The omitted output is reported with the *stream* name in the
+        reasons (see `postExecute`), rather than in the output, such that the `Differ` objects only
+        inspect the output of the command. The name of the file is included, unless it is removed
+        with the directory.
+        Otherwise, the complete output is returned and the file is removed by the caller.
+        """
+        limit = self.getParam('max_output')
+        size = fid.seek(0, os.SEEK_END)
+        fid.seek(0)
+        if size <= limit:
+            return RunCommand._decode(fid.read()), None
+
+        head = RunCommand._decode(fid.read(limit // 2))
+        fid.seek(size - limit // 2)
+        tail = RunCommand._decode(fid.read())
+
+        filename = fid.name
+        retain_dir = os.environ.get(RETAIN_DIR_VARIABLE)
+        if retain_dir:
+            filename = os.path.join(retain_dir, os.path.basename(fid.name))
+            shutil.move(fid.name, filename)
+
+        msg = f"{size - 2 * (limit // 2)} bytes of {stream} omitted"
+        if retain_dir or not os.environ.get(OUTPUT_DIR_VARIABLE):
+            msg += f", see '{filename}'"
+        self.__omitted.append(msg)
+        return head + tail, filename
+
+    @staticmethod
+    def _decode(data):
+        """
+        Return the `str` of the bytes in *data*, with the same newline handling as `subprocess.run`.
+        """
+        return io.TextIOWrapper(io.BytesIO(data), encoding='utf-8', errors='replace').read()
@@ -0,0 +1,167 @@
+#* This file is part of MOOSETOOLS repository
+#* https://www.github.com/idaholab/moosetools
+#*
+#* All rights reserved, see COPYRIGHT for full restrictions
+#* https://github.com/idaholab/moosetools/blob/main/COPYRIGHT
+#*
+#* Licensed under LGPL 2.1, please see LICENSE for details
+#* https://www.gnu.org/licenses/lgpl-2.1.html
+
+import os
+import re
+import sys
+import pickle
+import hashlib
+import inspect
+import logging
+from moosetools import mooseutils
+
+# Include statements within a test specification file (e.g., "!include common.i"), the path is
+# relative to the directory of the file containing the statement
+INCLUDE_RE = re.compile(rb'^\s*!include\s+[\'"]?([^\s\'"]+)', flags=re.MULTILINE)
+
+
+def factory_fingerprint(obj_factory, plugin_dirs=None, controllers=None):
+    """
+    Return a hash (hex `str`) that identifies the types that the `MooseTestFactory` in
+    *obj_factory* is able to create.
+
+    The hash includes the name, module, and the modification time and size of the source file of
+    each registered type, the python files in *plugin_dirs*, and the type and prefix of the
+    `Controller` objects in *controllers*. Thus, the hash changes if a plugin or the source of a
+    type is modified.
+    """
+    sha = hashlib.sha1()
+    sha.update(sys.version.encode())
+
+    files = set()
+    for name, otype in sorted(obj_factory._registered_types.items()):
+        sha.update(f'{name}:{otype.__module__}.{otype.__qualname__}'.encode())
+        files.add(inspect.getsourcefile(otype))
+    for controller in controllers or tuple():
+        otype = type(controller)
+        prefix = controller.getParam('prefix')
+        sha.update(f'{otype.__module__}.{otype.__qualname__}:{prefix}'.encode())
+        files.add(inspect.getsourcefile(otype))
+    for plugin_dir in plugin_dirs or tuple():
+        for root, _, filenames in os.walk(plugin_dir):
+            files.update(os.path.join(root, f) for f in filenames if f.endswith('.py'))
+
+    for filename in sorted(f for f in files if f is not None):
+        try:
+            stat = os.stat(filename)
+            sha.update(f'{filename}:{stat.st_mtime_ns}:{stat.st_size}'.encode())
+        except OSError:
+            sha.update(filename.encode())
+    return sha.hexdigest()
+
+
+def spec_key(filename, root_dir, spec_file_blocks, fingerprint):
+    """
+    Return a hash (hex `str`) that identifies the objects created from the test specification
+    *filename*, or `None` if the file cannot be read.
+
+    The hash includes the path and content of the file, the content of the files that it includes
+    (see `INCLUDE_RE`), the *root_dir* and *spec_file_blocks* supplied to the `moosetest.discover`
+    function, and the *fingerprint* returned by `factory_fingerprint`.
+    """
+    sha = hashlib.sha1()
+    if not _update_hash_with_spec(sha, os.path.abspath(filename), set()):
+        return None
+    for value in (os.path.abspath(filename), root_dir, fingerprint, *spec_file_blocks):
+        sha.update(b'\0' + value.encode())
+    return sha.hexdigest()
+
+
+def _update_hash_with_spec(sha, filename, visited):
+    """
+    Update the `hashlib` object in *sha* with the content of the test specification *filename* and
+    of the files that it includes, recursively, unless already in the `set` of *visited* files.
+
+    False is returned if *filename* cannot be read. An included file that cannot be read is
+    included by name, so the hash changes when it is created.
+
+    See `spec_key` for use.
+    """
+    visited.add(filename)
+    try:
+        with open(filename, 'rb') as fid:
+            content = fid.read()
+    except OSError:
+        return False
+
+    sha.update(content)
+    for match in INCLUDE_RE.finditer(content):
+        include = os.path.normpath(
+            os.path.join(os.path.dirname(filename), os.fsdecode(match.group(1))))
+        sha.update(b'\0' + include.encode())
+        if (include not in visited) and not _update_hash_with_spec(sha, include, visited):
+            sha.update(b'\0missing')
+    return True
+
+
+def load_spec(directory, key):
+    """
+    Return the `Runner` objects stored for *key* in the cache *directory*, or `None` if no valid
+    entry exists.
+
+    The modification time of the entry is updated, such that `prune_spec_cache` removes the least
+    recently used entries.
+    """
+    filename = os.path.join(directory, f'{key}.pickle')
+    try:
+        with open(filename, 'rb') as fid:
+            runners = pickle.load(fid)
+        os.utime(filename)
+    except FileNotFoundError:
+        return None
+    except Exception:
+        logging.getLogger(__name__).warning("Failed to read the specification cache entry '%s'.",
+                                            filename)
+        return None
+    return runners
+
+
+def save_spec(directory, key, runners):
+    """
+    Store the `Runner` objects in *runners* for *key* in the cache *directory*.
+    """
+    filename = os.path.join(directory, f'{key}.pickle')
+    try:
+        os.makedirs(directory, exist_ok=True)
+        mooseutils.atomic_write(
+            filename,
+            lambda fid: pickle.dump(runners, fid, protocol=pickle.HIGHEST_PROTOCOL),
+            mode='wb')
+    except (OSError, pickle.PicklingError, AttributeError, TypeError):
+        logging.getLogger(__name__).warning("Failed to write the specification cache entry '%s'.",
+                                            filename)
+
+
+def prune_spec_cache(directory, max_entries):
+    """
+    Remove the least recently used entries from the cache *directory*, retaining *max_entries*.
+    """
+    try:
+        entries = [e for e in os.scandir(directory) if e.name.endswith('.pickle')]
+    except OSError:
+        return
+
+    if len(entries) <= max_entries:
+        return
+    entries.sort(key=_mtime, reverse=True)
+    for entry in entries[max_entries:]:
+        try:
+            os.remove(entry.path)
+        except OSError:
+            pass
+
+
+def _mtime(entry):
+    """
+    Return the modification time of the `os.DirEntry` in *entry*, or zero if it was removed.
+    """
+    try:
+        return entry.stat().st_mtime
+    except OSError:
+        return 0
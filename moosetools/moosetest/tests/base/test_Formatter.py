@@ -62,6 +62,15 @@ class TestFormatter(unittest.TestCase):
         pstate.assert_called_with(tc, rr, tc.state, None)
         presult.assert_called_with(tc, rr, tc.results['r'])
 
+        # Runner with repeated execution
+        tc = TestCase(runner=rr, controllers=(ct, ))
+        tc.setResults(
+            {'r': TestCase.Data(TestCase.Result.PASS, None, 'out', 'err', ['reason'], attempts=3)})
+        tc.setProgress(TestCase.Progress.FINISHED)
+        tc.setState(TestCase.Result.PASS)
+        fm.reportResults(tc)
+        pstate.assert_called_with(tc, rr, tc.state, ['reason', '3 attempts'])
+
         # Differ
         dr = make_differ(TestDiffer, [ct], name='d')
         rr = make_runner(TestRunner, [ct], differs=(dr, ), name='r')
@@ -234,6 +243,20 @@ class TestFormatter(unittest.TestCase):
         fm.reportProgress(tc)
         pstate.assert_called()
 
+    @mock.patch('moosetools.moosetest.base.Formatter._printState')
+    def testNextProgressTime(self, pstate):
+        rr = make_runner(TestRunner, name='r')
+        tc = TestCase(runner=rr)
+        tc.setProgress(TestCase.Progress.RUNNING)
+
+        fm = Formatter(progress_interval=1)
+        self.assertEqual(fm.nextProgressTime(tc), tc.start_time + 1)
+
+        time.sleep(1.1)
+        fm.reportProgress(tc)
+        pstate.assert_called()
+        self.assertGreater(fm.nextProgressTime(tc), tc.start_time + 2)
+
 
 if __name__ == '__main__':
     unittest.main(module=__name__, verbosity=2, buffer=True)
@@ -57,6 +57,17 @@ class TestRunner(unittest.TestCase):
         runner = moosetest.base.make_runner(moosetest.base.Runner, differs=(d, ), name='name')
         self.assertIs(runner.getParam('differs')[0], d)
 
+    def testGetSlots(self):
+        runner = moosetest.base.Runner(name='name')
+        self.assertEqual(runner.getSlots(), 1)
+
+        runner = moosetest.base.Runner(name='name', n_procs=4, n_threads=2)
+        self.assertEqual(runner.getSlots(), 8)
+
+        with self.assertRaises(MooseException) as ex:
+            moosetest.base.Runner(name='name', n_procs=0)
+        self.assertIn("The value must be greater than zero.", str(ex.exception))
+
     def test_preExecute(self):
         runner = moosetest.base.Runner(name='run', file_names=('/runner_0', 'runner_1'))
         with self.assertLogs(level='ERROR') as log:
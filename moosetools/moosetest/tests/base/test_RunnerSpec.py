@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+#* This file is part of MOOSETOOLS repository
+#* https://www.github.com/idaholab/moosetools
+#*
+#* All rights reserved, see COPYRIGHT for full restrictions
+#* https://github.com/idaholab/moosetools/blob/main/COPYRIGHT
+#*
+#* Licensed under LGPL 2.1, please see LICENSE for details
+#* https://www.gnu.org/licenses/lgpl-2.1.html
+
+import os
+import sys
+import pickle
+import unittest
+from moosetools.moosetest.base import RunnerSpec, TestCase
+
+# I do not want the tests directory to be packages with __init__.py, so load from file
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from _helpers import TestController, TestRunner, TestDiffer
+
+
+class TestRunnerSpec(unittest.TestCase):
+    def setUp(self):
+        self._differ = RunnerSpec(TestDiffer, dict(name='d', stdout=True), 'Tests/r/d', 'tests', 5,
+                                  tuple())
+        self._spec = RunnerSpec(TestRunner,
+                                dict(name='tests:Tests/r', n_procs=2, ctrl_platform=('Linux', )),
+                                'Tests/r', 'tests', 2, (self._differ, ))
+
+    def testGetParam(self):
+        self.assertEqual(self._spec.name(), 'tests:Tests/r')
+        self.assertEqual(self._spec.getParam('n_procs'), 2)
+        self.assertEqual(self._spec.getParam('n_threads'), 1)
+        self.assertEqual(self._spec.getParam('depends_on'), None)
+        self.assertEqual(self._spec.getParam('ctrl', 'platform'), ('Linux', ))
+        self.assertEqual(self._spec.getParam('differs'), (self._differ, ))
+        self.assertEqual(self._differ.getParam('differs'), None)
+        self.assertEqual(self._spec.getSlots(), 2)
+
+    def testCreate(self):
+        ct = TestController()
+        obj = self._spec.create((ct, ))
+        self.assertIsInstance(obj, TestRunner)
+        self.assertEqual(obj.name(), 'tests:Tests/r')
+        self.assertEqual(obj.getParam('n_procs'), 2)
+        self.assertEqual(obj.getParam('ctrl', 'platform'), ('Linux', ))
+        self.assertEqual(obj.getParam('_hit_path'), 'Tests/r')
+        self.assertEqual(obj.getParam('_hit_filename'), 'tests')
+        self.assertEqual(obj.getParam('_controllers'), (ct, ))
+
+        differs = obj.getParam('differs')
+        self.assertEqual(len(differs), 1)
+        self.assertIsInstance(differs[0], TestDiffer)
+        self.assertEqual(differs[0].name(), 'd')
+        self.assertEqual(differs[0].getParam('stdout'), True)
+
+    def testPickle(self):
+        spec = pickle.loads(pickle.dumps(self._spec))
+        self.assertEqual(spec, self._spec)
+        self.assertLess(len(pickle.dumps(self._spec)),
+                        len(pickle.dumps(self._spec.create((TestController(), )))))
+
+    def testTestCase(self):
+        ct = TestController()
+        tc = TestCase(runner=self._spec, controllers=(ct, ))
+        self.assertIs(tc.runner, self._spec)
+        self.assertEqual(tc.name(), 'tests:Tests/r')
+        self.assertEqual(tc.differs, (self._differ, ))
+
+        s, r = tc.execute()
+        self.assertEqual(s, TestCase.Result.PASS)
+        self.assertEqual(list(r.keys()), ['tests:Tests/r', 'd'])
+        self.assertIsInstance(tc.runner, TestRunner)
+        self.assertIsInstance(tc.differs[0], TestDiffer)
+
+
+if __name__ == '__main__':
+    unittest.main(module=__name__, verbosity=2, buffer=True)
@@ -20,6 +20,8 @@ import uuid
 from unittest import mock
 from moosetools.moosetest.base import make_runner, Runner, make_differ, Differ
 from moosetools.moosetest.base import Controller, Formatter, TestCase, State, RedirectOutput
+from moosetools.moosetest.runners import RunCommand
+from moosetools.moosetest.differs import ConsoleDiffer
 
 # I do not want the tests directory to be packages with __init__.py, so load from file
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
@@ -680,6 +682,42 @@ class TestTestCase(unittest.TestCase):
                       r['d'].stderr)
         self.assertEqual(r['d'].reasons, None)
 
+    def testExecuteOutputFiles(self):
+        r = make_runner(RunCommand,
+                        name='r',
+                        command=('bash', '-c', 'printf "head%.0s" {1..1000}; printf tail'),
+                        max_output=100,
+                        differs=(make_differ(ConsoleDiffer, name='d', text_in='headheadtail'),
+                                 make_differ(ConsoleDiffer, name='d2', text_in='headhead' * 100)))
+        tc = TestCase(runner=r)
+        state, results = tc.execute()
+        self.addCleanup(os.remove, r.getOutputFiles()[0])
+        self.assertEqual(state, TestCase.Result.PASS)
+        self.assertNotIn('omitted', results['r'].stdout)
+        self.assertIn('bytes of sys.stdout omitted', results['r'].reasons[0])
+        self.assertEqual(results['d'].state, TestCase.Result.PASS)
+        self.assertEqual(results['d2'].state, TestCase.Result.PASS)
+
+    def testExecuteResources(self):
+        r = make_runner(RunCommand,
+                        name='r',
+                        command=(sys.executable, '-c', 'x = bytearray(1 << 26); sum(range(10**6))'))
+        tc = TestCase(runner=r)
+        state, results = tc.execute()
+        self.assertEqual(state, TestCase.Result.PASS)
+        resources = results['r'].resources
+        self.assertGreater(resources['max_rss'], 1 << 26)
+        self.assertGreater(resources['user_time'] + resources['sys_time'], 0)
+
+        # Only a Runner that reports the usage of the command includes resources
+        tc = TestCase(runner=make_runner(TestRunner, name='r'))
+        state, results = tc.execute()
+        self.assertIsNone(results['r'].resources)
+
+        # Data equality does not include the resource usage
+        self.assertEqual(TestCase.Data(TestCase.Result.PASS, 0, '', '', None, {'max_rss': 1}),
+                         TestCase.Data(TestCase.Result.PASS, 0, '', '', None))
+
     def testSetResults(self):
         ct = TestController()
         dr = make_differ(TestDiffer, [ct], name='d')
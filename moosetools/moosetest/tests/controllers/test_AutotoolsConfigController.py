@@ -9,6 +9,10 @@
 #* https://www.gnu.org/licenses/lgpl-2.1.html
 
 import os
+import sys
+import json
+import shutil
+import tempfile
 import unittest
 from unittest import mock
 from moosetools.base import MooseObject
@@ -82,6 +86,50 @@ class Test(unittest.TestCase):
             out = AutotoolsConfigController.loadConfig('wrong')
         self.assertEqual("The supplied file name, 'wrong', does not exist.", str(e.exception))
 
+    def test_loadConfigCache(self):
+        tmp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmp_dir)
+        config_file = os.path.join(tmp_dir, 'Config.h')
+        cache_file = os.path.join(tmp_dir, 'cache.json')
+        shutil.copy(os.path.join(os.path.dirname(__file__), 'TestConfig.h'), config_file)
+
+        # Read once for the process and stored in the cache file
+        out = AutotoolsConfigController.loadConfig(config_file, cache_file)
+        self.assertEqual(out['MOOSE_SPARSE_AD'], '1')
+        with open(cache_file, 'r') as fid:
+            cache = json.load(fid)
+        self.assertEqual(cache[config_file]['items'], out)
+
+        out['MOOSE_SPARSE_AD'] = '0'
+        with mock.patch('builtins.open') as mock_open:
+            out = AutotoolsConfigController.loadConfig(config_file)
+        mock_open.assert_not_called()
+        self.assertEqual(out['MOOSE_SPARSE_AD'], '1')
+
+        # Read from the cache file for a new process
+        sys.modules[AutotoolsConfigController.__module__]._CONFIG_CACHE.clear()
+        with mock.patch.object(AutotoolsConfigController, 'RE_DEFINE') as re_define:
+            out = AutotoolsConfigController.loadConfig(config_file, cache_file)
+        re_define.finditer.assert_not_called()
+        self.assertEqual(out['MOOSE_SPARSE_AD'], '1')
+
+        # Read again if modified
+        with open(config_file, 'a') as fid:
+            fid.write('#ifndef MOOSE_ADDED\n#define MOOSE_ADDED 42\n#endif\n')
+        out = AutotoolsConfigController.loadConfig(config_file, cache_file)
+        self.assertEqual(out['MOOSE_ADDED'], '42')
+        with open(cache_file, 'r') as fid:
+            self.assertEqual(json.load(fid)[config_file]['items'], out)
+
+        # Invalid cache file
+        sys.modules[AutotoolsConfigController.__module__]._CONFIG_CACHE.clear()
+        with open(cache_file, 'w') as fid:
+            fid.write('{')
+        with self.assertLogs(level='WARNING') as log:
+            out = AutotoolsConfigController.loadConfig(config_file, cache_file)
+        self.assertIn('Failed to read the configuration cache', log.output[0])
+        self.assertEqual(out['MOOSE_ADDED'], '42')
+
     def test_isFile(self):
         config_file = os.path.join(os.path.dirname(__file__), 'TestConfig.h')
         with mock.patch('os.path.isfile', return_value=True):
@@ -123,6 +171,13 @@ class Test(unittest.TestCase):
         self.assertEqual(r_value, '1980')
         self.assertEqual(r_name, 'MOOSE_VALUE')
 
+        # The mapped values are retained
+        params = obj.getParam('moose')
+        with mock.patch.object(params, 'getUserData') as get_user_data:
+            m_value, r_value, r_name = ctrl.getConfigItem(params, 'ad_mode')
+        get_user_data.assert_not_called()
+        self.assertEqual(m_value, 'SPARSE')
+
     def test_checkConfig(self):
         config_file = os.path.join(os.path.dirname(__file__), 'TestConfig.h')
         ctrl = TestConfig(config_files=(config_file, ), log_level='DEBUG')
@@ -15,6 +15,7 @@ from unittest import mock
 from moosetools.parameters import InputParameters
 from moosetools.base import MooseException, MooseObject
 from moosetools.moosetest.controllers import EnvironmentController
+from moosetools.moosetest.controllers.EnvironmentController import package_available, parse_version
 from moosetools.moosetest.base import make_differ
 
 
@@ -84,11 +85,36 @@ class TestEnvironmentController(unittest.TestCase):
         self.assertEqual(ctrl.isRunnable(), True)
         self.assertEqual(ctrl.getReasons(), [])
 
-        with mock.patch('moosetools.mooseutils.check_configuration', return_value=['sys', 'io']):
-            ctrl.execute(obj, obj.getParam('env'))
+        obj = make_differ(TestObject, (ctrl, ),
+                          env_python_required_packages=('sys', 'not_a_package', 'not_a.module'))
+        ctrl.execute(obj, obj.getParam('env'))
         self.assertEqual(ctrl.isRunnable(), False)
         self.assertEqual(ctrl.getReasons(), ['missing python package(s)'])
 
+    def testMemoized(self):
+        package_available.cache_clear()
+        parse_version.cache_clear()
+
+        ctrl = EnvironmentController()
+        obj = make_differ(TestObject, (ctrl, ),
+                          env_python_minimum_version='3.0',
+                          env_python_required_packages=('unittest', ))
+
+        with mock.patch('importlib.util.find_spec', return_value=True) as find_spec:
+            for i in range(3):
+                ctrl.reset()
+                ctrl.execute(obj, obj.getParam('env'))
+                self.assertEqual(ctrl.isRunnable(), True)
+        find_spec.assert_called_once_with('unittest')
+        self.assertEqual(parse_version.cache_info().misses, 2)
+        self.assertEqual(parse_version.cache_info().hits, 4)
+
+        # The packages are not imported
+        self.assertFalse(package_available('not_a_package'))
+        with mock.patch('builtins.__import__') as imp:
+            package_available('json')
+        imp.assert_not_called()
+
 
 if __name__ == '__main__':
     unittest.main(module=__name__, verbosity=2)
@@ -9,9 +9,12 @@
 #* https://www.gnu.org/licenses/lgpl-2.1.html
 
 import io
+import os
 import logging
+import tempfile
 import unittest
 from unittest import mock
+from moosetools.moosetest.base import OutputText
 from moosetools.moosetest.differs import ConsoleDiffer
 
 
@@ -210,6 +213,40 @@ class TestConsoleDiffer(unittest.TestCase):
             log.output[0])
         self.assertEqual(obj.status(), 1)
 
+    def testOutputFile(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filename = os.path.join(tmpdir, 'out.txt')
+            with open(filename, 'w') as fid:
+                fid.write('head\n1980-06-24 andrew\ntail')
+            stdout = OutputText('head\n[...omitted...]\ntail', filename)
+            empty = OutputText('', os.path.join(tmpdir, 'missing.txt'))
+
+            obj = ConsoleDiffer(name='diff',
+                                text_in='andrew',
+                                text_in_stdout='andrew',
+                                re_match='\d{4}-\d{2}-\d{2}',
+                                re_match_stdout='^1980')
+            obj.execute(0, stdout, empty)
+            self.assertEqual(obj.status(), 0)
+
+            obj = ConsoleDiffer(name='diff', text_not_in_stdout='andrew')
+            with self.assertLogs(level='ERROR') as log:
+                obj.execute(0, stdout, empty)
+            self.assertIn("The content of 'text_not_in_stdout' parameter, 'andrew', was located",
+                          log.output[0])
+
+            obj = ConsoleDiffer(name='diff', re_not_match_stdout='\d{4}-\d{2}-\d{2}')
+            with self.assertLogs(level='ERROR') as log:
+                obj.execute(0, stdout, empty)
+            self.assertIn("The regular expression of 're_not_match_stdout' parameter",
+                          log.output[0])
+
+            obj = ConsoleDiffer(name='diff', text_in_stderr='andrew')
+            with self.assertLogs(level='ERROR') as log:
+                obj.execute(0, stdout, empty)
+            self.assertIn("The content of 'text_in_stderr' parameter, 'andrew', was not located",
+                          log.output[0])
+
 
 if __name__ == '__main__':
     unittest.main(module=__name__, verbosity=2)
@@ -14,7 +14,7 @@ import unittest
 from unittest import mock
 from moosetools.moosetest.base import TestCase
 from moosetools.moosetest.formatters import shorten_line, shorten_text, ShortenMode
-from moosetools.moosetest.formatters import BasicFormatter
+from moosetools.moosetest.formatters import BasicFormatter, format_bytes, format_resources
 
 
 class TestShorten(unittest.TestCase):
@@ -179,10 +179,11 @@ class TestBasicFormatter(unittest.TestCase):
         obj = BasicFormatter()
 
         class TestCaseProxy(object):
-            def __init__(self, name, state, t):
+            def __init__(self, name, state, t, resources=None):
                 self._name = name
                 self.state = state
                 self.time = t
+                self.results = {name: TestCase.Data(state, 0, '', '', None, resources)}
 
             def name(self):
                 return self._name
@@ -206,6 +207,76 @@ class TestBasicFormatter(unittest.TestCase):
 
         self.assertIn('Longest running test(s)', text)
         self.assertIn('\n  20.00s B\n  10.00s A', text)
+        self.assertNotIn('Largest memory test(s)', text)
+        self.assertNotIn('Most CPU time test(s)', text)
+
+        # Resource usage
+        complete = [
+            TestCaseProxy('A', TestCase.Result.PASS, 10, {
+                'max_rss': 2048,
+                'user_time': 1,
+                'sys_time': 0.5
+            }),
+            TestCaseProxy('B', TestCase.Result.PASS, 20, {
+                'max_rss': 3 * 1024**2,
+                'user_time': 0.25,
+                'sys_time': 0
+            }),
+            TestCaseProxy('C', TestCase.Result.PASS, 20, {
+                'user_time': 0,
+                'sys_time': 0
+            }),
+            TestCaseProxy('D', TestCase.Result.SKIP, 0)
+        ]
+        text = obj.formatComplete(complete)
+        self.assertNotIn('Largest memory test(s)', text)
+        self.assertNotIn('Most CPU time test(s)', text)
+
+        obj = BasicFormatter(print_largest_memory_tests=5, print_most_cpu_tests=5)
+        text = obj.formatComplete(complete)
+        self.assertIn('Largest memory test(s):\n  3.0 MB B\n  2.0 KB A\n', text)
+        self.assertIn('Most CPU time test(s):\n  1.50s A\n  0.25s B\n  0.00s C', text)
+
+        obj = BasicFormatter(print_largest_memory_tests=1, print_most_cpu_tests=0)
+        text = obj.formatComplete(complete)
+        self.assertTrue(text.endswith('Largest memory test(s):\n  3.0 MB B'))
+        self.assertNotIn('Most CPU time test(s)', text)
+        self.assertNotIn('Retried test(s)', text)
+
+        # Repeated execution
+        complete[0].results['A'].attempts = 2
+        complete[3].results['D'].attempts = 3
+        text = obj.formatComplete(complete)
+        self.assertIn('Retried test(s):\n  2 attempts OK A\n  3 attempts SKIP D', text)
+
+    def test_formatResources(self):
+        self.assertEqual(format_bytes(12), '12 B')
+        self.assertEqual(format_bytes(1536), '1.5 KB')
+        self.assertEqual(format_bytes(5 * 1024**4), '5.0 TB')
+
+        resources = {
+            'max_rss': 1024**2,
+            'user_time': 1.5,
+            'sys_time': 0.25,
+            'read_bytes': 0,
+            'write_bytes': 4096
+        }
+        self.assertEqual(format_resources(resources),
+                         "max RSS 1.0 MB, CPU 1.50s user 0.25s sys, I/O 0 B read 4.0 KB written")
+        self.assertEqual(format_resources({
+            'user_time': 1,
+            'sys_time': 2
+        }), "CPU 1.00s user 2.00s sys")
+
+        kwargs = dict(state=TestCase.Result.DIFF,
+                      name='a',
+                      stdout='out\n',
+                      stderr='',
+                      resources=resources)
+        with mock.patch('moosetools.mooseutils.color_text', side_effect=lambda *args: args[0]):
+            self.assertEqual(BasicFormatter()._formatResult(**kwargs), 'a out')
+            obj = BasicFormatter(print_resources=True)
+            self.assertEqual(obj._formatResult(**kwargs), 'a out\na ' + format_resources(resources))
 
 
 if __name__ == '__main__':
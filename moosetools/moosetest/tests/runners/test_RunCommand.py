@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+#* This file is part of MOOSETOOLS repository
+#* https://www.github.com/idaholab/moosetools
+#*
+#* All rights reserved, see COPYRIGHT for full restrictions
+#* https://github.com/idaholab/moosetools/blob/main/COPYRIGHT
+#*
+#* Licensed under LGPL 2.1, please see LICENSE for details
+#* https://www.gnu.org/licenses/lgpl-2.1.html
+
+import os
+import sys
+import tempfile
+import subprocess
+import unittest
+from unittest import mock
+from moosetools.moosetest.base import RedirectOutput
+from moosetools.moosetest.base.Runner import OUTPUT_DIR_VARIABLE, RETAIN_DIR_VARIABLE
+from moosetools.moosetest.runners import RunCommand
+
+
+class TestRunCommand(unittest.TestCase):
+    def testExecute(self):
+        obj = RunCommand(name='run', command=('bash', '-c', 'echo andrew; echo bob >&2; exit 2'))
+        with RedirectOutput() as out:
+            rcode = obj.execute()
+        self.assertEqual(rcode, 2)
+        self.assertIn('RUNNING COMMAND', out.stdout)
+        self.assertIn('andrew\n', out.stdout)
+        self.assertEqual(out.stderr, 'bob\n')
+        self.assertEqual(obj.getOutputFiles(), (None, None))
+
+        obj = RunCommand(name='run', command=('bash', '-c', 'exit 2'), allow_exception=True)
+        with RedirectOutput() as out, self.assertRaises(subprocess.CalledProcessError):
+            obj.execute()
+
+        obj = RunCommand(name='run', command=('sleep', '5'), timeout=1)
+        with RedirectOutput() as out, self.assertRaises(subprocess.TimeoutExpired):
+            obj.execute()
+
+    def testResourceUsage(self):
+        obj = RunCommand(name='run', command=('true', ))
+        self.assertIsNone(obj.getResourceUsage())
+        with RedirectOutput():
+            obj.execute()
+        self.assertGreater(obj.getResourceUsage()['max_rss'], 0)
+
+        # Allocate ~64 MB in the child process
+        obj = RunCommand(name='run', command=(sys.executable, '-c', 'x = bytearray(1 << 26)'))
+        with RedirectOutput():
+            obj.execute()
+        self.assertGreater(obj.getResourceUsage()['max_rss'], 1 << 26)
+        self.assertIn('user_time', obj.getResourceUsage())
+        self.assertIn('sys_time', obj.getResourceUsage())
+
+        obj = RunCommand(name='run', command=('bash', '-c', 'kill -9 $$'))
+        with RedirectOutput():
+            self.assertEqual(obj.execute(), -9)
+
+    def testMaxOutput(self):
+        obj = RunCommand(name='run',
+                         command=('bash', '-c', 'printf "head%.0s" {1..1000}; printf tail'),
+                         max_output=100)
+        with RedirectOutput() as out:
+            obj.preExecute()
+            rcode = obj.execute()
+            obj.postExecute()
+        self.assertEqual(rcode, 0)
+
+        out_file, err_file = obj.getOutputFiles()
+        self.addCleanup(os.remove, out_file)
+        self.assertIsNone(err_file)
+        self.assertEqual(obj.getReasons(), [f"3904 bytes of sys.stdout omitted, see '{out_file}'"])
+        self.assertNotIn('omitted', out.stdout)
+        self.assertTrue(out.stdout.endswith('headtail'))
+        self.assertLess(len(out.stdout), 300)
+
+        with open(out_file, 'r') as fid:
+            content = fid.read()
+        self.assertEqual(content, 'head' * 1000 + 'tail')
+
+    def testOutputDirectory(self):
+        with tempfile.TemporaryDirectory() as tmpdir, \
+             mock.patch.dict(os.environ, {OUTPUT_DIR_VARIABLE: tmpdir}):
+
+            # Output files are removed, including when an exception occurs
+            obj = RunCommand(name='run', command=('bash', '-c', 'echo andrew'))
+            with RedirectOutput():
+                obj.execute()
+            obj = RunCommand(name='run', command=('sleep', '5'), timeout=1)
+            with RedirectOutput(), self.assertRaises(subprocess.TimeoutExpired):
+                obj.execute()
+            obj = RunCommand(name='run', command=('not_a_command', ))
+            with RedirectOutput(), self.assertRaises(FileNotFoundError):
+                obj.execute()
+            self.assertEqual(os.listdir(tmpdir), [])
+
+            # The complete output remains in the directory, which is removed by `moosetest.run`
+            obj = RunCommand(name='run',
+                             command=('bash', '-c', 'printf "a%.0s" {1..200}'),
+                             max_output=100)
+            with RedirectOutput():
+                obj.preExecute()
+                obj.execute()
+                obj.postExecute()
+            out_file, _ = obj.getOutputFiles()
+            self.assertEqual(os.listdir(tmpdir), [os.path.basename(out_file)])
+            self.assertEqual(os.path.dirname(out_file), tmpdir)
+            self.assertEqual(obj.getReasons(), ["100 bytes of sys.stdout omitted"])
+            with open(out_file, 'r') as fid:
+                self.assertEqual(fid.read(), 'a' * 200)
+            os.remove(out_file)
+
+            # Retained files are moved to the requested directory
+            with tempfile.TemporaryDirectory() as retain_dir, \
+                 mock.patch.dict(os.environ, {RETAIN_DIR_VARIABLE: retain_dir}):
+                obj = RunCommand(name='run',
+                                 command=('bash', '-c', 'printf "a%.0s" {1..200}'),
+                                 max_output=100)
+                with RedirectOutput():
+                    obj.preExecute()
+                    obj.execute()
+                    obj.postExecute()
+                out_file, _ = obj.getOutputFiles()
+                self.assertEqual(os.listdir(tmpdir), [])
+                self.assertEqual(os.listdir(retain_dir), [os.path.basename(out_file)])
+                self.assertEqual(obj.getReasons(),
+                                 [f"100 bytes of sys.stdout omitted, see '{out_file}'"])
+
+
+if __name__ == '__main__':
+    unittest.main(module=__name__, verbosity=2, buffer=True)
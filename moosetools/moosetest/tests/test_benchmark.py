@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+#* This file is part of MOOSETOOLS repository
+#* https://www.github.com/idaholab/moosetools
+#*
+#* All rights reserved, see COPYRIGHT for full restrictions
+#* https://github.com/idaholab/moosetools/blob/main/COPYRIGHT
+#*
+#* Licensed under LGPL 2.1, please see LICENSE for details
+#* https://www.gnu.org/licenses/lgpl-2.1.html
+
+import os
+import io
+import json
+import tempfile
+import unittest
+import platform
+from unittest import mock
+
+from moosetools.moosetest.benchmark import benchmark, save_benchmark, load_benchmark
+from moosetools.moosetest.benchmark import compare_benchmark, run_benchmark
+
+
+@unittest.skipIf(platform.python_version() < '3.7', "Python 3.7 or greater required")
+class TestBenchmark(unittest.TestCase):
+    def setUp(self):
+        self._tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmpdir.cleanup)
+        self._filename = os.path.join(self._tmpdir.name, 'benchmark.json')
+
+    def testBenchmark(self):
+        results = benchmark(n_threads=(1, 2), n_groups=3, n_calls=10)
+        self.assertEqual(set(results['threads'].keys()), {'1', '2'})
+        for item in results['threads'].values():
+            self.assertEqual(item['n_testcases'], results['threads']['1']['n_testcases'])
+            self.assertGreater(item['per_testcase'], 0)
+            self.assertGreater(item['throughput'], 0)
+            self.assertGreaterEqual(item['parent_cpu_per_testcase'], 0)
+            self.assertGreaterEqual(item['max_rss_growth'], 0)
+        self.assertGreater(results['payload']['testcase_bytes'], 0)
+        self.assertGreater(results['payload']['message_bytes'], 0)
+        self.assertGreater(results['testcase']['per_call'], 0)
+        self.assertGreater(results['redirect_output']['per_call'], 0)
+        json.dumps(results)
+
+        # The same test cases are created each time
+        other = benchmark(n_threads=(1, ), n_groups=3, n_calls=1)
+        self.assertEqual(other['threads']['1']['n_testcases'],
+                         results['threads']['1']['n_testcases'])
+
+    def testSaveLoad(self):
+        self.assertEqual(load_benchmark(None), dict())
+        self.assertEqual(load_benchmark(self._filename), dict())
+
+        save_benchmark(self._filename, {'threads': {'1': {'per_testcase': 1.}}})
+        self.assertEqual(load_benchmark(self._filename), {'threads': {'1': {'per_testcase': 1.}}})
+        self.assertEqual(os.listdir(self._tmpdir.name), ['benchmark.json'])
+
+        with open(self._filename, 'w') as fid:
+            fid.write('not json')
+        with self.assertLogs(level='WARNING') as log:
+            self.assertEqual(load_benchmark(self._filename), dict())
+        self.assertIn("Failed to read the benchmark file", log.output[0])
+
+        with mock.patch('os.replace', side_effect=OSError()), \
+             self.assertLogs(level='WARNING') as log:
+            save_benchmark(self._filename, dict())
+        self.assertIn("Failed to write the benchmark file", log.output[0])
+
+    def testCompare(self):
+        baseline = {
+            'cpu_count': 4,
+            'threads': {
+                '1': dict(per_testcase=0.01, throughput=100, max_rss_growth=0),
+                '8': dict(per_testcase=0.01, throughput=100)
+            },
+            'redirect_output': dict(per_call=0.001)
+        }
+        results = {
+            'cpu_count': 64,
+            'threads': {
+                '1': dict(per_testcase=0.012, throughput=10, max_rss_growth=1000),
+                '64': dict(per_testcase=1)
+            },
+            'redirect_output': dict(per_call=0.002)
+        }
+        self.assertEqual(compare_benchmark(baseline, baseline), [])
+        self.assertEqual(
+            compare_benchmark(results, baseline),
+            ["redirect_output.per_call: 0.002 exceeds the baseline of 0.001 by 100.0%"])
+        self.assertEqual(len(compare_benchmark(results, baseline, tolerance=0.1)), 2)
+
+    @mock.patch('moosetools.moosetest.benchmark.benchmark')
+    def testRunBenchmark(self, mock_benchmark):
+        mock_benchmark.return_value = {
+            'threads': {
+                '1':
+                dict(n_testcases=4,
+                     per_testcase=0.01,
+                     throughput=100,
+                     parent_cpu_per_testcase=0.001)
+            }
+        }
+        with mock.patch('sys.stdout', new_callable=io.StringIO) as stdout:
+            self.assertEqual(run_benchmark(self._filename, n_threads=(1, )), 0)
+        mock_benchmark.assert_called_once_with((1, ))
+        self.assertIn("The benchmark results were written", stdout.getvalue())
+        self.assertEqual(load_benchmark(self._filename), mock_benchmark.return_value)
+
+        baseline = os.path.join(self._tmpdir.name, 'baseline.json')
+        save_benchmark(baseline, {'threads': {'1': dict(per_testcase=0.01)}})
+        with mock.patch('sys.stdout', new_callable=io.StringIO) as stdout:
+            self.assertEqual(run_benchmark(self._filename, baseline), 0)
+        self.assertIn("No metrics exceed the baseline", stdout.getvalue())
+
+        save_benchmark(baseline, {'threads': {'1': dict(per_testcase=0.001)}})
+        with mock.patch('sys.stdout', new_callable=io.StringIO) as stdout:
+            self.assertEqual(run_benchmark(self._filename, baseline), 1)
+        self.assertIn("threads.1.per_testcase: 0.01 exceeds the baseline of 0.001 by 900.0%",
+                      stdout.getvalue())
+
+
+if __name__ == '__main__':
+    unittest.main(module=__name__, verbosity=2, buffer=True)
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+#* This file is part of MOOSETOOLS repository
+#* https://www.github.com/idaholab/moosetools
+#*
+#* All rights reserved, see COPYRIGHT for full restrictions
+#* https://github.com/idaholab/moosetools/blob/main/COPYRIGHT
+#*
+#* Licensed under LGPL 2.1, please see LICENSE for details
+#* https://www.gnu.org/licenses/lgpl-2.1.html
+
+import os
+import sys
+import json
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from moosetools.moosetest.base import make_runner, make_differ
+from moosetools.moosetest.runners import RunCommand
+from moosetools.moosetest.base import FileDiffer, RunnerSpec
+from moosetools.moosetest.cache import compute_key, load_cache, save_cache, referenced_files
+
+# I do not want the tests directory to be packages with __init__.py, so load from file
+sys.path.append(os.path.join(os.path.dirname(__file__)))
+from _helpers import TestRunner, TestDiffer, TestController
+
+
+class TestCache(unittest.TestCase):
+    def setUp(self):
+        self._tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmpdir.cleanup)
+        self._filename = os.path.join(self._tmpdir.name, 'cache.json')
+
+    def testComputeKey(self):
+        r0 = make_runner(TestRunner, name='a')
+        key = compute_key(r0)
+        self.assertEqual(compute_key(make_runner(TestRunner, name='a')), key)
+        self.assertNotEqual(compute_key(make_runner(TestRunner, name='a', sleep=1)), key)
+        self.assertNotEqual(compute_key(make_runner(TestRunner, name='b')), key)
+
+        # Differ parameters
+        d = make_differ(TestDiffer, name='d')
+        key_d = compute_key(make_runner(TestRunner, name='a', differs=(d, )))
+        self.assertNotEqual(key_d, key)
+        d.setValue('error', True)
+        self.assertNotEqual(compute_key(make_runner(TestRunner, name='a', differs=(d, ))), key_d)
+
+        # Controller objects and values without a stable repr
+        c0 = TestController(object_name=object())
+        c1 = TestController(object_name=object())
+        self.assertEqual(compute_key(make_runner(TestRunner, (c0, ), name='a')),
+                         compute_key(make_runner(TestRunner, (c1, ), name='a')))
+        self.assertNotEqual(
+            compute_key(make_runner(TestRunner, (c0, ), name='a')),
+            compute_key(make_runner(TestRunner, (c0, ), name='a', ctrl_platform=('Linux', ))))
+
+        # Referenced file, relative to 'file_base'
+        filename = os.path.join(self._tmpdir.name, 'input.i')
+        with open(filename, 'w') as fid:
+            fid.write('content')
+        r1 = make_runner(RunCommand, name='a', command=('cat', 'input.i'))
+        r1.parameters().setValue('file', 'base', self._tmpdir.name)
+        key = compute_key(r1)
+        with open(filename, 'w') as fid:
+            fid.write('other content')
+        self.assertNotEqual(compute_key(r1), key)
+
+        # Executable in command
+        exe = os.path.join(self._tmpdir.name, 'app-opt')
+        with open(exe, 'w') as fid:
+            fid.write('#!/bin/bash')
+        os.chmod(exe, 0o755)
+        r2 = make_runner(RunCommand, name='a', command=('app-opt', ))
+        with mock.patch('shutil.which', return_value=exe):
+            key = compute_key(r2)
+            os.utime(exe, (1, 1))
+            self.assertNotEqual(compute_key(r2), key)
+
+    def testComputeKeySpec(self):
+        d = RunnerSpec(TestDiffer, dict(name='d', stdout=True), 'Tests/r/d', 'tests', 5, tuple())
+        spec = RunnerSpec(TestRunner, dict(name='a', ctrl_platform=('Linux', )), 'Tests/r', 'tests',
+                          2, (d, ))
+        controllers = (TestController(), )
+        with mock.patch.object(RunnerSpec, 'create', side_effect=AssertionError):
+            key = compute_key(spec, controllers)
+            files = referenced_files(spec, controllers)
+        self.assertEqual(key, compute_key(spec.create(controllers)))
+        self.assertEqual(files, referenced_files(spec.create(controllers)))
+        self.assertNotEqual(key, compute_key(spec._replace(differs=tuple()), controllers))
+
+    def testOutputFiles(self):
+        r = make_runner(RunCommand, name='a', command=('true', ))
+        r.parameters().setValue('file', 'base', self._tmpdir.name)
+        r.parameters().setValue('file', 'names', ('out.txt', ))
+        key = compute_key(r)
+        with open(os.path.join(self._tmpdir.name, 'out.txt'), 'w') as fid:
+            fid.write('content')
+        self.assertEqual(compute_key(r), key)
+
+    def testReferencedFiles(self):
+        base = self._tmpdir.name
+        for name in ('input.i', 'out.csv', os.path.join('gold', 'out.csv')):
+            os.makedirs(os.path.dirname(os.path.join(base, name)), exist_ok=True)
+            with open(os.path.join(base, name), 'w') as fid:
+                fid.write('content')
+
+        d = make_differ(FileDiffer, name='d')
+        d.parameters().setValue('file', 'names', ('out.csv', ))
+        r = make_runner(RunCommand, name='a', command=('cat', 'input.i'), differs=(d, ))
+        r.parameters().setValue('file', 'base', base)
+        d.parameters().setValue('file', 'base', base)
+        files = referenced_files(r)
+        self.assertIn(os.path.join(base, 'input.i'), files)
+        self.assertIn(os.path.join(base, 'gold', 'out.csv'), files)
+        self.assertIn(shutil.which('cat'), files)
+        self.assertNotIn(os.path.join(base, 'out.csv'), files)
+
+    def testLoadSave(self):
+        self.assertEqual(load_cache(None), dict())
+        self.assertEqual(load_cache(self._filename), dict())
+
+        save_cache(self._filename, {'a': 1, 'b': 3, 'c': 2}, 2)
+        self.assertEqual(load_cache(self._filename), {'b': 3, 'c': 2})
+
+        with open(self._filename, 'w') as fid:
+            fid.write('not json')
+        with self.assertLogs(level='WARNING') as log:
+            self.assertEqual(load_cache(self._filename), dict())
+        self.assertIn("Failed to read the result cache", log.output[0])
+
+        with mock.patch('os.replace', side_effect=OSError()), \
+             self.assertLogs(level='WARNING') as log:
+            save_cache(self._filename, dict(), 2)
+        self.assertIn("Failed to write the result cache", log.output[0])
+
+
+if __name__ == '__main__':
+    unittest.main(module=__name__, verbosity=2, buffer=True)
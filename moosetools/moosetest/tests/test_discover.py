@@ -15,13 +15,19 @@ from unittest import mock
 import queue
 import platform
 import uuid
+import tempfile
 import logging
+import threading
 import concurrent.futures
 
 from moosetools import pyhit
+from moosetools import factory
 from moosetools.parameters import InputParameters
 from moosetools.moosetest import discover
 from moosetools.moosetest.discover import MooseTestFactory, MooseTestWarehouse, _create_runners
+from moosetools.moosetest.discover import iter_spec_files, find_spec_files, spec_file_order
+from moosetools.moosetest.base import RunnerSpec
+from moosetools.moosetest.cache import compute_key
 
 # I do not want the tests directory to be packages with __init__.py, so load from file
 sys.path.append(os.path.join(os.path.dirname(__file__)))
@@ -129,6 +135,151 @@ class TestCreateRunners(unittest.TestCase):
         self.assertEqual(differs[1].name(), 'diff1-1')
 
 
+class TestSpecFiles(unittest.TestCase):
+    def setUp(self):
+        self._tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmpdir.cleanup)
+        self._start = self._tmpdir.name
+        for path in ('tests', 'b/tests', 'a/tests', 'a/c/tests', 'a/other', 'build/tests',
+                     '.git/tests', 'sub/tests', 'nested/repo/tests'):
+            filename = os.path.join(self._start, path)
+            os.makedirs(os.path.dirname(filename), exist_ok=True)
+            with open(filename, 'w') as fid:
+                fid.write('')
+
+        with open(os.path.join(self._start, 'sub', '.git'), 'w') as fid:
+            fid.write('gitdir: ../.git/modules/sub')
+        os.makedirs(os.path.join(self._start, 'nested', 'repo', '.git'))
+        os.symlink(self._start, os.path.join(self._start, 'a', 'loop'))
+
+    def relative(self, files):
+        return [os.path.relpath(f, self._start) for f in files]
+
+    def testIterSpecFiles(self):
+        files = iter_spec_files(self._start, ['tests'])
+        self.assertFalse(isinstance(files, list))
+        self.assertEqual(sorted(self.relative(files)),
+                         ['a/c/tests', 'a/tests', 'b/tests', 'build/tests', 'tests'])
+
+        files = iter_spec_files(self._start, ['tests', 'other'],
+                                ignore_patterns=('build', 'a/c'),
+                                prune_submodules=False,
+                                n_threads=2)
+        self.assertEqual(sorted(self.relative(files)), [
+            '.git/tests', 'a/other', 'a/tests', 'b/tests', 'nested/repo/tests', 'sub/tests', 'tests'
+        ])
+
+        self.assertEqual(list(iter_spec_files(os.path.join(self._start, 'missing'), ['tests'])), [])
+
+    def testFindSpecFiles(self):
+        files = find_spec_files(self._start, ['tests'], ignore_patterns=('.git', 'build'))
+        self.assertEqual(self.relative(files), ['tests', 'a/tests', 'a/c/tests', 'b/tests'])
+        self.assertLess(spec_file_order(self._start, os.path.join(self._start, 'z', 'tests')),
+                        spec_file_order(self._start, os.path.join(self._start, 'z', 'a', 'tests')))
+
+
+class TestSelectBlocks(unittest.TestCase):
+    SPEC = """[Tests]
+  [a]
+    type = RunCommand
+    command = 'true'
+    tags = 'fast heavy'
+  []
+  [b]
+    type = RunCommand
+    command = 'true'
+    [diff]
+      type = ConsoleDiffer
+      text_in_stdout = 'b'
+    []
+  []
+  [group]
+    [c]
+      type = RunCommand
+      command = 'true'
+      depends_on = 'b'
+      tags = fast
+    []
+  []
+[]
+"""
+
+    def setUp(self):
+        self._tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmpdir.cleanup)
+        self._start = self._tmpdir.name
+        for path in ('tests', 'sub/tests'):
+            filename = os.path.join(self._start, path)
+            os.makedirs(os.path.dirname(filename), exist_ok=True)
+            with open(filename, 'w') as fid:
+                fid.write(self.SPEC)
+
+    def names(self, groups):
+        return [[r.name() for r in runners] for runners in groups]
+
+    def testPattern(self):
+        # The previous block, which 'b' depends upon by default, is included
+        groups = discover(self._start, ['tests'], ['Tests'], pattern='Tests/b$')
+        self.assertEqual(
+            self.names(groups),
+            [['tests:Tests/a', 'tests:Tests/b'], ['sub/tests:Tests/a', 'sub/tests:Tests/b']])
+        self.assertEqual([d.name() for d in groups[0][1].getParam('differs')], ['diff'])
+
+        groups = discover(self._start, ['tests'], ['Tests'], pattern='^sub/.*/a')
+        self.assertEqual(self.names(groups), [[], ['sub/tests:Tests/a']])
+
+    def testTags(self):
+        # The dependency of 'c' is included
+        groups = discover(self._start, ['tests'], ['Tests'], tags=('fast', ), lazy=True)
+        self.assertEqual(self.names(groups),
+                         [['tests:Tests/a', 'tests:Tests/b', 'tests:Tests/group/c'],
+                          ['sub/tests:Tests/a', 'sub/tests:Tests/b', 'sub/tests:Tests/group/c']])
+
+        groups = discover(self._start, ['tests'], ['Tests'],
+                          tags=('heavy', 'other'),
+                          pattern='^tests')
+        self.assertEqual(self.names(groups), [['tests:Tests/a'], []])
+
+    def testImplicitDependency(self):
+        filename = os.path.join(self._start, 'chain', 'tests')
+        os.makedirs(os.path.dirname(filename))
+        with open(filename, 'w') as fid:
+            fid.write("[Tests]\n")
+            for name, depends_on in [('a', None), ('b', None), ('c', ''), ('d', None), ('e', None)]:
+                fid.write(f"  [{name}]\n    type = RunCommand\n    command = 'true'\n")
+                if depends_on is not None:
+                    fid.write(f"    depends_on = '{depends_on}'\n")
+                fid.write("  []\n")
+            fid.write("[]\n")
+
+        start = os.path.dirname(filename)
+        groups = discover(start, ['tests'], ['Tests'], pattern='Tests/b$')
+        self.assertEqual(self.names(groups), [['tests:Tests/a', 'tests:Tests/b']])
+        groups = discover(start, ['tests'], ['Tests'], pattern='Tests/e$')
+        self.assertEqual(self.names(groups), [['tests:Tests/c', 'tests:Tests/d', 'tests:Tests/e']])
+        groups = discover(start, ['tests'], ['Tests'], pattern='Tests/c$')
+        self.assertEqual(self.names(groups), [['tests:Tests/c']])
+
+    def testPaths(self):
+        groups = discover(self._start, ['tests'], ['Tests'],
+                          paths=(os.path.join(self._start, 'sub'), ))
+        self.assertEqual(self.names(groups),
+                         [['sub/tests:Tests/a', 'sub/tests:Tests/b', 'sub/tests:Tests/group/c']])
+
+        groups = discover(self._start, ['tests'], ['Tests'],
+                          paths=(os.path.join(self._start, 'tests'), ))
+        self.assertEqual(self.names(groups),
+                         [['tests:Tests/a', 'tests:Tests/b', 'tests:Tests/group/c']])
+
+    def testNotParsed(self):
+        with mock.patch('moosetools.factory.Parser._parseNode',
+                        autospec=True,
+                        side_effect=factory.Parser._parseNode) as parse_node:
+            discover(self._start, ['tests'], ['Tests'], pattern='Tests/a')
+        self.assertEqual(sorted(c[0][2].fullpath for c in parse_node.call_args_list),
+                         ['/Tests/a', '/Tests/a'])
+
+
 class TestDiscover(unittest.TestCase):
     def test(self):
 
@@ -153,6 +304,77 @@ class TestDiscover(unittest.TestCase):
             discover(start, ['tests'], ['Tests'], plugin_dirs)
         self.assertIn('Errors occurred during parsing', str(ex.exception))
 
+    def testProcesses(self):
+
+        start = os.path.abspath(os.path.join(os.path.dirname(__file__), 'demo'))
+        plugin_dirs = [os.path.abspath(os.path.join(os.path.dirname(__file__), 'demo', 'plugins'))]
+        controllers = (TestController(), )
+
+        expected = discover(start, ['tests'], ['Tests'], plugin_dirs, controllers)
+
+        # The threads searching for files must finish prior to forking the processes
+        threads = set()
+
+        class ProcessPoolExecutor(concurrent.futures.ProcessPoolExecutor):
+            def submit(self, *args, **kwargs):
+                threads.update(t.name for t in threading.enumerate()
+                               if t.name.startswith('ThreadPoolExecutor'))
+                return super().submit(*args, **kwargs)
+
+        with mock.patch('concurrent.futures.ProcessPoolExecutor', ProcessPoolExecutor):
+            groups = discover(start, ['tests'], ['Tests'],
+                              plugin_dirs,
+                              controllers,
+                              n_threads=2,
+                              processes=True)
+        self.assertEqual(threads, set())
+        self.assertEqual([[r.name() for r in runners] for runners in groups],
+                         [[r.name() for r in runners] for runners in expected])
+        for runners in groups:
+            for runner in runners:
+                self.assertIs(runner.getParam('_controllers')[0], controllers[0])
+                for differ in runner.getParam('differs') or tuple():
+                    self.assertIs(differ.getParam('_controllers')[0], controllers[0])
+
+    def testLazy(self):
+
+        start = os.path.abspath(os.path.join(os.path.dirname(__file__), 'demo'))
+        plugin_dirs = [os.path.abspath(os.path.join(os.path.dirname(__file__), 'demo', 'plugins'))]
+        controllers = (TestController(), )
+
+        expected = discover(start, ['tests'], ['Tests'], plugin_dirs, controllers)
+        for kwargs in [dict(), dict(processes=True, n_threads=2)]:
+            groups = discover(start, ['tests'], ['Tests'],
+                              plugin_dirs,
+                              controllers,
+                              lazy=True,
+                              **kwargs)
+            self.assertEqual(len(groups), len(expected))
+            for specs, runners in zip(groups, expected):
+                self.assertEqual([s.name() for s in specs], [r.name() for r in runners])
+                for spec, runner in zip(specs, runners):
+                    self.assertIsInstance(spec, RunnerSpec)
+                    self.assertEqual(spec.getSlots(), runner.getSlots())
+                    obj = spec.create(controllers)
+                    self.assertIs(type(obj), type(runner))
+                    self.assertEqual(compute_key(obj), compute_key(runner))
+                    self.assertEqual(obj.getParam('_hit_filename'),
+                                     runner.getParam('_hit_filename'))
+
+        spec = groups[0][2]
+        self.assertEqual(spec.line, 11)
+        self.assertEqual(spec.hit_path, '/Tests/group/runner1')
+        self.assertEqual([d.name() for d in spec.differs], ['diff'])
+
+    @mock.patch('moosetools.factory.Parser.status', return_value=1)
+    def testLazyRuntimeError(self, mock_status):
+
+        start = os.path.abspath(os.path.join(os.path.dirname(__file__), 'demo'))
+        plugin_dirs = [os.path.abspath(os.path.join(os.path.dirname(__file__), 'demo', 'plugins'))]
+        with self.assertRaises(RuntimeError) as ex:
+            discover(start, ['tests'], ['Tests'], plugin_dirs, lazy=True)
+        self.assertIn('Errors occurred during parsing', str(ex.exception))
+
 
 if __name__ == '__main__':
     unittest.main(module=__name__, verbosity=2, buffer=True)
@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+#* This file is part of MOOSETOOLS repository
+#* https://www.github.com/idaholab/moosetools
+#*
+#* All rights reserved, see COPYRIGHT for full restrictions
+#* https://github.com/idaholab/moosetools/blob/main/COPYRIGHT
+#*
+#* Licensed under LGPL 2.1, please see LICENSE for details
+#* https://www.gnu.org/licenses/lgpl-2.1.html
+
+import os
+import sys
+import time
+import queue
+import signal
+import socket
+import tempfile
+import unittest
+import multiprocessing
+from unittest import mock
+
+from moosetools.moosetest.base import make_runner, TestCase, Formatter
+from moosetools.moosetest import run
+from moosetools.moosetest.run import _execute_testcases
+from moosetools.moosetest.distributed import parse_address, serve, RemoteExecutor
+
+# I do not want the tests directory to be packages with __init__.py, so load from file
+sys.path.append(os.path.join(os.path.dirname(__file__)))
+from _helpers import TestRunner
+from moosetools.moosetest.runners import RunCommand
+
+AUTHKEY = b'moosetest'
+
+
+def start_agent(n_threads=2):
+    """Start a worker agent on a free port in a new process group and return the address."""
+    with socket.socket() as sock:
+        sock.bind(('localhost', 0))
+        port = sock.getsockname()[1]
+    address = f'localhost:{port}'
+
+    def target():
+        os.setpgrp()  # allows the agent and the processes it creates to be killed together
+        serve(address, n_threads, AUTHKEY)
+
+    proc = multiprocessing.get_context('fork').Process(target=target)
+    proc.start()
+    return address, proc
+
+
+def kill_agent(proc):
+    try:
+        os.killpg(proc.pid, signal.SIGKILL)
+    except ProcessLookupError:  # the process group has not been created
+        proc.kill()
+    proc.join()
+
+
+class TestDistributed(unittest.TestCase):
+    def setUp(self):
+        self._agents = dict()
+        for i in range(2):
+            address, proc = start_agent()
+            self._agents[address] = proc
+            self.addCleanup(kill_agent, proc)
+
+    def testParseAddress(self):
+        self.assertEqual(parse_address('host:1234'), ('host', 1234))
+        self.assertEqual(parse_address(':1234'), ('localhost', 1234))
+        self.assertEqual(parse_address('1234'), ('localhost', 1234))
+        with self.assertRaises(ValueError) as ex:
+            parse_address('host')
+        self.assertIn("The address 'host' must be in the form 'host:port'.", str(ex.exception))
+
+    def testConnectError(self):
+        with self.assertRaises(RuntimeError) as ex:
+            RemoteExecutor(['localhost:1'], AUTHKEY, connect_timeout=0)
+        self.assertIn("Unable to connect to the worker at 'localhost:1'.", str(ex.exception))
+
+    def testAuthKey(self):
+        for authkey in (None, b''):
+            with self.assertRaises(RuntimeError) as ex:
+                RemoteExecutor(list(self._agents.keys()), authkey)
+            self.assertIn("An authentication key is required", str(ex.exception))
+
+            with mock.patch('moosetools.moosetest.distributed.Listener') as listener, \
+                 self.assertRaises(RuntimeError) as ex:
+                serve('localhost:1', 1, authkey)
+            listener.assert_not_called()
+            self.assertIn("An authentication key is required", str(ex.exception))
+
+    @mock.patch('moosetools.moosetest.base.Formatter.formatComplete')
+    @mock.patch('moosetools.moosetest.base.Formatter.formatRunnerResult')
+    @mock.patch('moosetools.moosetest.base.Formatter.formatRunnerState')
+    def testRun(self, r_state, r_results, complete):
+        groups = list()
+        for i in range(4):
+            groups.append([make_runner(TestRunner, name=f'g{i}/r{j}', sleep=0.1) for j in range(2)])
+        groups[3][0].setValue('error', True)
+
+        rcode = run(groups,
+                    tuple(),
+                    Formatter(),
+                    workers=list(self._agents.keys()),
+                    authkey=AUTHKEY)
+        self.assertEqual(rcode, 1)
+        self.assertEqual(r_results.call_count, 8)
+
+        calls = {call[1]['name']: call[1] for call in r_results.call_args_list}
+        for i in range(3):
+            for j in range(2):
+                self.assertEqual(calls[f'g{i}/r{j}']['state'], TestCase.Result.PASS)
+                self.assertEqual(calls[f'g{i}/r{j}']['returncode'], 2011)
+        self.assertEqual(calls['g3/r0']['state'], TestCase.Result.ERROR)
+        self.assertEqual(calls['g3/r1']['state'], TestCase.Result.SKIP)
+        self.assertIn("A previous test case (g3/r0)", calls['g3/r1']['stderr'])
+
+    def testSlots(self):
+        executor = RemoteExecutor(list(self._agents.keys()), AUTHKEY)
+        result_queue = queue.Queue()
+
+        # Each agent has two workers, so one group requiring two slots executes on each
+        futures = list()
+        for name, n_procs in [('a', 2), ('b', 2), ('c', 2), ('d', 1), ('e', 4)]:
+            runner = make_runner(TestRunner, name=name, n_procs=n_procs, sleep=0.5)
+            futures.append(
+                executor.submit(_execute_testcases, [TestCase(runner=runner)], result_queue, None))
+        self.assertEqual([len(w.jobs) for w in executor._workers], [1, 1])
+        self.assertEqual([w.available() for w in executor._workers], [0, 0])
+        self.assertEqual([job.testcases[0].name() for job in executor._pending], ['c', 'd', 'e'])
+
+        for future in futures:
+            self.assertIsNone(future.result(timeout=20))
+        executor.shutdown()
+
+    def testFastReply(self):
+        executor = RemoteExecutor(list(self._agents.keys()), AUTHKEY)
+        result_queue = queue.Queue()
+
+        # Delay the return from sending, so the agent replies before the dispatch completes
+        class DelayedConnection(object):
+            def __init__(self, conn):
+                self._conn = conn
+
+            def send(self, message):
+                self._conn.send(message)
+                if message[0] == 'submit':
+                    time.sleep(1)
+
+            def __getattr__(self, name):
+                return getattr(self._conn, name)
+
+        for worker in executor._workers:
+            worker.conn = DelayedConnection(worker.conn)
+
+        tc = TestCase(runner=make_runner(TestRunner, name='r0'))
+        future = executor.submit(_execute_testcases, [tc], result_queue, None)
+        self.assertIsNone(future.result(timeout=20))
+        messages = [result_queue.get(timeout=1) for i in range(2)]
+        self.assertEqual(messages[0][1], TestCase.Progress.RUNNING)
+        self.assertEqual(messages[1][1], TestCase.Progress.FINISHED)
+        self.assertEqual(messages[1][2], TestCase.Result.PASS)
+        executor.shutdown()
+
+    def testOutputFiles(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with mock.patch.object(tempfile, 'tempdir', tmpdir):  # the agent inherits on fork
+                address, proc = start_agent()
+            self.addCleanup(kill_agent, proc)
+
+            executor = RemoteExecutor([address], AUTHKEY)
+            result_queue = queue.Queue()
+            runner = make_runner(RunCommand,
+                                 name='r0',
+                                 command=('bash', '-c', 'printf "a%.0s" {1..200}'),
+                                 max_output=100)
+            tc = TestCase(runner=runner)
+            future = executor.submit(_execute_testcases, [tc], result_queue, None)
+            self.assertIsNone(future.result(timeout=20))
+            executor.shutdown()
+
+            # The results do not refer to the files on the agent, which are removed
+            messages = [result_queue.get(timeout=1) for i in range(2)]
+            self.assertEqual(messages[1][3]['r0'].reasons, ["100 bytes of sys.stdout omitted"])
+            for i in range(50):
+                if not os.listdir(tmpdir):
+                    break
+                time.sleep(0.1)
+            self.assertEqual(os.listdir(tmpdir), [])
+
+    def testWorkerLost(self):
+        executor = RemoteExecutor(list(self._agents.keys()), AUTHKEY, heartbeat_timeout=3)
+        result_queue = queue.Queue()
+        testcases = [TestCase(runner=make_runner(TestRunner, name='r0', sleep=0.5))]
+        testcases.append(TestCase(runner=make_runner(TestRunner, name='r1', sleep=5)))
+        future = executor.submit(_execute_testcases, testcases, result_queue, None)
+
+        # Kill the agent while the second test case is running
+        messages = [result_queue.get(timeout=10) for i in range(3)]
+        self.assertEqual(messages[1][1], TestCase.Progress.FINISHED)
+        self.assertEqual(messages[2][1], TestCase.Progress.RUNNING)
+        worker = [w for w in executor._workers if w.jobs][0]
+        with self.assertLogs(level='WARNING') as log:
+            kill_agent(self._agents[worker.address])
+            self.assertIsNone(future.result(timeout=20))
+        self.assertIn(f"The connection to the worker '{worker.address}' was lost", log.output[0])
+
+        # Only the test case that did not finish is executed again
+        messages = [result_queue.get(timeout=1) for i in range(2)]
+        self.assertEqual(messages[0][0], testcases[1].unique_id)
+        self.assertEqual(messages[0][1], TestCase.Progress.RUNNING)
+        self.assertEqual(messages[1][0], testcases[1].unique_id)
+        self.assertEqual(messages[1][1], TestCase.Progress.FINISHED)
+        self.assertEqual(messages[1][2], TestCase.Result.PASS)
+        self.assertTrue(result_queue.empty())
+
+        # All workers lost
+        with self.assertLogs(level='WARNING'):
+            for proc in self._agents.values():
+                kill_agent(proc)
+            future = executor.submit(_execute_testcases, testcases, result_queue, None)
+            with self.assertRaises(RuntimeError) as ex:
+                future.result(timeout=20)
+        self.assertIn("The connection to all of the workers was lost.", str(ex.exception))
+        executor.shutdown()
+
+    def testWorkerStalled(self):
+        executor = RemoteExecutor(list(self._agents.keys()), AUTHKEY, heartbeat_timeout=3)
+        result_queue = queue.Queue()
+        testcases = [TestCase(runner=make_runner(TestRunner, name='r0', sleep=0.5))]
+        testcases.append(TestCase(runner=make_runner(TestRunner, name='r1', sleep=2)))
+        testcases.append(TestCase(runner=make_runner(TestRunner, name='r2')))
+        future = executor.submit(_execute_testcases, testcases, result_queue, None)
+
+        # Stop (rather than kill) the agent while the second test case is running
+        messages = [result_queue.get(timeout=10) for i in range(3)]
+        self.assertEqual(messages[2][1], TestCase.Progress.RUNNING)
+        worker = [w for w in executor._workers if w.jobs][0]
+        pid = self._agents[worker.address].pid
+        with self.assertLogs(level='WARNING') as log:
+            os.killpg(pid, signal.SIGSTOP)
+            self.assertIsNone(future.result(timeout=20))
+        self.assertIn(f"The worker '{worker.address}' did not respond", log.output[0])
+
+        # The unfinished test cases are reported, rather than executed again
+        for tc in testcases[1:]:
+            unique_id, progress, state, results = result_queue.get(timeout=1)
+            self.assertEqual(unique_id, tc.unique_id)
+            self.assertEqual(state, TestCase.Result.FATAL)
+            self.assertEqual(results[tc.name()].reasons, ['worker lost'])
+        self.assertTrue(result_queue.empty())
+
+        # The agent resumes and completes, the messages are not received
+        os.killpg(pid, signal.SIGCONT)
+        time.sleep(3)
+        self.assertTrue(result_queue.empty())
+        self.assertTrue(all(w.alive for w in executor._workers if w is not worker))
+        executor.shutdown()
+
+
+if __name__ == '__main__':
+    unittest.main(module=__name__, verbosity=2, buffer=True)
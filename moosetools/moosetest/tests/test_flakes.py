@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+#* This file is part of MOOSETOOLS repository
+#* https://www.github.com/idaholab/moosetools
+#*
+#* All rights reserved, see COPYRIGHT for full restrictions
+#* https://github.com/idaholab/moosetools/blob/main/COPYRIGHT
+#*
+#* Licensed under LGPL 2.1, please see LICENSE for details
+#* https://www.gnu.org/licenses/lgpl-2.1.html
+
+import os
+import sys
+import json
+import tempfile
+import unittest
+from unittest import mock
+
+from moosetools.moosetest.base import make_runner, TestCase
+from moosetools.moosetest.flakes import load_flakes, save_flakes, attempts, flake_rate, sort_flaky
+
+# I do not want the tests directory to be packages with __init__.py, so load from file
+sys.path.append(os.path.join(os.path.dirname(__file__)))
+from _helpers import TestRunner
+
+
+def make_testcase(name, state, n_attempts=None):
+    tc = TestCase(runner=make_runner(TestRunner, name=name))
+    tc.setProgress(TestCase.Progress.RUNNING)
+    tc.setProgress(TestCase.Progress.FINISHED)
+    tc.setState(state)
+    tc.setResults({name: TestCase.Data(state, 0, '', '', None, attempts=n_attempts)})
+    return tc
+
+
+class TestFlakes(unittest.TestCase):
+    def setUp(self):
+        self._tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmpdir.cleanup)
+        self._filename = os.path.join(self._tmpdir.name, 'flakes.json')
+
+    def testLoad(self):
+        self.assertEqual(load_flakes(None), dict())
+        self.assertEqual(load_flakes(self._filename), dict())
+
+        with open(self._filename, 'w') as fid:
+            json.dump({'a': dict(runs=2, flakes=1)}, fid)
+        self.assertEqual(load_flakes(self._filename), {'a': dict(runs=2, flakes=1)})
+
+        with open(self._filename, 'w') as fid:
+            fid.write('not json')
+        with self.assertLogs(level='WARNING') as log:
+            self.assertEqual(load_flakes(self._filename), dict())
+        self.assertIn("Failed to read the flake database", log.output[0])
+
+    def testSave(self):
+        tc0 = make_testcase('a', TestCase.Result.PASS)
+        tc1 = make_testcase('b', TestCase.Result.PASS, 2)
+        tc2 = make_testcase('c', TestCase.Result.SKIP)
+        tc3 = make_testcase('e', TestCase.Result.DIFF, 3)
+        self.assertEqual(attempts(tc0), 1)
+        self.assertEqual(attempts(tc1), 2)
+
+        flakes = {'b': dict(runs=3, flakes=0), 'd': dict(runs=1, flakes=1)}
+        save_flakes(self._filename, [tc0, tc1, tc2, tc3], flakes)
+        self.assertEqual(flakes['b'], dict(runs=3, flakes=0))  # not modified
+        self.assertEqual(
+            load_flakes(self._filename), {
+                'a': dict(runs=1, flakes=0),
+                'b': dict(runs=4, flakes=1),
+                'd': dict(runs=1, flakes=1),
+                'e': dict(runs=1, flakes=0)
+            })
+        self.assertEqual(os.listdir(self._tmpdir.name), ['flakes.json'])
+
+        with mock.patch('os.replace', side_effect=OSError()), \
+             self.assertLogs(level='WARNING') as log:
+            save_flakes(self._filename, [tc0])
+        self.assertIn("Failed to write the flake database", log.output[0])
+
+    def testSort(self):
+        g0 = [make_runner(TestRunner, name='a')]
+        g1 = [make_runner(TestRunner, name='b'), make_runner(TestRunner, name='c')]
+        g2 = [make_runner(TestRunner, name='d')]
+        flakes = {'a': dict(runs=100, flakes=1), 'c': dict(runs=10, flakes=1), 'd': dict(runs=0)}
+
+        self.assertEqual(flake_rate('a', flakes), 0.01)
+        self.assertEqual(flake_rate('c', flakes), 0.1)
+        self.assertEqual(flake_rate('d', flakes), 0)
+        self.assertEqual(flake_rate('e', flakes), 0)
+        self.assertEqual(sort_flaky([g0, g1, g2], flakes), [g1, g0, g2])
+        self.assertEqual(sort_flaky([g0, g1, g2], dict()), [g0, g1, g2])
+
+
+if __name__ == '__main__':
+    unittest.main(module=__name__, verbosity=2, buffer=True)
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+#* This file is part of MOOSETOOLS repository
+#* https://www.github.com/idaholab/moosetools
+#*
+#* All rights reserved, see COPYRIGHT for full restrictions
+#* https://github.com/idaholab/moosetools/blob/main/COPYRIGHT
+#*
+#* Licensed under LGPL 2.1, please see LICENSE for details
+#* https://www.gnu.org/licenses/lgpl-2.1.html
+
+import os
+import sys
+import inspect
+import tempfile
+import unittest
+from unittest import mock
+
+from moosetools.moosetest import discover
+from moosetools.moosetest.base import RunnerSpec
+from moosetools.moosetest.differs import ConsoleDiffer
+from moosetools.moosetest.impact import dependency_index, select_groups
+
+SPEC = """
+[Tests]
+  [{name}]
+    type = RunCommand
+    command = 'cat {input}'
+  []
+[]
+"""
+
+
+class TestImpact(unittest.TestCase):
+    def setUp(self):
+        self._tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmpdir.cleanup)
+        self._root = os.path.realpath(self._tmpdir.name)
+
+        for name in ('a', 'b'):
+            os.makedirs(os.path.join(self._root, name))
+            with open(os.path.join(self._root, name, 'input.txt'), 'w') as fid:
+                fid.write(name)
+            with open(os.path.join(self._root, name, 'tests'), 'w') as fid:
+                fid.write(SPEC.format(name=name, input='input.txt'))
+
+        groups = discover(self._root, ('tests', ), ('Tests', ))
+        self._groups = sorted(groups, key=lambda g: g[0].name())
+
+    def path(self, *args):
+        return os.path.join(self._root, *args)
+
+    def testDependencyIndex(self):
+        files, dirs = dependency_index(self._groups)
+        self.assertEqual(files[self.path('a', 'tests')], {0})
+        self.assertEqual(files[self.path('a', 'input.txt')], {0})
+        self.assertEqual(files[self.path('b', 'input.txt')], {1})
+        runner_file = os.path.realpath(inspect.getsourcefile(type(self._groups[0][0])))
+        self.assertEqual(files[runner_file], {0, 1})
+        self.assertEqual(dirs[self.path('b')], {1})
+
+    def testDependencyIndexSpec(self):
+        groups = discover(self._root, ('tests', ), ('Tests', ), lazy=True)
+        groups = sorted(groups, key=lambda g: g[0].name())
+        self.assertIsInstance(groups[0][0], RunnerSpec)
+        with mock.patch.object(RunnerSpec, 'create', side_effect=AssertionError):
+            self.assertEqual(dependency_index(groups), dependency_index(self._groups))
+
+    def testSelectGroups(self):
+        a, b = self._groups
+        self.assertEqual(select_groups(self._groups, set()), ([], []))
+        self.assertEqual(select_groups(self._groups, {self.path('a', 'input.txt')}), ([a], []))
+        self.assertEqual(select_groups(self._groups, {self.path('b', 'tests')}), ([b], []))
+
+        # Files within the 'file_base', including removed files
+        self.assertEqual(select_groups(self._groups, {self.path('b', 'sub', 'gone.txt')}),
+                         ([b], []))
+
+        # Type definitions
+        runner_file = inspect.getsourcefile(type(a[0]))
+        self.assertEqual(select_groups(self._groups, {runner_file}), ([a, b], []))
+
+        # Unknown files run everything, unless ignored
+        other = self.path('README.md')
+        self.assertEqual(select_groups(self._groups, {other, self.path('a', 'tests')}),
+                         ([a, b], [other]))
+        self.assertEqual(select_groups(self._groups, {other, self.path('a', 'tests')}, ('*.md', )),
+                         ([a], []))
+
+
+if __name__ == '__main__':
+    unittest.main(module=__name__, verbosity=2, buffer=True)
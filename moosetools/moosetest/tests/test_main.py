@@ -12,14 +12,20 @@ import os
 import platform
 import sys
 import argparse
+import tempfile
 import unittest
 from unittest import mock
 
 from moosetools import pyhit
 from moosetools.moosetest import main
-from moosetools.moosetest.base import Controller, TestCase, RedirectOutput
-from moosetools.moosetest.main import TestHarness, make_harness, make_controllers, make_formatter, setup_environment, _locate_config, _load_config
+from moosetools.moosetest.base import Controller, TestCase, RedirectOutput, make_runner
+from moosetools.moosetest.runners import RunCommand
+from moosetools.moosetest.main import TestHarness, make_harness, make_controllers, make_formatter, setup_environment, _locate_config, _load_config, _shard_arg
+from moosetools.moosetest.main import cli_args
 from moosetools.moosetest.formatters import BasicFormatter
+from moosetools.moosetest.throttle import LoadThrottle
+from moosetools.moosetest.writers import JSONLinesWriter, JUnitWriter
+from moosetools.moosetest.watch import SpecWatcher
 
 
 class TestTestHarness(unittest.TestCase):
@@ -27,6 +33,46 @@ class TestTestHarness(unittest.TestCase):
         th = TestHarness()
         self.assertTrue(hasattr(th, 'applyCommandLineArguments'))
 
+    def testApplyCommandLineArguments(self):
+        th = TestHarness()
+        th.applyCommandLineArguments(argparse.Namespace())
+        self.assertFalse(th.getParam('force'))
+        th.applyCommandLineArguments(argparse.Namespace(force=True))
+        self.assertTrue(th.getParam('force'))
+
+        self.assertEqual(th.getParam('shard_index'), 1)
+        self.assertEqual(th.getParam('shard_count'), 1)
+        th.applyCommandLineArguments(argparse.Namespace(shard=(2, 3)))
+        self.assertEqual(th.getParam('shard_index'), 2)
+        self.assertEqual(th.getParam('shard_count'), 3)
+
+        th.applyCommandLineArguments(
+            argparse.Namespace(pattern='runner$', tags=['fast'], paths=['tests']))
+        self.assertEqual(th.getParam('pattern'), 'runner$')
+        self.assertEqual(th.getParam('tags'), ('fast', ))
+        self.assertEqual(th.getParam('paths'), (os.path.abspath('tests'), ))
+
+    def testCommandLineArguments(self):
+        # A path following the tags is not a tag
+        with mock.patch.object(sys, 'argv', ['moosetest', '--tags', 'fast', 'tests']):
+            args = cli_args()
+        self.assertEqual(args.tags, ['fast'])
+        self.assertEqual(args.paths, ['tests'])
+
+        argv = ['moosetest', '--tags', 'fast', '--tags', 'unit', 'tests', 'other']
+        with mock.patch.object(sys, 'argv', argv):
+            args = cli_args()
+        self.assertEqual(args.tags, ['fast', 'unit'])
+        self.assertEqual(args.paths, ['tests', 'other'])
+
+    def testShardArg(self):
+        self.assertEqual(_shard_arg('1/1'), (1, 1))
+        self.assertEqual(_shard_arg('2/4'), (2, 4))
+        for value in ('2', 'a/b', '0/2', '3/2', '1/2/3'):
+            with self.assertRaises(argparse.ArgumentTypeError) as ex:
+                _shard_arg(value)
+            self.assertIn(f"invalid value '{value}'", str(ex.exception))
+
 
 class TestMakeHarness(unittest.TestCase):
     def testDefault(self):
@@ -184,6 +230,215 @@ class TestMain(unittest.TestCase):
         rcode = main()
         self.assertEqual(rcode, 0)
 
+    def testShard(self):
+        config = os.path.join(os.path.dirname(__file__), 'demo', '.moosetest')
+        module = sys.modules['moosetools.moosetest.main']
+        g0 = [make_runner(RunCommand, name='a', command=('true', ))]
+        g1 = [make_runner(RunCommand, name='b', command=('true', ))]
+
+        args = argparse.Namespace(demo=False, config=config, shard=(2, 2))
+        with mock.patch('argparse.ArgumentParser.parse_args', return_value=args), \
+             mock.patch.object(module, 'discover', return_value=[g0, g1]), \
+             mock.patch.object(module, 'run', return_value=0) as mock_run, \
+             mock.patch.object(module, 'shard_summary', return_value='') as mock_summary:
+            rcode = main()
+        self.assertEqual(rcode, 0)
+        self.assertEqual(mock_run.call_args[0][0], [g1])
+        self.assertEqual(mock_summary.call_args[0][0], [[g0], [g1]])
+        self.assertEqual(mock_summary.call_args[0][2], 1)
+
+        args = argparse.Namespace(demo=False, config=config)
+        with mock.patch('argparse.ArgumentParser.parse_args', return_value=args), \
+             mock.patch.object(module, 'discover', return_value=[g0, g1]), \
+             mock.patch.object(module, 'run', return_value=0) as mock_run, \
+             mock.patch.object(module, 'shard_summary') as mock_summary:
+            rcode = main()
+        self.assertEqual(mock_run.call_args[0][0], [g0, g1])
+        mock_summary.assert_not_called()
+
+    def testWorker(self):
+        config = os.path.join(os.path.dirname(__file__), 'demo', '.moosetest')
+        module = sys.modules['moosetools.moosetest.main']
+        args = argparse.Namespace(demo=False, config=config, worker=True, listen='host:1234')
+        with mock.patch('argparse.ArgumentParser.parse_args', return_value=args), \
+             mock.patch.dict(os.environ, {'MOOSETEST_AUTHKEY': 'key'}), \
+             mock.patch.object(module, 'serve') as mock_serve, \
+             mock.patch.object(module, 'run') as mock_run:
+            main()
+        mock_run.assert_not_called()
+        self.assertEqual(mock_serve.call_args[0][0], 'host:1234')
+        self.assertEqual(mock_serve.call_args[0][2], b'key')
+
+        args = argparse.Namespace(demo=False, config=config, workers=['host:1234'])
+        with mock.patch('argparse.ArgumentParser.parse_args', return_value=args), \
+             mock.patch.dict(os.environ, {'MOOSETEST_AUTHKEY': 'key'}), \
+             mock.patch.object(module, 'run', return_value=0) as mock_run:
+            main()
+        self.assertEqual(mock_run.call_args[1]['workers'], ('host:1234', ))
+        self.assertEqual(mock_run.call_args[1]['authkey'], b'key')
+
+        # The authentication key is required
+        with mock.patch('argparse.ArgumentParser.parse_args', return_value=args), \
+             mock.patch.dict(os.environ, {'MOOSETEST_AUTHKEY': ''}), \
+             mock.patch.object(module, 'run', return_value=0) as mock_run:
+            with self.assertRaises(RuntimeError) as ex:
+                main()
+        mock_run.assert_not_called()
+        self.assertIn("An authentication key is required", str(ex.exception))
+
+    def testBenchmark(self):
+        module = sys.modules['moosetools.moosetest.main']
+        args = argparse.Namespace(demo=False,
+                                  benchmark='out.json',
+                                  baseline='base.json',
+                                  benchmark_threads=[1, 4])
+        with mock.patch('argparse.ArgumentParser.parse_args', return_value=args), \
+             mock.patch.object(module, 'run_benchmark', return_value=1) as mock_benchmark, \
+             mock.patch.object(module, 'run') as mock_run:
+            rcode = main()
+        self.assertEqual(rcode, 1)
+        mock_run.assert_not_called()
+        mock_benchmark.assert_called_once_with('out.json', 'base.json', [1, 4])
+
+    def testProfileHarness(self):
+        config = os.path.join(os.path.dirname(__file__), 'demo', '.moosetest')
+        module = sys.modules['moosetools.moosetest.main']
+        args = argparse.Namespace(demo=False, config=config, profile_harness=True)
+        with mock.patch('argparse.ArgumentParser.parse_args', return_value=args), \
+             mock.patch.object(module, 'run', return_value=0), \
+             RedirectOutput() as out:
+            main()
+        self.assertIn('Harness profile:', out.stdout)
+        for phase in ('_load_config', 'make_harness', 'make_controllers', 'discover', 'run'):
+            self.assertIn(f'  {phase} ', out.stdout)
+
+        args = argparse.Namespace(demo=False, config=config)
+        with mock.patch('argparse.ArgumentParser.parse_args', return_value=args), \
+             mock.patch.object(module, 'run', return_value=0), \
+             RedirectOutput() as out:
+            main()
+        self.assertNotIn('Harness profile:', out.stdout)
+
+    def testChangedSince(self):
+        config = os.path.join(os.path.dirname(__file__), 'demo', '.moosetest')
+        module = sys.modules['moosetools.moosetest.main']
+        spec = os.path.join(os.path.dirname(__file__), 'demo', 'tests', 'folder1', 'tests')
+        args = argparse.Namespace(demo=False, config=config, changed_since='HEAD~1')
+        with mock.patch('argparse.ArgumentParser.parse_args', return_value=args), \
+             mock.patch('moosetools.mooseutils.git_changed_files', return_value={spec}) as mock_git, \
+             mock.patch.object(module, 'run', return_value=0) as mock_run, \
+             RedirectOutput() as out:
+            main()
+        mock_git.assert_called_once_with('HEAD~1')
+        groups = mock_run.call_args[0][0]
+        self.assertEqual(len(groups), 1)
+        self.assertTrue(groups[0][0].name().endswith('folder1/tests:Tests/runner'))
+        self.assertIn("Executing 1 of", out.stdout)
+
+        other = os.path.join(os.path.dirname(__file__), 'other.txt')
+        with mock.patch('argparse.ArgumentParser.parse_args', return_value=args), \
+             mock.patch('moosetools.mooseutils.git_changed_files', return_value={spec, other}), \
+             mock.patch.object(module, 'run', return_value=0) as mock_run, \
+             RedirectOutput() as out:
+            main()
+        self.assertGreater(len(mock_run.call_args[0][0]), 1)
+        self.assertIn(f"Executing all tests, the changed file '{other}'", out.stdout)
+
+    def testSelect(self):
+        config = os.path.join(os.path.dirname(__file__), 'demo', '.moosetest')
+        module = sys.modules['moosetools.moosetest.main']
+        folder = os.path.join(os.path.dirname(__file__), 'demo', 'tests')
+        args = argparse.Namespace(demo=False, config=config, pattern='group', paths=[folder])
+        with mock.patch('argparse.ArgumentParser.parse_args', return_value=args), \
+             mock.patch.object(module, 'run', return_value=0) as mock_run:
+            main()
+        groups = [runners for runners in mock_run.call_args[0][0] if runners]
+        self.assertEqual(len(groups), 1)
+        self.assertEqual(len(groups[0]), 3)  # includes the implicit dependencies
+        self.assertTrue(groups[0][-1].name().endswith('tests/tests:Tests/group/runner1'))
+
+    def testWatch(self):
+        config = os.path.join(os.path.dirname(__file__), 'demo', '.moosetest')
+        module = sys.modules['moosetools.moosetest.main']
+        args = argparse.Namespace(demo=False, config=config, watch=True)
+        with mock.patch('argparse.ArgumentParser.parse_args', return_value=args), \
+             mock.patch.object(module, 'SpecWatcher', wraps=SpecWatcher) as mock_watcher, \
+             mock.patch.object(module, 'watch', return_value=0) as mock_watch, \
+             mock.patch.object(module, 'run') as mock_run:
+            main()
+        mock_run.assert_not_called()
+        self.assertIsInstance(mock_watch.call_args[0][0], SpecWatcher)
+        self.assertGreater(len(mock_watch.call_args[0][0].groups()), 0)
+
+        # The discovery options are used by the watcher
+        kwargs = mock_watcher.call_args[1]
+        self.assertFalse(kwargs['processes'])
+        self.assertFalse(kwargs['lazy'])
+        self.assertIn('cache_dir', kwargs)
+
+        args = argparse.Namespace(demo=False, config=config, watch=True, shard=(1, 2))
+        with mock.patch('argparse.ArgumentParser.parse_args', return_value=args), \
+             self.assertRaises(RuntimeError) as ex:
+            main()
+        self.assertIn("cannot be used with sharding", str(ex.exception))
+
+    def testWriters(self):
+        config = os.path.join(os.path.dirname(__file__), 'demo', '.moosetest')
+        module = sys.modules['moosetools.moosetest.main']
+        args = argparse.Namespace(demo=False, config=config)
+        with mock.patch('argparse.ArgumentParser.parse_args', return_value=args), \
+             mock.patch.object(module, 'run', return_value=0) as mock_run:
+            main()
+        self.assertEqual(mock_run.call_args[1]['writers'], [])
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            args = argparse.Namespace(demo=False,
+                                      config=config,
+                                      results_file=os.path.join(tmpdir, 'results.jsonl'),
+                                      junit_file=os.path.join(tmpdir, 'junit.xml'))
+            with mock.patch('argparse.ArgumentParser.parse_args', return_value=args), \
+                 mock.patch.object(module, 'run', return_value=0) as mock_run:
+                main()
+            writers = mock_run.call_args[1]['writers']
+            self.assertIsInstance(writers[0], JSONLinesWriter)
+            self.assertIsInstance(writers[1], JUnitWriter)
+            writers[0].complete(list(), 0)
+
+    def testOutputDir(self):
+        config = os.path.join(os.path.dirname(__file__), 'demo', '.moosetest')
+        module = sys.modules['moosetools.moosetest.main']
+        args = argparse.Namespace(demo=False, config=config)
+        with mock.patch('argparse.ArgumentParser.parse_args', return_value=args), \
+             mock.patch.object(module, 'run', return_value=0) as mock_run:
+            main()
+        self.assertIsNone(mock_run.call_args[1]['output_dir'])
+
+        args = argparse.Namespace(demo=False, config=config, output_dir='output')
+        with mock.patch('argparse.ArgumentParser.parse_args', return_value=args), \
+             mock.patch.object(module, 'run', return_value=0) as mock_run:
+            main()
+        self.assertEqual(mock_run.call_args[1]['output_dir'], os.path.abspath('output'))
+
+    def testThrottle(self):
+        config = os.path.join(os.path.dirname(__file__), 'demo', '.moosetest')
+        module = sys.modules['moosetools.moosetest.main']
+        args = argparse.Namespace(demo=False, config=config)
+        with mock.patch('argparse.ArgumentParser.parse_args', return_value=args), \
+             mock.patch.object(module, 'run', return_value=0) as mock_run:
+            main()
+        self.assertIsNone(mock_run.call_args[1]['throttle'])
+
+        def make_harness_with_load(*args):
+            harness = make_harness(*args)
+            harness.parameters().setValue('max_load', 64.)
+            return harness
+
+        with mock.patch('argparse.ArgumentParser.parse_args', return_value=args), \
+             mock.patch.object(module, 'make_harness', side_effect=make_harness_with_load), \
+             mock.patch.object(module, 'run', return_value=0) as mock_run:
+            main()
+        self.assertIsInstance(mock_run.call_args[1]['throttle'], LoadThrottle)
+
 
 @unittest.skipIf(platform.python_version() < '3.7', "Python 3.7 or greater required")
 class TestFuzzer(unittest.TestCase):
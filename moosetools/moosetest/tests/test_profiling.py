@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+#* This file is part of MOOSETOOLS repository
+#* https://www.github.com/idaholab/moosetools
+#*
+#* All rights reserved, see COPYRIGHT for full restrictions
+#* https://github.com/idaholab/moosetools/blob/main/COPYRIGHT
+#*
+#* Licensed under LGPL 2.1, please see LICENSE for details
+#* https://www.gnu.org/licenses/lgpl-2.1.html
+
+import os
+import time
+import pstats
+import tempfile
+import unittest
+
+from moosetools.moosetest.profiling import HarnessProfiler
+
+
+class Proxy(object):
+    def report(self, value):
+        time.sleep(0.01)
+        return value
+
+
+class TestHarnessProfiler(unittest.TestCase):
+    def testDisabled(self):
+        profiler = HarnessProfiler(False)
+        with profiler.phase('a'):
+            pass
+        obj = Proxy()
+        profiler.wrap(obj, 'reporting', 'report')
+        self.assertNotIn('report', obj.__dict__)
+        self.assertEqual(profiler.summary(), '')
+
+    def testPhases(self):
+        profiler = HarnessProfiler()
+        obj = Proxy()
+        profiler.wrap(obj, 'reporting', 'report')
+        with profiler.phase('a'):
+            time.sleep(0.02)
+        with profiler.phase('b'):
+            self.assertEqual(obj.report(1), 1)
+            self.assertEqual(obj.report(2), 2)
+
+        with self.assertRaises(ValueError):
+            with profiler.phase('a'):
+                raise ValueError()
+
+        out = profiler.summary()
+        lines = out.splitlines()
+        self.assertEqual(lines[0], 'Harness profile:')
+        self.assertEqual(lines[2].split()[:2], ['a', '2'])
+        self.assertEqual(lines[3].split()[:2], ['reporting', '2'])
+        self.assertEqual(lines[4].split()[:2], ['b', '1'])
+        self.assertGreaterEqual(float(lines[2].split()[2]), 0.02)
+        self.assertGreaterEqual(float(lines[4].split()[2]), float(lines[3].split()[2]))
+        self.assertIn('total', lines[5])
+
+    def testProfileDirectory(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            directory = os.path.join(tmpdir, 'profile')
+            profiler = HarnessProfiler(directory=directory)
+            obj = Proxy()
+            profiler.wrap(obj, 'reporting', 'report')
+            with profiler.phase('a'):
+                obj.report(1)
+            obj.report(2)
+            obj.report(3)
+
+            out = profiler.summary()
+            self.assertIn(f"The cProfile statistics were written to '{directory}'", out)
+            self.assertEqual(sorted(os.listdir(directory)), ['a.pstats', 'reporting.pstats'])
+
+            # The nested phase is only profiled as part of the outer phase
+            stats = pstats.Stats(os.path.join(directory, 'reporting.pstats'))
+            report = [v for k, v in stats.stats.items() if k[2] == 'report']
+            self.assertEqual(report[0][1], 2)  # number of calls
+
+
+if __name__ == '__main__':
+    unittest.main(module=__name__, verbosity=2, buffer=True)
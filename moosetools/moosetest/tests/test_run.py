@@ -10,25 +10,41 @@
 
 import os
 import sys
+import time
+import json
+import tempfile
 import unittest
 from unittest import mock
 import queue
 import uuid
+import random
 import platform
 import logging
 import concurrent.futures
 
 from moosetools.moosetest.base import make_runner, make_differ, TestCase, State, Formatter, Runner, Differ
+from moosetools.moosetest.base import RunnerSpec
+from moosetools.moosetest.base.Runner import OUTPUT_DIR_VARIABLE, RETAIN_DIR_VARIABLE
 from moosetools.moosetest.runners import RunCommand
 from moosetools.moosetest import run, fuzzer
-from moosetools.moosetest.run import _execute_testcase, _execute_testcases
-from moosetools.moosetest.run import _report_progress_and_results
+from moosetools.moosetest.run import _execute_testcase, _execute_testcases, _execute_persistent
+from moosetools.moosetest.run import fuzzer_objects
+from moosetools.moosetest.run import _report_progress_and_results, _build_chains
 
 # I do not want the tests directory to be packages with __init__.py, so load from file
 sys.path.append(os.path.join(os.path.dirname(__file__)))
 from _helpers import TestController, TestRunner, TestDiffer
 
 
+class WorkerController(TestController):
+    PRE_DISPATCH = False
+
+
+class ExitRunner(Runner):
+    def execute(self):
+        os._exit(1)
+
+
 class PipeProxy(object):
     def __init__(self):
         self.state = None
@@ -137,10 +153,10 @@ class TestRunExecuteHelpers(unittest.TestCase):
         self.assertIn("sleep 0.3", data.stdout)
         self.assertEqual(data.reasons, [])
 
-        # Exception and skip
+        # Exception and skip, the mock is not available to an existing persistent process
         with mock.patch('moosetools.moosetest.base.TestCase.execute',
                         side_effect=[Exception("wrong"), None]):
-            _execute_testcases([tc0, tc1], q, 2)
+            _execute_testcases([tc0, tc1], q, 2, True)
 
         u, p, s, r = q.get()
         self.assertEqual(u, tc0.unique_id)
@@ -195,6 +211,98 @@ class TestRunExecuteHelpers(unittest.TestCase):
         self.assertEqual(data.stderr, "")
         self.assertEqual(data.reasons, ['max time (1) exceeded'])
 
+    @unittest.skipIf(platform.python_version() < '3.7', "Python 3.7 or greater required")
+    def test_execute_persistent(self):
+        run_module = sys.modules['moosetools.moosetest.run']
+
+        # Process is reused
+        tc0 = TestCase(runner=make_runner(TestRunner, name='test0'))
+        tc1 = TestCase(runner=make_runner(TestRunner, name='test1'))
+        state, results = _execute_persistent(tc0, 2)
+        self.assertEqual(state, TestCase.Result.PASS)
+        pid = run_module._PERSISTENT_PROCESS[1].pid
+        state, results = _execute_persistent(tc1, 2)
+        self.assertEqual(state, TestCase.Result.PASS)
+        self.assertEqual(results['test1'].returncode, 2011)
+        self.assertEqual(run_module._PERSISTENT_PROCESS[1].pid, pid)
+
+        # Timeout, process is replaced
+        tc2 = TestCase(runner=make_runner(TestRunner, name='test2', sleep=2))
+        state, results = _execute_persistent(tc2, 0.5)
+        self.assertEqual(state, TestCase.Result.TIMEOUT)
+        self.assertEqual(results['test2'].reasons, ['max time (0.5) exceeded'])
+        self.assertIsNone(run_module._PERSISTENT_PROCESS)
+
+        state, results = _execute_persistent(tc0, 2)
+        self.assertEqual(state, TestCase.Result.PASS)
+        self.assertNotEqual(run_module._PERSISTENT_PROCESS[1].pid, pid)
+
+        # Crash, process is replaced
+        tc3 = TestCase(runner=make_runner(ExitRunner, name='test3'))
+        state, results = _execute_persistent(tc3, 2)
+        self.assertEqual(state, TestCase.Result.FATAL)
+        self.assertIn("exited unexpectedly", results['test3'].stderr)
+        self.assertIsNone(run_module._PERSISTENT_PROCESS)
+
+        state, results = _execute_persistent(tc1, 2)
+        self.assertEqual(state, TestCase.Result.PASS)
+
+
+class TestBuildChains(unittest.TestCase):
+    def testDefault(self):
+        tcs = [TestCase(runner=make_runner(TestRunner, name=f'tests:Tests/r{i}')) for i in range(3)]
+        chains = _build_chains(tcs)
+        self.assertEqual(len(chains), 1)
+        self.assertEqual(chains[0][0], tcs)
+        self.assertEqual(chains[0][1], set())
+
+    def testDependsOn(self):
+        # r0 <- r1 <- r2, r0 <- r3, (r2, r3) <- r4, r5 independent
+        kwargs = [
+            dict(),
+            dict(),
+            dict(),
+            dict(depends_on=('r0', )),
+            dict(depends_on=('tests:Tests/r2', 'r3')),
+            dict(depends_on=('', ))
+        ]
+        tcs = [
+            TestCase(runner=make_runner(TestRunner, name=f'tests:Tests/r{i}', **kw))
+            for i, kw in enumerate(kwargs)
+        ]
+        chains = _build_chains(tcs)
+        self.assertEqual(len(chains), 5)
+        self.assertEqual(chains[0], ([tcs[0]], set()))
+        self.assertEqual(chains[1], ([tcs[1], tcs[2]], {tcs[0].unique_id}))
+        self.assertEqual(chains[2], ([tcs[3]], {tcs[0].unique_id}))
+        self.assertEqual(chains[3], ([tcs[4]], {tcs[2].unique_id, tcs[3].unique_id}))
+        self.assertEqual(chains[4], ([tcs[5]], set()))
+
+        # Dependency defined after
+        tcs = [
+            TestCase(runner=make_runner(TestRunner, name='a', depends_on=('b', ))),
+            TestCase(runner=make_runner(TestRunner, name='b', depends_on=('', )))
+        ]
+        chains = _build_chains(tcs)
+        self.assertEqual(chains, [([tcs[1], tcs[0]], set())])
+
+    def testErrors(self):
+        tcs = [
+            TestCase(runner=make_runner(TestRunner, name='a')),
+            TestCase(runner=make_runner(TestRunner, name='b', depends_on=('c', )))
+        ]
+        with self.assertRaises(RuntimeError) as ex:
+            _build_chains(tcs)
+        self.assertIn("'depends_on' parameter of 'b' includes 'c'", str(ex.exception))
+
+        tcs = [
+            TestCase(runner=make_runner(TestRunner, name='a', depends_on=('b', ))),
+            TestCase(runner=make_runner(TestRunner, name='b'))
+        ]
+        with self.assertRaises(RuntimeError) as ex:
+            _build_chains(tcs)
+        self.assertIn("A cyclic dependency exists", str(ex.exception))
+
 
 @unittest.skipIf(platform.python_version() < '3.7', "Python 3.7 or greater required")
 class TestReportHelper(unittest.TestCase):
@@ -1056,11 +1164,366 @@ class TestRun(unittest.TestCase):
                         stdout='',
                         stderr=TestRun.IN("A previous test case (Just Andrew)"))
 
+    def testIsolate(self):
+        r0 = make_runner(TestRunner, name='Andrew', stdout=True)
+        r1 = make_runner(TestRunner, name='Other Andrew', stdout=True, isolate=True)
+        fm = Formatter()
+
+        for kwargs in [dict(), dict(isolate=True)]:
+            self.resetMockObjects()
+            rcode = run([[r0], [r1]], tuple(), fm, **kwargs)
+            self.assertEqual(rcode, 0)
+            self.assertEqual(self._r_results.call_count, 2)
+            for call in self._r_results.call_args_list:
+                self.assertCall(call,
+                                state=TestCase.Result.PASS,
+                                returncode=2011,
+                                stdout=TestRun.IN('runner stdout'))
+
+    def testOutputDirectory(self):
+        r0 = make_runner(RunCommand, name='r0', command=('bash', '-c', 'echo 1; sleep 5'))
+        r1 = make_runner(RunCommand, name='r1', command=('bash', '-c', 'echo 1'))
+        fm = Formatter()
+
+        # The output files of the terminated test case are removed with the directory
+        output_dirs = list()
+        mkdtemp = tempfile.mkdtemp
+        with mock.patch(
+                'tempfile.mkdtemp',
+                side_effect=lambda **kw: output_dirs.append(mkdtemp(**kw)) or output_dirs[-1]):
+            rcode = run([[r0], [r1]], tuple(), fm, timeout=1)
+        self.assertEqual(rcode, 1)
+        calls = {call[1]['name']: call for call in self._r_results.call_args_list}
+        self.assertCall(calls['r0'], state=TestCase.Result.TIMEOUT)
+        self.assertCall(calls['r1'], state=TestCase.Result.PASS)
+        self.assertEqual(len(output_dirs), 1)
+        self.assertFalse(os.path.exists(output_dirs[0]))
+        self.assertNotIn(OUTPUT_DIR_VARIABLE, os.environ)
+
+        # The complete output that exceeds the limit is removed, unless a directory is supplied
+        r2 = make_runner(RunCommand,
+                         name='r2',
+                         command=('bash', '-c', 'printf "a%.0s" {1..200}'),
+                         max_output=100)
+        output_dirs.clear()
+        with mock.patch(
+                'tempfile.mkdtemp',
+                side_effect=lambda **kw: output_dirs.append(mkdtemp(**kw)) or output_dirs[-1]):
+            self.assertEqual(run([[r2]], tuple(), fm), 0)
+        self.assertFalse(os.path.exists(output_dirs[0]))
+        self.assertCall(self._r_results.call_args_list[-1],
+                        reasons=["100 bytes of sys.stdout omitted"])
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            retain_dir = os.path.join(tmpdir, 'output')
+            self.assertEqual(run([[r2]], tuple(), fm, output_dir=retain_dir), 0)
+            files = os.listdir(retain_dir)
+            self.assertEqual(len(files), 1)
+            self.assertCall(self._r_results.call_args_list[-1],
+                            reasons=[
+                                "100 bytes of sys.stdout omitted, "
+                                f"see '{os.path.join(retain_dir, files[0])}'"
+                            ])
+        self.assertNotIn(RETAIN_DIR_VARIABLE, os.environ)
+
+    def testTimingFile(self):
+        r0 = make_runner(TestRunner, name='Andrew')
+        r1 = make_runner(TestRunner, name='Other Andrew', sleep=0.2)
+        fm = Formatter()
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filename = os.path.join(tmpdir, 'timing.json')
+            rcode = run([[r0], [r1]], tuple(), fm, n_threads=1, timing_file=filename)
+            self.assertEqual(rcode, 0)
+            self.assertCall(self._r_state.call_args_list[0], name='Andrew')
+
+            with open(filename, 'r') as fid:
+                timing = json.load(fid)
+            self.assertEqual(set(timing.keys()), {'Andrew', 'Other Andrew'})
+            self.assertGreater(timing['Other Andrew'], timing['Andrew'])
+
+            # Longest runs first
+            self.resetMockObjects()
+            rcode = run([[r0], [r1]], tuple(), fm, n_threads=1, timing_file=filename)
+            self.assertEqual(rcode, 0)
+            self.assertCall(self._r_state.call_args_list[0], name='Other Andrew')
+
+    def testWriters(self):
+        r0 = make_runner(TestRunner, name='r0')
+        r1 = make_runner(TestRunner, name='r1', error=True)
+        fm = Formatter()
+
+        writer = mock.MagicMock()
+        rcode = run([[r0, r1]], tuple(), fm, n_threads=1, writers=(writer, ))
+        self.assertEqual(rcode, 1)
+        self.assertEqual([c[0][0].name() for c in writer.write.call_args_list], ['r0', 'r1'])
+        writer.complete.assert_called_once()
+        self.assertEqual(len(writer.complete.call_args[0][0]), 2)
+
+    def testThrottle(self):
+        groups = [[make_runner(TestRunner, name=f'r{i}', sleep=0.2)] for i in range(3)]
+        fm = Formatter()
+
+        # Overloaded, the groups execute one at a time
+        throttle = mock.MagicMock(interval=0.01, active=True)
+        throttle.overloaded.return_value = True
+        writer = mock.MagicMock()
+        rcode = run(groups, tuple(), fm, n_threads=3, writers=(writer, ), throttle=throttle)
+        self.assertEqual(rcode, 0)
+        self.assertTrue(throttle.overloaded.called)
+        tcs = sorted((c[0][0] for c in writer.write.call_args_list), key=lambda tc: tc.start_time)
+        self.assertEqual(len(tcs), 3)
+        for previous, current in zip(tcs[:-1], tcs[1:]):
+            self.assertGreaterEqual(current.start_time, previous.start_time + previous.time)
+
+        # Resumes when the load drops
+        throttle.reset_mock()
+        throttle.overloaded.side_effect = [True, False, False]
+        writer = mock.MagicMock()
+        rcode = run(groups, tuple(), fm, n_threads=3, writers=(writer, ), throttle=throttle)
+        self.assertEqual(rcode, 0)
+        self.assertEqual(len(writer.write.call_args_list), 3)
+
+    def testMaxRetries(self):
+        fm = Formatter()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            marker = os.path.join(tmpdir, 'marker')
+            flaky = ('sh', '-c', f'test -f {marker} || {{ touch {marker}; exit 1; }}')
+            filename = os.path.join(tmpdir, 'flakes.json')
+
+            # Fails without retries
+            r0 = make_runner(RunCommand, name='r0', command=flaky, allow_exception=True)
+            rcode = run([[r0]], tuple(), fm, flake_file=filename)
+            self.assertEqual(rcode, 1)
+
+            # Passes on the second attempt, only the failed test case is repeated
+            os.remove(marker)
+            r1 = make_runner(RunCommand, name='r1', command=('sh', '-c', f'echo r1 >> {marker}.r1'))
+            writer = mock.MagicMock()
+            rcode = run([[r1, r0]],
+                        tuple(),
+                        fm,
+                        max_retries=2,
+                        flake_file=filename,
+                        writers=(writer, ))
+            self.assertEqual(rcode, 0)
+            tcs = {c[0][0].name(): c[0][0] for c in writer.write.call_args_list}
+            self.assertIsNone(tcs['r1'].results['r1'].attempts)
+            self.assertEqual(tcs['r0'].results['r0'].attempts, 2)
+            with open(f'{marker}.r1', 'r') as fid:
+                self.assertEqual(fid.read(), 'r1\n')
+
+            with open(filename, 'r') as fid:
+                self.assertEqual(json.load(fid), {
+                    'r0': dict(runs=2, flakes=1),
+                    'r1': dict(runs=1, flakes=0)
+                })
+
+            # The Runner parameter takes precedence
+            os.remove(marker)
+            r0.parameters().setValue('max_retries', 0)
+            rcode = run([[r0]], tuple(), fm, max_retries=2)
+            self.assertEqual(rcode, 1)
+
+        # Only the states that may be transient are repeated
+        d = make_differ(TestDiffer, name='d', error=True)
+        r2 = make_runner(TestRunner, name='r2', error=True)
+        r3 = make_runner(TestRunner, name='r3', differs=(d, ))
+        r4 = make_runner(TestRunner, name='r4', fatal=True)
+        writer = mock.MagicMock()
+        rcode = run([[r2], [r3], [r4]], tuple(), fm, max_retries=2, writers=(writer, ))
+        self.assertEqual(rcode, 1)
+        tcs = {c[0][0].name(): c[0][0] for c in writer.write.call_args_list}
+        self.assertEqual(tcs['r2'].state, TestCase.Result.ERROR)
+        self.assertIsNone(tcs['r2'].results['r2'].attempts)
+        self.assertEqual(tcs['r3'].state, TestCase.Result.DIFF)
+        self.assertIsNone(tcs['r3'].results['r3'].attempts)
+        self.assertEqual(tcs['r4'].state, TestCase.Result.FATAL)
+        self.assertEqual(tcs['r4'].results['r4'].attempts, 3)
+
+    def testRunnerSpec(self):
+        ct = TestController()
+        d0 = RunnerSpec(TestDiffer, dict(name='d0'), 'Tests/r0/d0', 'tests', 3, tuple())
+        r0 = RunnerSpec(TestRunner, dict(name='r0'), 'Tests/r0', 'tests', 2, (d0, ))
+        r1 = RunnerSpec(TestRunner, dict(name='r1', error=True), 'Tests/r1', 'tests', 5, tuple())
+
+        writer = mock.MagicMock()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            rcode = run([[r0, r1]], (ct, ),
+                        Formatter(),
+                        cache_file=os.path.join(tmpdir, 'cache.json'),
+                        writers=(writer, ))
+        self.assertEqual(rcode, 1)
+        tcs = {c[0][0].name(): c[0][0] for c in writer.write.call_args_list}
+        self.assertEqual(tcs['r0'].state, TestCase.Result.PASS)
+        self.assertEqual(list(tcs['r0'].results.keys()), ['r0', 'd0'])
+        self.assertIs(tcs['r0'].runner, r0)
+        self.assertEqual(tcs['r1'].state, TestCase.Result.ERROR)
+
+    def testPreDispatch(self):
+        r0 = make_runner(TestRunner, [TestController()], name='r0')
+        r1 = make_runner(TestRunner, [TestController()], name='r1', ctrl_platform=('Windows', ))
+        r2 = make_runner(TestRunner, [TestController()], name='r2')
+        r3 = make_runner(TestRunner, [TestController()], name='r3', depends_on=('r2', ))
+        r4 = make_runner(TestRunner, [TestController()], name='r4', depends_on=('', ))
+
+        # Skipped prior to submitting, including the test cases that depend on the skipped case
+        ct = TestController()
+        writer = mock.MagicMock()
+        with mock.patch('platform.system', return_value='Linux'):
+            rcode = run([[r0, r1, r2, r3, r4]], (ct, ), Formatter(), writers=(writer, ))
+        self.assertEqual(rcode, 0)
+        tcs = {c[0][0].name(): c[0][0] for c in writer.write.call_args_list}
+        self.assertEqual(tcs['r0'].state, TestCase.Result.PASS)
+        self.assertEqual(tcs['r1'].state, TestCase.Result.SKIP)
+        self.assertEqual(tcs['r1'].results['r1'].reasons, ["'Linux' not in ('Windows',)"])
+        self.assertIsNone(tcs['r1'].start_time)
+        for name in ('r2', 'r3'):
+            self.assertEqual(tcs[name].state, TestCase.Result.SKIP)
+            self.assertEqual(tcs[name].results[name].reasons, ['dependency'])
+            self.assertIsNone(tcs[name].start_time)
+        self.assertEqual(tcs['r4'].state, TestCase.Result.PASS)
+
+        # Controllers that opt out are evaluated by the worker, as are those that follow
+        for controllers in [(WorkerController(), ), (WorkerController(), ct)]:
+            writer = mock.MagicMock()
+            with mock.patch('platform.system', return_value='Linux'):
+                rcode = run([[r1]], controllers, Formatter(), writers=(writer, ))
+            tc = writer.write.call_args[0][0]
+            self.assertEqual(tc.state, TestCase.Result.SKIP)
+            self.assertIsNotNone(tc.start_time)
+
+        # The parameters of a RunnerSpec are used without creating the object
+        spec = RunnerSpec(TestRunner, dict(name='s0', ctrl_platform=('Windows', )), 'Tests/s0',
+                          'tests', 2, tuple())
+        writer = mock.MagicMock()
+        with mock.patch('platform.system', return_value='Linux'), \
+             mock.patch.object(RunnerSpec, 'create') as create:
+            rcode = run([[spec]], (ct, ), Formatter(), writers=(writer, ))
+        create.assert_not_called()
+        tc = writer.write.call_args[0][0]
+        self.assertEqual(tc.state, TestCase.Result.SKIP)
+        self.assertEqual(tc.results['s0'].reasons, ["'Linux' not in ('Windows',)"])
+
+    def testCacheFile(self):
+        r0 = make_runner(TestRunner, name='r0')
+        r1 = make_runner(TestRunner, name='r1', error=True)
+        r2 = make_runner(TestRunner, name='r2', depends_on=('', ))
+        r3 = make_runner(TestRunner, name='r3', depends_on=('r2', 'r1'))
+        fm = Formatter()
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filename = os.path.join(tmpdir, 'cache.json')
+            rcode = run([[r0, r1, r2, r3]], tuple(), fm, cache_file=filename)
+            self.assertEqual(rcode, 1)
+            with open(filename, 'r') as fid:
+                self.assertEqual(len(json.load(fid)), 2)  # r0 and r2
+
+            # r0 and r2 are cached, r1 executes and r3 depends on r1
+            self.resetMockObjects()
+            r1.setValue('error', False)
+            rcode = run([[r0, r1, r2, r3]], tuple(), fm, cache_file=filename)
+            self.assertEqual(rcode, 0)
+            calls = {call[1]['name']: call for call in self._r_results.call_args_list}
+            self.assertCall(calls['r0'], state=TestCase.Result.PASS, reasons=['cached'])
+            self.assertCall(calls['r1'], state=TestCase.Result.PASS, returncode=2011)
+            self.assertCall(calls['r2'], state=TestCase.Result.PASS, reasons=['cached'])
+            self.assertCall(calls['r3'], state=TestCase.Result.PASS, returncode=2011)
+
+            # All cached
+            self.resetMockObjects()
+            rcode = run([[r0, r1, r2, r3]], tuple(), fm, cache_file=filename, cache_size=3)
+            self.assertEqual(rcode, 0)
+            for call in self._r_results.call_args_list:
+                self.assertCall(call, state=TestCase.Result.PASS, reasons=['cached'])
+            with open(filename, 'r') as fid:
+                self.assertEqual(len(json.load(fid)), 3)
+
+            # Force
+            self.resetMockObjects()
+            rcode = run([[r0, r1, r2, r3]], tuple(), fm, cache_file=filename, force=True)
+            self.assertEqual(rcode, 0)
+            for call in self._r_results.call_args_list:
+                self.assertCall(call, state=TestCase.Result.PASS, returncode=2011)
+
+    def testCacheFileControlled(self):
+        ct = TestController()
+        r0 = make_runner(TestRunner, (ct, ), name='r0')
+        r1 = make_runner(TestRunner, (ct, ), name='r1')
+        fm = Formatter()
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filename = os.path.join(tmpdir, 'cache.json')
+            rcode = run([[r0], [r1]], (ct, ), fm, cache_file=filename)
+            self.assertEqual(rcode, 0)
+
+            # The controller skips r0 (e.g., the environment changed), which is not reported as
+            # cached; r1 remains cached
+            self.resetMockObjects()
+            ct.setValue('skip', True)
+            ct.setValue('object_name', 'r0')
+            rcode = run([[r0], [r1]], (ct, ), fm, cache_file=filename)
+            self.assertEqual(rcode, 0)
+            calls = {call[1]['name']: call for call in self._r_results.call_args_list}
+            self.assertCall(calls['r0'], state=TestCase.Result.SKIP, reasons=['a reason'])
+            self.assertCall(calls['r1'], state=TestCase.Result.PASS, reasons=['cached'])
+
+    def testDependsOn(self):
+        r0 = make_runner(TestRunner, name='r0', error=True)
+        r1 = make_runner(TestRunner, name='r1', sleep=1, depends_on=('', ))
+        r2 = make_runner(TestRunner, name='r2', sleep=1, depends_on=('', ))
+        r3 = make_runner(TestRunner, name='r3', depends_on=('r1', 'r2'))
+        r4 = make_runner(TestRunner, name='r4', depends_on=('r0', ))
+        fm = Formatter()
+
+        start = time.time()
+        rcode = run([[r0, r1, r2, r3, r4]], tuple(), fm, n_threads=3)
+        self.assertLess(time.time() - start, 1.9)  # r1 and r2 run concurrently
+        self.assertEqual(rcode, 1)
+        self.assertEqual(self._r_results.call_count, 5)
+
+        calls = {call[1]['name']: call for call in self._r_results.call_args_list}
+        self.assertCall(calls['r0'], state=TestCase.Result.ERROR)
+        self.assertCall(calls['r1'], state=TestCase.Result.PASS)
+        self.assertCall(calls['r2'], state=TestCase.Result.PASS)
+        self.assertCall(calls['r3'], state=TestCase.Result.PASS)
+        self.assertCall(calls['r4'],
+                        state=TestCase.Result.SKIP,
+                        reasons=['dependency'],
+                        stderr=TestRun.IN("A previous test case (r0)"))
+        self.assertEqual(list(calls.keys()).index('r3'), 4)
+
+    def testSlots(self):
+        r0 = make_runner(TestRunner, name='r0', sleep=1, n_procs=3)
+        r1 = make_runner(TestRunner, name='r1', sleep=1, n_procs=3)
+        r2 = make_runner(TestRunner, name='r2', sleep=0.2)
+        r3 = make_runner(TestRunner, name='r3', sleep=0.2, n_procs=2, n_threads=4)
+        fm = Formatter()
+
+        # r1 does not fit with r0, so r2 executes alongside r0; r3 exceeds the slots, so runs alone
+        start = time.time()
+        rcode = run([[r0], [r1], [r2], [r3]], tuple(), fm, n_threads=4)
+        self.assertEqual(rcode, 0)
+        names = [call[1]['name'] for call in self._r_results.call_args_list]
+        self.assertEqual(names, ['r2', 'r0', 'r1', 'r3'])
+        self.assertLess(time.time() - start, 3)
+
     @unittest.skipIf(platform.python_version() < '3.7', "Python 3.7 or greater required")
     def testFuzzer(self):
         rcode = fuzzer()
         self.assertIn(rcode, (0, 1))
 
+    def testFuzzerObjects(self):
+        random.seed(1)
+        controllers, groups = fuzzer_objects(group_num=(4, 4), controller_num=(2, 2))
+        self.assertEqual(len(controllers), 2)
+        self.assertEqual(len(groups), 4)
+
+        random.seed(1)
+        _, other = fuzzer_objects(group_num=(4, 4), controller_num=(2, 2))
+        self.assertEqual([[r.name() for r in g] for g in groups],
+                         [[r.name() for r in g] for g in other])
+
 
 if __name__ == '__main__':
     unittest.main(module=__name__, verbosity=2, buffer=True)
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+#* This file is part of MOOSETOOLS repository
+#* https://www.github.com/idaholab/moosetools
+#*
+#* All rights reserved, see COPYRIGHT for full restrictions
+#* https://github.com/idaholab/moosetools/blob/main/COPYRIGHT
+#*
+#* Licensed under LGPL 2.1, please see LICENSE for details
+#* https://www.gnu.org/licenses/lgpl-2.1.html
+
+import os
+import sys
+import time
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from moosetools.moosetest import discover
+from moosetools.moosetest.discover import make_factory
+from moosetools.moosetest.speccache import factory_fingerprint, spec_key, load_spec, save_spec
+from moosetools.moosetest.speccache import prune_spec_cache
+
+# I do not want the tests directory to be packages with __init__.py, so load from file
+sys.path.append(os.path.join(os.path.dirname(__file__)))
+from _helpers import TestController, TestRunner
+
+DEMO = os.path.abspath(os.path.join(os.path.dirname(__file__), 'demo'))
+
+
+class TestSpecCache(unittest.TestCase):
+    def setUp(self):
+        self._tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmpdir.cleanup)
+        self._cache_dir = os.path.join(self._tmpdir.name, 'cache')
+
+    def testFingerprint(self):
+        plugin_dir = os.path.join(self._tmpdir.name, 'plugins')
+        shutil.copytree(os.path.join(DEMO, 'plugins'), plugin_dir)
+        obj_factory = make_factory([plugin_dir])
+        fingerprint = factory_fingerprint(obj_factory, [plugin_dir])
+        self.assertEqual(factory_fingerprint(obj_factory, [plugin_dir]), fingerprint)
+
+        # Controllers
+        other = factory_fingerprint(obj_factory, [plugin_dir], [TestController()])
+        self.assertNotEqual(other, fingerprint)
+
+        # Modified plugin
+        filename = os.path.join(plugin_dir, 'moosetest', 'runners', 'new.py')
+        os.makedirs(os.path.dirname(filename), exist_ok=True)
+        with open(filename, 'w') as fid:
+            fid.write('')
+        self.assertNotEqual(factory_fingerprint(obj_factory, [plugin_dir]), fingerprint)
+
+    def testSpecKey(self):
+        filename = os.path.join(self._tmpdir.name, 'tests')
+        self.assertIsNone(spec_key(filename, self._tmpdir.name, ('Tests', ), 'abc'))
+
+        with open(filename, 'w') as fid:
+            fid.write('[Tests]\n[]')
+        key = spec_key(filename, self._tmpdir.name, ('Tests', ), 'abc')
+        self.assertEqual(spec_key(filename, self._tmpdir.name, ('Tests', ), 'abc'), key)
+        self.assertNotEqual(spec_key(filename, self._tmpdir.name, ('Tests', ), 'def'), key)
+        self.assertNotEqual(spec_key(filename, self._tmpdir.name, ('Other', ), 'abc'), key)
+        self.assertNotEqual(spec_key(filename, '/', ('Tests', ), 'abc'), key)
+
+        with open(filename, 'w') as fid:
+            fid.write('[Tests]\n  [a]\n  []\n[]')
+        self.assertNotEqual(spec_key(filename, self._tmpdir.name, ('Tests', ), 'abc'), key)
+
+        # Included files, recursively, including files that do not exist
+        common = os.path.join(self._tmpdir.name, 'sub', 'common.i')
+        with open(filename, 'w') as fid:
+            fid.write('!include sub/common.i\n[Tests]\n[]')
+        key = spec_key(filename, self._tmpdir.name, ('Tests', ), 'abc')
+        self.assertIsNotNone(key)
+
+        os.makedirs(os.path.dirname(common))
+        with open(common, 'w') as fid:
+            fid.write('!include "other.i"\n')
+        self.assertNotEqual(spec_key(filename, self._tmpdir.name, ('Tests', ), 'abc'), key)
+        key = spec_key(filename, self._tmpdir.name, ('Tests', ), 'abc')
+
+        with open(os.path.join(self._tmpdir.name, 'sub', 'other.i'), 'w') as fid:
+            fid.write('[Tests]\n[]')
+        self.assertNotEqual(spec_key(filename, self._tmpdir.name, ('Tests', ), 'abc'), key)
+        key = spec_key(filename, self._tmpdir.name, ('Tests', ), 'abc')
+        self.assertEqual(spec_key(filename, self._tmpdir.name, ('Tests', ), 'abc'), key)
+
+        # An include cycle terminates
+        with open(common, 'w') as fid:
+            fid.write('!include ../tests\n')
+        self.assertNotEqual(spec_key(filename, self._tmpdir.name, ('Tests', ), 'abc'), key)
+
+    def testSaveLoadPrune(self):
+        self.assertIsNone(load_spec(self._cache_dir, 'a'))
+
+        runners = [TestRunner(name='a')]
+        save_spec(self._cache_dir, 'a', runners)
+        out = load_spec(self._cache_dir, 'a')
+        self.assertEqual([r.name() for r in out], ['a'])
+        self.assertEqual(os.listdir(self._cache_dir), ['a.pickle'])
+
+        with open(os.path.join(self._cache_dir, 'b.pickle'), 'w') as fid:
+            fid.write('not a pickle')
+        with self.assertLogs(level='WARNING') as log:
+            self.assertIsNone(load_spec(self._cache_dir, 'b'))
+        self.assertIn("Failed to read the specification cache entry", log.output[0])
+
+        with mock.patch('os.replace', side_effect=OSError()), \
+             self.assertLogs(level='WARNING') as log:
+            save_spec(self._cache_dir, 'c', runners)
+        self.assertIn("Failed to write the specification cache entry", log.output[0])
+        self.assertEqual(sorted(os.listdir(self._cache_dir)), ['a.pickle', 'b.pickle'])
+
+        # The least recently used are removed, loading an entry updates the time
+        current = time.time()
+        os.utime(os.path.join(self._cache_dir, 'a.pickle'), (current - 100, current - 100))
+        os.utime(os.path.join(self._cache_dir, 'b.pickle'), (current - 50, current - 50))
+        prune_spec_cache(self._cache_dir, 2)
+        self.assertEqual(len(os.listdir(self._cache_dir)), 2)
+
+        load_spec(self._cache_dir, 'a')
+        prune_spec_cache(self._cache_dir, 1)
+        self.assertEqual(os.listdir(self._cache_dir), ['a.pickle'])
+        prune_spec_cache(os.path.join(self._tmpdir.name, 'missing'), 1)
+
+    def testDiscover(self):
+        plugin_dirs = [os.path.join(DEMO, 'plugins')]
+        controllers = (TestController(), )
+        expected = discover(DEMO, ['tests'], ['Tests'], plugin_dirs, controllers)
+        names = [[r.name() for r in runners] for runners in expected]
+
+        module = sys.modules['moosetools.moosetest.discover']
+        with mock.patch.object(module, '_create_runners',
+                               wraps=module._create_runners) as mock_create:
+            groups = discover(DEMO, ['tests'], ['Tests'],
+                              plugin_dirs,
+                              controllers,
+                              cache_dir=self._cache_dir)
+            self.assertEqual([[r.name() for r in runners] for runners in groups], names)
+            self.assertEqual(mock_create.call_count, 3)
+            self.assertEqual(len(os.listdir(self._cache_dir)), 3)
+
+            # Loaded from the cache, with the current Controller objects
+            mock_create.reset_mock()
+            controllers = (TestController(), )
+            groups = discover(DEMO, ['tests'], ['Tests'],
+                              plugin_dirs,
+                              controllers,
+                              cache_dir=self._cache_dir,
+                              cache_size=2)
+            mock_create.assert_not_called()
+            self.assertEqual([[r.name() for r in runners] for runners in groups], names)
+            self.assertIs(groups[0][0].getParam('_controllers')[0], controllers[0])
+            self.assertEqual(len(os.listdir(self._cache_dir)), 2)
+
+            # Different controllers invalidate the entries
+            discover(DEMO, ['tests'], ['Tests'], plugin_dirs, cache_dir=self._cache_dir)
+            self.assertEqual(mock_create.call_count, 3)
+
+
+if __name__ == '__main__':
+    unittest.main(module=__name__, verbosity=2, buffer=True)
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+#* This file is part of MOOSETOOLS repository
+#* https://www.github.com/idaholab/moosetools
+#*
+#* All rights reserved, see COPYRIGHT for full restrictions
+#* https://github.com/idaholab/moosetools/blob/main/COPYRIGHT
+#*
+#* Licensed under LGPL 2.1, please see LICENSE for details
+#* https://www.gnu.org/licenses/lgpl-2.1.html
+
+import unittest
+from unittest import mock
+
+from moosetools.moosetest.throttle import LoadThrottle, read_pressure, read_load
+
+PRESSURE = "some avg10=12.50 avg60=3.00 avg300=1.00 total=1234\n" \
+           "full avg10=1.00 avg60=0.50 avg300=0.10 total=123\n"
+
+
+class TestReadFunctions(unittest.TestCase):
+    def testReadPressure(self):
+        with mock.patch('builtins.open', mock.mock_open(read_data=PRESSURE)) as mock_open:
+            self.assertEqual(read_pressure('cpu'), 12.5)
+        mock_open.assert_called_once_with('/proc/pressure/cpu', 'r')
+
+        with mock.patch('builtins.open', side_effect=FileNotFoundError):
+            self.assertIsNone(read_pressure('cpu'))
+
+        with mock.patch('builtins.open', mock.mock_open(read_data='wrong')):
+            self.assertIsNone(read_pressure('memory'))
+
+    def testReadLoad(self):
+        with mock.patch('os.getloadavg', return_value=(4., 2., 1.)):
+            self.assertEqual(read_load(), 4.)
+        with mock.patch('os.getloadavg', side_effect=OSError):
+            self.assertIsNone(read_load())
+
+
+class TestLoadThrottle(unittest.TestCase):
+    def testNoLimits(self):
+        obj = LoadThrottle()
+        self.assertFalse(obj.overloaded())
+        self.assertFalse(obj.active)
+
+    @mock.patch('moosetools.moosetest.throttle.read_pressure')
+    @mock.patch('moosetools.moosetest.throttle.read_load')
+    def testOverloaded(self, mock_load, mock_pressure):
+        mock_load.return_value = 2.
+        mock_pressure.return_value = None
+        obj = LoadThrottle(max_load=4, max_cpu_pressure=10, max_memory_pressure=10, interval=0)
+
+        self.assertFalse(obj.overloaded())
+
+        mock_load.return_value = 8.
+        with self.assertLogs(level='INFO') as log:
+            self.assertTrue(obj.overloaded())
+        self.assertIn("Delaying new tests, the load average of 8.0 exceeds 4.0.", log.output[0])
+        self.assertTrue(obj.active)
+
+        mock_load.return_value = 2.
+        mock_pressure.side_effect = lambda r: 20. if r == 'memory' else None
+        self.assertTrue(obj.overloaded())
+
+        mock_pressure.side_effect = None
+        mock_pressure.return_value = 1.
+        with self.assertLogs(level='INFO') as log:
+            self.assertFalse(obj.overloaded())
+        self.assertIn("Resuming new tests", log.output[0])
+        self.assertFalse(obj.active)
+
+    @mock.patch('moosetools.moosetest.throttle.read_load')
+    def testInterval(self, mock_load):
+        mock_load.return_value = 8.
+        obj = LoadThrottle(max_load=4, interval=600)
+        with self.assertLogs(level='INFO'):
+            self.assertTrue(obj.overloaded())
+        mock_load.return_value = 2.
+        self.assertTrue(obj.overloaded())
+        self.assertEqual(mock_load.call_count, 1)
+
+
+if __name__ == '__main__':
+    unittest.main(module=__name__, verbosity=2, buffer=True)
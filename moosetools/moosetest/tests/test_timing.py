@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+#* This file is part of MOOSETOOLS repository
+#* https://www.github.com/idaholab/moosetools
+#*
+#* All rights reserved, see COPYRIGHT for full restrictions
+#* https://github.com/idaholab/moosetools/blob/main/COPYRIGHT
+#*
+#* Licensed under LGPL 2.1, please see LICENSE for details
+#* https://www.gnu.org/licenses/lgpl-2.1.html
+
+import os
+import sys
+import json
+import tempfile
+import unittest
+from unittest import mock
+
+from moosetools.moosetest.base import make_runner, TestCase
+from moosetools.moosetest.timing import load_timing, save_timing, estimate_duration, sort_groups
+from moosetools.moosetest.timing import shard_groups, shard_summary
+
+# I do not want the tests directory to be packages with __init__.py, so load from file
+sys.path.append(os.path.join(os.path.dirname(__file__)))
+from _helpers import TestRunner
+
+
+class TestTiming(unittest.TestCase):
+    def setUp(self):
+        self._tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmpdir.cleanup)
+        self._filename = os.path.join(self._tmpdir.name, 'timing.json')
+
+    def testLoad(self):
+        self.assertEqual(load_timing(None), dict())
+        self.assertEqual(load_timing(self._filename), dict())
+
+        with open(self._filename, 'w') as fid:
+            json.dump({'a': 1.5}, fid)
+        self.assertEqual(load_timing(self._filename), {'a': 1.5})
+
+        with open(self._filename, 'w') as fid:
+            fid.write('not json')
+        with self.assertLogs(level='WARNING') as log:
+            self.assertEqual(load_timing(self._filename), dict())
+        self.assertIn("Failed to read the timing database", log.output[0])
+
+    def testSave(self):
+        tc0 = TestCase(runner=make_runner(TestRunner, name='a'))
+        tc1 = TestCase(runner=make_runner(TestRunner, name='b'))
+        tc2 = TestCase(runner=make_runner(TestRunner, name='c'))
+        for tc, state in [(tc0, TestCase.Result.PASS), (tc1, TestCase.Result.SKIP)]:
+            tc.setProgress(TestCase.Progress.RUNNING)
+            tc.setProgress(TestCase.Progress.FINISHED)
+            tc.setState(state)
+
+        save_timing(self._filename, [tc0, tc1, tc2], {'b': 4, 'd': 2})
+        timing = load_timing(self._filename)
+        self.assertEqual(set(timing.keys()), {'a', 'b', 'd'})
+        self.assertEqual(timing['a'], tc0.time)
+        self.assertEqual(timing['b'], 4)
+        self.assertEqual(timing['d'], 2)
+        self.assertEqual(os.listdir(self._tmpdir.name), ['timing.json'])
+
+        with mock.patch('os.replace', side_effect=OSError()), \
+             self.assertLogs(level='WARNING') as log:
+            save_timing(self._filename, [tc0])
+        self.assertIn("Failed to write the timing database", log.output[0])
+        self.assertEqual(os.listdir(self._tmpdir.name), ['timing.json'])
+
+    def testEstimateAndSort(self):
+        g0 = [make_runner(TestRunner, name='a'), make_runner(TestRunner, name='b')]
+        g1 = [make_runner(TestRunner, name='c')]
+        g2 = [make_runner(TestRunner, name='d'), make_runner(TestRunner, name='e')]
+
+        # No timing, fallback to default for each runner; ties retain order
+        self.assertEqual(estimate_duration(g0, dict()), 2)
+        self.assertEqual(sort_groups([g1, g0, g2], dict()), [g0, g2, g1])
+
+        # Unknown runners use the average
+        timing = {'a': 1, 'b': 2, 'c': 9}
+        self.assertEqual(estimate_duration(g0, timing), 3)
+        self.assertEqual(estimate_duration(g2, timing), 8)
+        self.assertEqual(sort_groups([g0, g1, g2], timing), [g1, g2, g0])
+
+    def testShard(self):
+        g0 = [make_runner(TestRunner, name='a'), make_runner(TestRunner, name='b')]
+        g1 = [make_runner(TestRunner, name='c')]
+        g2 = [make_runner(TestRunner, name='d')]
+        g3 = [make_runner(TestRunner, name='e')]
+        timing = {'a': 2, 'b': 2, 'c': 5, 'd': 3, 'e': 1}
+
+        # Longest first, to the shard with the least estimated duration
+        shards = shard_groups([g0, g1, g2, g3], timing, 2)
+        self.assertEqual(shards, [[g1, g3], [g0, g2]])
+
+        # Independent of the supplied order
+        self.assertEqual(shard_groups([g3, g2, g1, g0], timing, 2), shards)
+        self.assertEqual(shard_groups([g2, g3], dict(), 2), [[g2], [g3]])
+        self.assertEqual(shard_groups([g3, g2], dict(), 2), [[g2], [g3]])
+
+        # More shards than groups
+        self.assertEqual(shard_groups([g1], timing, 3), [[g1], [], []])
+
+        out = shard_summary(shards, timing, 1, 7.25)
+        self.assertIn("Shard 2 of 2: predicted 7.0 seconds, actual 7.2 seconds.", out)
+        self.assertIn("Shard 1: 6.0 seconds predicted for 2 tests", out)
+        self.assertIn("Shard 2: 7.0 seconds predicted for 3 tests", out)
+
+
+if __name__ == '__main__':
+    unittest.main(module=__name__, verbosity=2, buffer=True)
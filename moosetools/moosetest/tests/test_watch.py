@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+#* This file is part of MOOSETOOLS repository
+#* https://www.github.com/idaholab/moosetools
+#*
+#* All rights reserved, see COPYRIGHT for full restrictions
+#* https://github.com/idaholab/moosetools/blob/main/COPYRIGHT
+#*
+#* Licensed under LGPL 2.1, please see LICENSE for details
+#* https://www.gnu.org/licenses/lgpl-2.1.html
+
+import os
+import sys
+import time
+import tempfile
+import unittest
+from unittest import mock
+
+from moosetools.moosetest.base import TestCase, RunnerSpec
+from moosetools.moosetest.discover import parse_spec_files, find_spec_files
+from moosetools.moosetest.watch import SpecWatcher, watch
+
+SPEC = """
+[Tests]
+  [{name}]
+    type = RunCommand
+    command = 'cat {input}'
+  []
+[]
+"""
+
+PLUGIN = """
+from moosetools.moosetest.runners import RunCommand
+class {name}(RunCommand):
+    pass
+"""
+
+
+class TestSpecWatcher(unittest.TestCase):
+    def setUp(self):
+        self._tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmpdir.cleanup)
+        self._mtime = 1000
+
+    def write(self, *args, content=''):
+        filename = os.path.join(self._tmpdir.name, *args)
+        os.makedirs(os.path.dirname(filename), exist_ok=True)
+        with open(filename, 'w') as fid:
+            fid.write(content)
+        self._mtime += 1
+        os.utime(filename, (self._mtime, self._mtime))
+        return filename
+
+    def names(self, groups):
+        return sorted(r.name() for runners in groups for r in runners)
+
+    def testPoll(self):
+        self.write('a', 'input.txt', content='a')
+        self.write('a', 'tests', content=SPEC.format(name='a', input='input.txt'))
+        self.write('b', 'tests', content=SPEC.format(name='b', input='missing.txt'))
+
+        watcher = SpecWatcher(self._tmpdir.name, ('tests', ), ('Tests', ))
+        self.assertEqual(self.names(watcher.groups()), ['a/tests:Tests/a', 'b/tests:Tests/b'])
+        self.assertEqual(watcher.poll(), [])
+
+        # Referenced file, the objects are retained
+        runners = [g for g in watcher.groups() if g[0].name() == 'a/tests:Tests/a'][0]
+        self.write('a', 'input.txt', content='changed')
+        groups = watcher.poll()
+        self.assertEqual(self.names(groups), ['a/tests:Tests/a'])
+        self.assertIs(groups[0], runners)
+        self.assertEqual(watcher.poll(), [])
+
+        # Specification file, parsed again
+        self.write('b', 'tests', content=SPEC.format(name='c', input='missing.txt'))
+        self.assertEqual(self.names(watcher.poll()), ['b/tests:Tests/c'])
+        self.assertEqual(self.names(watcher.groups()), ['a/tests:Tests/a', 'b/tests:Tests/c'])
+
+        # Errors result in an empty group, until fixed
+        self.write('b',
+                   'tests',
+                   content=SPEC.format(name='c', input='x').replace('RunCommand', 'Wrong'))
+        with self.assertLogs(level='ERROR') as log:
+            self.assertEqual(watcher.poll(), [])
+        self.assertIn("Errors occurred during parsing of", log.output[-1])
+        self.assertEqual(self.names(watcher.groups()), ['a/tests:Tests/a'])
+        self.write('b', 'tests', content=SPEC.format(name='d', input='x'))
+        self.assertEqual(self.names(watcher.poll()), ['b/tests:Tests/d'])
+
+    def testNewFiles(self):
+        self.write('a', 'tests', content=SPEC.format(name='a', input='x'))
+        paths = [os.path.join(self._tmpdir.name, d) for d in ('a', 'b')]
+        watcher = SpecWatcher(self._tmpdir.name, ('tests', ), ('Tests', ), paths=paths)
+        self.assertEqual(self.names(watcher.groups()), ['a/tests:Tests/a'])
+
+        # Files added after the watcher was created, within the paths
+        self.write('b', 'tests', content=SPEC.format(name='b', input='x'))
+        self.write('c', 'tests', content=SPEC.format(name='c', input='x'))
+        self.assertEqual(self.names(watcher.poll()), ['b/tests:Tests/b'])
+        self.assertEqual(watcher.poll(), [])
+        self.assertEqual(self.names(watcher.groups()), ['a/tests:Tests/a', 'b/tests:Tests/b'])
+
+        # Removed files
+        os.remove(os.path.join(self._tmpdir.name, 'a', 'tests'))
+        self.assertEqual(watcher.poll(), [])
+        self.assertEqual(self.names(watcher.groups()), ['b/tests:Tests/b'])
+
+    def testSearch(self):
+        self.write('a', 'tests', content=SPEC.format(name='a', input='x'))
+        watcher = SpecWatcher(self._tmpdir.name, ('tests', ), ('Tests', ))
+        module = sys.modules['moosetools.moosetest.watch']
+        with mock.patch.object(module, 'find_spec_files', wraps=find_spec_files) as find:
+            # The directories are not searched if unchanged, including if a file is modified
+            self.assertEqual(watcher.poll(), [])
+            self.write('a', 'tests', content=SPEC.format(name='a', input='y'))
+            self.assertEqual(self.names(watcher.poll()), ['a/tests:Tests/a'])
+            self.assertEqual(find.call_count, 0)
+
+            # New directory
+            self.write('b', 'sub', 'tests', content=SPEC.format(name='b', input='x'))
+            self.assertEqual(self.names(watcher.poll()), ['b/sub/tests:Tests/b'])
+            self.assertEqual(find.call_count, 1)
+            self.assertEqual(watcher.poll(), [])
+            self.assertEqual(find.call_count, 1)
+
+            # Searched after the interval
+            with mock.patch('time.time', return_value=time.time() + 60):
+                self.assertEqual(watcher.poll(), [])
+            self.assertEqual(find.call_count, 2)
+
+    def testOptions(self):
+        self.write('a', 'input.txt', content='a')
+        self.write('a', 'tests', content=SPEC.format(name='a', input='input.txt'))
+        cache_dir = os.path.join(self._tmpdir.name, 'cache')
+        with mock.patch('moosetools.moosetest.watch.parse_spec_files',
+                        wraps=parse_spec_files) as parse:
+            watcher = SpecWatcher(self._tmpdir.name, ('tests', ), ('Tests', ),
+                                  n_threads=2,
+                                  cache_dir=cache_dir,
+                                  processes=True,
+                                  lazy=True)
+        self.assertEqual(parse.call_args[0][4:8], (2, cache_dir, watcher._fingerprint, True))
+        self.assertTrue(parse.call_args[0][8])
+        self.assertTrue(watcher._fingerprint.endswith(':lazy'))
+        self.assertTrue(os.listdir(cache_dir))
+
+        runners = watcher.groups()[0]
+        self.assertIsInstance(runners[0], RunnerSpec)
+        self.write('a', 'input.txt', content='changed')
+        self.assertIs(watcher.poll()[0], runners)
+
+    def testPlugins(self):
+        plugin_dir = os.path.join(self._tmpdir.name, 'watch_plugins')
+        self.write('watch_plugins', '__init__.py', content='from .plugin import *')
+        self.write('watch_plugins', 'plugin.py', content=PLUGIN.format(name='WatchCommand'))
+        self.write('a',
+                   'tests',
+                   content=SPEC.format(name='a', input='x').replace('RunCommand', 'WatchCommand'))
+        self.write('b', 'tests', content=SPEC.format(name='b', input='x'))
+        self.addCleanup(sys.modules.pop, 'watch_plugins', None)
+        self.addCleanup(sys.modules.pop, 'watch_plugins.plugin', None)
+
+        watcher = SpecWatcher(self._tmpdir.name, ('tests', ), ('Tests', ), (plugin_dir, ))
+        self.assertEqual(self.names(watcher.groups()), ['a/tests:Tests/a', 'b/tests:Tests/b'])
+        cls = type(watcher.groups()[0][0])
+
+        # All files are parsed again with the reloaded types
+        self.write('watch_plugins', 'plugin.py', content=PLUGIN.format(name='WatchCommand') + '\n#')
+        self.assertEqual(self.names(watcher.poll()), ['a/tests:Tests/a', 'b/tests:Tests/b'])
+        runner = [g for g in watcher.groups() if g[0].name() == 'a/tests:Tests/a'][0][0]
+        self.assertEqual(type(runner).__name__, 'WatchCommand')
+        self.assertIsNot(type(runner), cls)
+
+
+class TestWatch(unittest.TestCase):
+    @mock.patch('moosetools.moosetest.watch.run', return_value=1)
+    @mock.patch('time.sleep')
+    def testWatch(self, mock_sleep, mock_run):
+        watcher = mock.MagicMock()
+        watcher.groups.return_value = ['all']
+        watcher.poll.side_effect = [list(), ['changed'], KeyboardInterrupt()]
+
+        TestCase.__TOTAL__ = 42
+        rcode = watch(watcher, tuple(), 'formatter', interval=2, timeout=10)
+        self.assertEqual(rcode, 1)
+        self.assertEqual(TestCase.__TOTAL__, 0)
+        self.assertEqual(mock_run.call_count, 2)
+        self.assertEqual(mock_run.call_args_list[0][0], (['all'], tuple(), 'formatter'))
+        self.assertEqual(mock_run.call_args_list[1][0], (['changed'], tuple(), 'formatter'))
+        self.assertEqual(mock_run.call_args_list[1][1], {'timeout': 10})
+        mock_sleep.assert_called_with(2)
+
+        watcher.poll.side_effect = None
+        watcher.poll.return_value = list()
+        mock_run.reset_mock()
+        watch(watcher, tuple(), 'formatter', max_cycles=3)
+        self.assertEqual(mock_run.call_count, 1)
+        self.assertEqual(watcher.poll.call_count, 6)
+
+
+if __name__ == '__main__':
+    unittest.main(module=__name__, verbosity=2, buffer=True)
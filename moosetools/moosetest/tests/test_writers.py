@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+#* This file is part of MOOSETOOLS repository
+#* https://www.github.com/idaholab/moosetools
+#*
+#* All rights reserved, see COPYRIGHT for full restrictions
+#* https://github.com/idaholab/moosetools/blob/main/COPYRIGHT
+#*
+#* Licensed under LGPL 2.1, please see LICENSE for details
+#* https://www.gnu.org/licenses/lgpl-2.1.html
+
+import os
+import sys
+import json
+import tempfile
+import unittest
+import xml.etree.ElementTree as ET
+from unittest import mock
+
+from moosetools.moosetest.base import make_runner, make_differ, TestCase
+from moosetools.moosetest.writers import testcase_record, JSONLinesWriter, JUnitWriter
+
+# I do not want the tests directory to be packages with __init__.py, so load from file
+sys.path.append(os.path.join(os.path.dirname(__file__)))
+from _helpers import TestRunner, TestDiffer
+
+
+def make_testcase(name, state, results):
+    differs = tuple(make_differ(TestDiffer, name=n) for n in results if n != name)
+    tc = TestCase(runner=make_runner(TestRunner, name=name, differs=differs))
+    tc.setProgress(TestCase.Progress.RUNNING)
+    tc.setProgress(TestCase.Progress.FINISHED)
+    tc.setState(state)
+    tc.setResults(results)
+    return tc
+
+
+class TestWriters(unittest.TestCase):
+    def setUp(self):
+        self._tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmpdir.cleanup)
+
+        Data = TestCase.Data
+        self._tc0 = make_testcase('a/tests:pass', TestCase.Result.PASS,
+                                  {'a/tests:pass': Data(TestCase.Result.PASS, 0, 'out', '', None)})
+        self._tc1 = make_testcase(
+            'a/tests:diff', TestCase.Result.DIFF, {
+                'a/tests:diff': Data(TestCase.Result.PASS, 0, 'out', '', None, {'max_rss': 1}, 2),
+                'd': Data(TestCase.Result.DIFF, None, 'd out', 'd err', ['wrong'])
+            })
+        self._tc2 = make_testcase('skip', TestCase.Result.SKIP,
+                                  {'skip': Data(TestCase.Result.SKIP, None, '', '', ['cached'])})
+        self._tc3 = make_testcase('fatal', TestCase.Result.FATAL,
+                                  {'fatal': Data(TestCase.Result.FATAL, None, '', 'bad', None)})
+
+    def testRecord(self):
+        record = testcase_record(self._tc1)
+        self.assertEqual(record['name'], 'a/tests:diff')
+        self.assertEqual(record['state'], 'DIFF')
+        self.assertIsInstance(record['duration'], float)
+        self.assertEqual(record['results']['a/tests:diff'], {
+            'state': 'OK',
+            'returncode': 0,
+            'reasons': None,
+            'resources': {
+                'max_rss': 1
+            },
+            'attempts': 2
+        })
+        self.assertEqual(record['results']['d']['stdout'], 'd out')
+        self.assertEqual(record['results']['d']['reasons'], ['wrong'])
+        json.dumps(record)
+
+    def testJSONLines(self):
+        filename = os.path.join(self._tmpdir.name, 'results.jsonl')
+        writer = JSONLinesWriter(filename, sync_interval=0.01)
+        writer.write(self._tc0)
+        writer.write(self._tc1)
+        writer.complete([self._tc0, self._tc1], 1)
+
+        with open(filename, 'r') as fid:
+            records = [json.loads(line) for line in fid]
+        self.assertEqual([r['name'] for r in records], ['a/tests:pass', 'a/tests:diff'])
+
+        # Appends
+        writer = JSONLinesWriter(filename)
+        writer.write(self._tc2)
+        writer.complete([self._tc2], 1)
+        with open(filename, 'r') as fid:
+            self.assertEqual(len(fid.readlines()), 3)
+
+        with self.assertLogs(level='WARNING') as log:
+            writer = JSONLinesWriter(os.path.join(self._tmpdir.name, 'not', 'a', 'dir'))
+            writer.write(self._tc0)
+            writer.complete([self._tc0], 1)
+        self.assertIn("Failed to open the results file", log.output[0])
+
+    def testJUnit(self):
+        filename = os.path.join(self._tmpdir.name, 'junit.xml')
+        writer = JUnitWriter(filename)
+        writer.write(self._tc0)
+        writer.complete([self._tc0, self._tc1, self._tc2, self._tc3], 4.25)
+
+        suite = ET.parse(filename).getroot()
+        self.assertEqual(suite.get('tests'), '4')
+        self.assertEqual(suite.get('failures'), '1')
+        self.assertEqual(suite.get('errors'), '1')
+        self.assertEqual(suite.get('skipped'), '1')
+        self.assertEqual(suite.get('time'), '4.250')
+
+        cases = suite.findall('testcase')
+        names = [(c.get('classname'), c.get('name')) for c in cases]
+        self.assertEqual(names, [('a/tests', 'pass'), ('a/tests', 'diff'), ('', 'skip'),
+                                 ('', 'fatal')])
+        self.assertEqual(len(list(cases[0])), 0)
+        self.assertEqual(cases[1].find('failure').get('message'), 'wrong')
+        self.assertEqual(cases[1].find('system-out').text, 'outd out')
+        self.assertEqual(cases[1].find('system-err').text, 'd err')
+        self.assertEqual(cases[2].find('skipped').get('message'), 'cached')
+        self.assertEqual(cases[3].find('error').get('message'), 'FATAL')
+        self.assertEqual(os.listdir(self._tmpdir.name), ['junit.xml'])
+
+        with mock.patch('os.replace', side_effect=OSError()), \
+             self.assertLogs(level='WARNING') as log:
+            writer.complete([self._tc0], 1)
+        self.assertIn("Failed to write the JUnit file", log.output[0])
+
+    def testJUnitColor(self):
+        Data = TestCase.Data
+        tc = make_testcase(
+            'color', TestCase.Result.ERROR, {
+                'color':
+                Data(TestCase.Result.ERROR, 1, '\x1b[32mgreen\x1b[0m\x08\n',
+                     '\x1b[1;31mred\x1b[0m\x00\x1b[2K', ['\x1b[33mwrong\x1b[0m\x07'])
+            })
+        filename = os.path.join(self._tmpdir.name, 'junit.xml')
+        JUnitWriter(filename).complete([tc], 1)
+
+        case = ET.parse(filename).getroot().find('testcase')
+        self.assertEqual(case.find('failure').get('message'), 'wrong')
+        self.assertEqual(case.find('system-out').text, 'green\n')
+        self.assertEqual(case.find('system-err').text, 'red')
+
+
+if __name__ == '__main__':
+    unittest.main(module=__name__, verbosity=2, buffer=True)
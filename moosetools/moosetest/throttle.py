@@ -0,0 +1,91 @@
+#* This file is part of MOOSETOOLS repository
+#* https://www.github.com/idaholab/moosetools
+#*
+#* All rights reserved, see COPYRIGHT for full restrictions
+#* https://github.com/idaholab/moosetools/blob/main/COPYRIGHT
+#*
+#* Licensed under LGPL 2.1, please see LICENSE for details
+#* https://www.gnu.org/licenses/lgpl-2.1.html
+
+import os
+import time
+import logging
+
+
+def read_pressure(resource):
+    """
+    Return the percentage of time in the last 10 seconds that some tasks were stalled waiting for
+    the *resource* ('cpu', 'memory', or 'io'), as reported by the Linux pressure stall information
+    (PSI) in '/proc/pressure', or `None` if it is not available.
+    """
+    try:
+        with open(os.path.join('/proc/pressure', resource), 'r') as fid:
+            for line in fid:
+                if line.startswith('some '):
+                    fields = dict(item.split('=') for item in line.split()[1:])
+                    return float(fields['avg10'])
+    except (OSError, KeyError, ValueError):
+        pass
+    return None
+
+
+def read_load():
+    """
+    Return the system load average over the last minute, or `None` if it is not available.
+    """
+    try:
+        return os.getloadavg()[0]
+    except (AttributeError, OSError):
+        return None
+
+
+class LoadThrottle(object):
+    """
+    Tool for the `moosetest.run` function to delay starting test cases while the machine is busy.
+
+    The machine is considered overloaded if the load average exceeds *max_load* or the pressure
+    stall percentage for CPU or memory (see `read_pressure`) exceeds *max_cpu_pressure* or
+    *max_memory_pressure*, respectively. A limit of `None` is not checked and a measurement that is
+    not available on the system is ignored. The measurements are updated at most every *interval*
+    seconds, and the changes between overloaded and not are logged.
+    """
+    def __init__(self, max_load=None, max_cpu_pressure=None, max_memory_pressure=None, interval=2.):
+        self._limits = [('load average', read_load, max_load),
+                        ('CPU pressure', lambda: read_pressure('cpu'), max_cpu_pressure),
+                        ('memory pressure', lambda: read_pressure('memory'), max_memory_pressure)]
+        self._limits = [item for item in self._limits if item[2] is not None]
+        self._interval = interval
+        self._next_time = 0
+        self._overloaded = False
+
+    @property
+    def interval(self):
+        """Return the time (in seconds) between updates of the measurements."""
+        return self._interval
+
+    @property
+    def active(self):
+        """Return True if the machine was overloaded at the last update."""
+        return self._overloaded
+
+    def overloaded(self):
+        """
+        Return True if the machine is overloaded and new test cases should not be started.
+        """
+        current = time.time()
+        if current < self._next_time:
+            return self._overloaded
+        self._next_time = current + self._interval
+
+        reasons = list()
+        for name, func, limit in self._limits:
+            value = func()
+            if (value is not None) and (value > limit):
+                reasons.append(f"{name} of {value:.1f} exceeds {limit:.1f}")
+
+        if reasons and not self._overloaded:
+            logging.getLogger(__name__).info("Delaying new tests, the %s.", ' and '.join(reasons))
+        elif self._overloaded and not reasons:
+            logging.getLogger(__name__).info("Resuming new tests, the load is below the limits.")
+        self._overloaded = bool(reasons)
+        return self._overloaded
@@ -0,0 +1,118 @@
+#* This file is part of MOOSETOOLS repository
+#* https://www.github.com/idaholab/moosetools
+#*
+#* All rights reserved, see COPYRIGHT for full restrictions
+#* https://github.com/idaholab/moosetools/blob/main/COPYRIGHT
+#*
+#* Licensed under LGPL 2.1, please see LICENSE for details
+#* https://www.gnu.org/licenses/lgpl-2.1.html
+
+import os
+import json
+import logging
+from moosetools import mooseutils
+from moosetools.moosetest.base import TestCase
+
+# The default duration (in seconds) of a test case when the timing database is empty
+DEFAULT_DURATION = 1.
+
+
+def load_timing(filename):
+    """
+    Return a `dict` of test case names to durations (in seconds) from the database *filename*.
+
+    An empty `dict` is returned if the file does not exist or cannot be read.
+    """
+    if (filename is None) or (not os.path.isfile(filename)):
+        return dict()
+
+    try:
+        with open(filename, 'r') as fid:
+            timing = json.load(fid)
+    except (OSError, ValueError):
+        logging.getLogger(__name__).warning("Failed to read the timing database '%s'.", filename)
+        return dict()
+
+    return timing if isinstance(timing, dict) else dict()
+
+
+def save_timing(filename, testcases, timing=None):
+    """
+    Update the timing database *filename* with the durations of the finished `TestCase` objects
+    in *testcases*.
+
+    The existing durations in *timing*, as returned by `load_timing`, are retained for test cases
+    that did not execute. Skipped test cases are not recorded, since the duration does not reflect
+    the time required for execution.
+    """
+    timing = dict(timing or dict())
+    for tc in testcases:
+        if tc.finished and (tc.state is not None) and (tc.state != TestCase.Result.SKIP):
+            timing[tc.name()] = tc.time
+
+    try:
+        mooseutils.atomic_write(filename,
+                                lambda fid: json.dump(timing, fid, indent=1, sort_keys=True))
+    except OSError:
+        logging.getLogger(__name__).warning("Failed to write the timing database '%s'.", filename)
+
+
+def estimate_duration(runners, timing):
+    """
+    Return the estimated duration (in seconds) of a group of `Runner` objects in *runners* using the
+    recorded durations in *timing*.
+
+    Runner objects without a recorded duration are estimated with the average of all the recorded
+    durations, or `DEFAULT_DURATION` if nothing has been recorded.
+    """
+    fallback = (sum(timing.values()) / len(timing)) if timing else DEFAULT_DURATION
+    return sum(timing.get(runner.name(), fallback) for runner in runners)
+
+
+def sort_groups(groups, timing):
+    """
+    Return the *groups* of `Runner` objects sorted by the estimated duration, longest first.
+
+    Submitting the longest groups first to the process pool avoids a long group beginning near the
+    end of the run, which would extend the total time. Groups with equal estimates retain the
+    supplied order.
+    """
+    return sorted(groups, key=lambda runners: estimate_duration(runners, timing), reverse=True)
+
+
+def shard_groups(groups, timing, count):
+    """
+    Return the *groups* of `Runner` objects partitioned into *count* shards of similar estimated
+    duration, using the recorded durations in *timing*.
+
+    The partition is computed by assigning each group, longest first, to the shard with the least
+    estimated duration. Groups are ordered by the name of the first `Runner` object when the
+    estimates are equal, thus the result does not depend on the order that the groups were
+    discovered and is identical on every machine with the same *timing* data.
+    """
+    name = lambda runners: runners[0].name() if runners else ''
+    ordered = sorted(groups,
+                     key=lambda runners: (-estimate_duration(runners, timing), name(runners)))
+
+    shards = [list() for i in range(count)]
+    loads = [0] * count
+    for runners in ordered:
+        index = loads.index(min(loads))
+        shards[index].append(runners)
+        loads[index] += estimate_duration(runners, timing)
+    return shards
+
+
+def shard_summary(shards, timing, index, duration):
+    """
+    Return a summary of the predicted duration for each shard in *shards*, as returned by
+    `shard_groups`, and the actual *duration* (in seconds) of the shard at *index*.
+    """
+    out = list()
+    predicted = [sum(estimate_duration(runners, timing) for runners in shard) for shard in shards]
+    out.append(f"Shard {index + 1} of {len(shards)}: predicted {predicted[index]:.1f} seconds, " \
+               f"actual {duration:.1f} seconds.")
+    for i, shard in enumerate(shards):
+        n_tests = sum(len(runners) for runners in shard)
+        out.append(f"  Shard {i + 1}: {predicted[i]:.1f} seconds predicted for {n_tests} tests")
+    return '\n'.join(out)
@@ -0,0 +1,273 @@
+#* This file is part of MOOSETOOLS repository
+#* https://www.github.com/idaholab/moosetools
+#*
+#* All rights reserved, see COPYRIGHT for full restrictions
+#* https://github.com/idaholab/moosetools/blob/main/COPYRIGHT
+#*
+#* Licensed under LGPL 2.1, please see LICENSE for details
+#* https://www.gnu.org/licenses/lgpl-2.1.html
+
+import os
+import sys
+import time
+import logging
+import importlib
+from moosetools.moosetest.base import TestCase
+from moosetools.moosetest.discover import find_spec_files, make_factory, parse_spec_files
+from moosetools.moosetest.discover import cache_fingerprint, _in_paths
+from moosetools.moosetest.discover import DEFAULT_IGNORE_PATTERNS
+from moosetools.moosetest.speccache import prune_spec_cache
+from moosetools.moosetest.cache import referenced_files
+from moosetools.moosetest.run import run
+
+
+class SpecWatcher(object):
+    """
+    Tool for detecting the groups of `Runner` objects affected by changes to files.
+
+    The test specification files, with a name in *spec_file_names*, within the *start* directory
+    are parsed and the `Runner` objects are retained. The modification times of the specification
+    files, the files referenced by each `Runner` object (see `moosetest.cache.referenced_files`),
+    and the python files in *plugin_dirs* are recorded. The `poll` method compares the current
+    modification times to those recorded.
+
+    The directories are searched again, to include new specification files, only if the
+    modification time of a directory searched changed (i.e., an entry was added, removed, or
+    renamed) or *search_interval* seconds elapsed since the last search, which allows for file
+    systems with a coarse resolution of the modification time.
+
+    Refer to the `moosetest.discover` function for the remaining arguments, the same arguments are
+    used for parsing the files found by each search.
+    """
+    def __init__(self,
+                 start,
+                 spec_file_names,
+                 spec_file_blocks,
+                 plugin_dirs=None,
+                 controllers=None,
+                 n_threads=None,
+                 ignore_patterns=DEFAULT_IGNORE_PATTERNS,
+                 prune_submodules=True,
+                 cache_dir=None,
+                 cache_size=1000,
+                 processes=False,
+                 lazy=False,
+                 pattern=None,
+                 tags=None,
+                 paths=None,
+                 search_interval=60.):
+        self._start = start
+        self._spec_file_names = spec_file_names
+        self._spec_file_blocks = spec_file_blocks
+        self._plugin_dirs = tuple(plugin_dirs or [])
+        self._controllers = controllers
+        self._n_threads = n_threads
+        self._ignore_patterns = ignore_patterns
+        self._prune_submodules = prune_submodules
+        self._cache_dir = cache_dir
+        self._cache_size = cache_size
+        self._processes = processes
+        self._lazy = lazy
+        self._pattern = pattern
+        self._tags = tags
+        self._paths = paths
+        self._search_interval = search_interval
+        self._makeFactory()
+
+        self._groups = dict()  # spec file to Runner objects
+        self._files = dict()  # spec file to referenced files
+        self._mtimes = dict()  # file to modification time
+        self._spec_files = list()  # from the last search
+        self._dir_mtimes = dict()  # directory searched to modification time
+        self._search_time = None
+        self._parse(self._findSpecFiles())
+        self._plugin_mtimes = self._pluginTimes()
+
+    def groups(self):
+        """
+        Return the groups of `Runner` objects for all of the test specification files.
+        """
+        return [runners for runners in self._groups.values() if runners]
+
+    def poll(self):
+        """
+        Return the groups of `Runner` objects affected by the files changed since the last call.
+
+        A new or changed specification file is parsed, the groups of removed files are discarded.
+        If a python file in the plugin directories changed, the modules are reloaded and all
+        specification files are parsed again. The directories are searched for new files only if
+        required (see `_searchRequired`).
+        """
+        spec_files = self._findSpecFiles() if self._searchRequired() else self._spec_files
+        for spec_file in set(self._groups.keys()).difference(spec_files):
+            self._groups.pop(spec_file)
+            self._files.pop(spec_file)
+
+        plugin_mtimes = self._pluginTimes()
+        if plugin_mtimes != self._plugin_mtimes:
+            self._plugin_mtimes = plugin_mtimes
+            self._reloadPlugins()
+            self._parse(spec_files)
+            return self.groups()
+
+        parse = list()
+        affected = list()
+        for spec_file in spec_files:
+            new = spec_file not in self._groups
+            if new or (_mtime(spec_file) != self._mtimes.get(spec_file)):
+                parse.append(spec_file)
+                affected.append(spec_file)
+            elif any(_mtime(f) != self._mtimes.get(f) for f in self._files[spec_file]):
+                self._record(spec_file)
+                affected.append(spec_file)
+        self._parse(parse)
+
+        return [self._groups[f] for f in affected if self._groups[f]]
+
+    def _findSpecFiles(self):
+        """
+        Return the test specification files within the start directory and the paths, the
+        directories searched are recorded (see `_searchRequired`).
+        """
+        self._search_time = time.time()
+        self._dir_mtimes = dict()
+        spec_files = find_spec_files(self._start,
+                                     self._spec_file_names,
+                                     ignore_patterns=self._ignore_patterns,
+                                     prune_submodules=self._prune_submodules,
+                                     n_threads=self._n_threads,
+                                     directories=self._dir_mtimes)
+        self._spec_files = [f for f in spec_files if (not self._paths) or _in_paths(f, self._paths)]
+        return self._spec_files
+
+    def _searchRequired(self):
+        """
+        Return True if the directories should be searched for specification files.
+        """
+        if (self._search_interval is not None) and \
+           (time.time() - self._search_time >= self._search_interval):
+            return True
+        return any(_mtime(d) != mtime for d, mtime in self._dir_mtimes.items())
+
+    def _parse(self, spec_files):
+        """
+        Create the `Runner` objects from the files in *spec_files* and record the modification
+        times.
+
+        If a file contains errors the group is empty, until the file is changed.
+        """
+        if not spec_files:
+            return
+
+        futures = parse_spec_files(self._start, spec_files, self._spec_file_blocks, self._factory,
+                                   self._n_threads, self._cache_dir, self._fingerprint,
+                                   self._processes, self._lazy, self._pattern, self._tags)
+        for spec_file in spec_files:
+            try:
+                runners, status = futures[spec_file].result()
+            except Exception:
+                logging.getLogger(__name__).exception("Failed to parse '%s'.", spec_file)
+                runners, status = list(), 1
+
+            if status:
+                logging.getLogger(__name__).error(
+                    "Errors occurred during parsing of '%s', refer to console output for messages.",
+                    spec_file)
+            self._groups[spec_file] = list() if status else runners
+            self._record(spec_file)
+
+        if self._cache_dir is not None:
+            prune_spec_cache(self._cache_dir, self._cache_size)
+
+    def _record(self, spec_file):
+        """
+        Record the modification times of *spec_file* and the files referenced by the group.
+        """
+        files = set()
+        for runner in self._groups[spec_file]:
+            files.update(referenced_files(runner, self._controllers))
+        files.discard(spec_file)
+        self._files[spec_file] = files
+        for filename in files.union([spec_file]):
+            self._mtimes[filename] = _mtime(filename)
+
+    def _pluginTimes(self):
+        """
+        Return a `dict` of the python files in the plugin directories to modification time.
+        """
+        mtimes = dict()
+        for plugin_dir in self._plugin_dirs:
+            for root, _, files in os.walk(plugin_dir):
+                for f in filter(lambda f: f.endswith('.py'), files):
+                    filename = os.path.join(root, f)
+                    mtimes[filename] = _mtime(filename)
+        return mtimes
+
+    def _reloadPlugins(self):
+        """
+        Reload the modules from the plugin directories and create a new factory.
+        """
+        plugin_dirs = tuple(os.path.abspath(p) + os.sep for p in self._plugin_dirs)
+        for module in list(sys.modules.values()):
+            filename = getattr(module, '__file__', None) or ''
+            if filename.startswith(plugin_dirs):
+                try:
+                    importlib.reload(module)
+                except Exception:
+                    logging.getLogger(__name__).exception("Failed to reload the module '%s'.",
+                                                          module.__name__)
+        self._makeFactory()
+
+    def _makeFactory(self):
+        """
+        Create the factory for the objects and the fingerprint of the objects stored in the cache.
+        """
+        self._factory = make_factory(self._plugin_dirs, self._controllers)
+        self._fingerprint = cache_fingerprint(self._factory, self._plugin_dirs, self._controllers,
+                                              self._cache_dir, self._lazy)
+
+
+def watch(watcher, controllers, formatter, interval=1., max_cycles=None, **kwargs):
+    """
+    Execute the groups of `Runner` objects from the `SpecWatcher` in *watcher* and then continue to
+    execute the groups affected by changed files, checking every *interval* seconds.
+
+    The function continues until interrupted (i.e., Ctrl-C) or *max_cycles* checks have been
+    performed and returns the value from the last call to the `moosetest.run` function. The
+    *controllers*, *formatter*, and *kwargs* are passed to the `moosetest.run` function.
+    """
+    rcode = _run(watcher.groups(), controllers, formatter, **kwargs)
+    print("Watching for changes, press Ctrl-C to exit.")
+
+    count = 0
+    try:
+        while (max_cycles is None) or (count < max_cycles):
+            count += 1
+            time.sleep(interval)
+            groups = watcher.poll()
+            if groups:
+                rcode = _run(groups, controllers, formatter, **kwargs)
+                print("Watching for changes, press Ctrl-C to exit.")
+    except KeyboardInterrupt:
+        pass
+    return rcode
+
+
+def _mtime(filename):
+    """
+    Return the modification time of *filename*, or `None` if it does not exist.
+    """
+    try:
+        return os.stat(filename).st_mtime
+    except OSError:
+        return None
+
+
+def _run(groups, controllers, formatter, **kwargs):
+    """
+    Execute the *groups* with the `moosetest.run` function, the counts of test cases used for
+    reporting progress are reset for each call.
+    """
+    TestCase.__TOTAL__ = 0
+    TestCase.__FINISHED__ = 0
+    return run(groups, controllers, formatter, **kwargs)
@@ -0,0 +1,214 @@
+#* This file is part of MOOSETOOLS repository
+#* https://www.github.com/idaholab/moosetools
+#*
+#* All rights reserved, see COPYRIGHT for full restrictions
+#* https://github.com/idaholab/moosetools/blob/main/COPYRIGHT
+#*
+#* Licensed under LGPL 2.1, please see LICENSE for details
+#* https://www.gnu.org/licenses/lgpl-2.1.html
+
+import os
+import re
+import json
+import time
+import queue
+import logging
+from moosetools import mooseutils
+import threading
+import xml.etree.ElementTree as ET
+from moosetools.moosetest.base import TestCase
+
+# Characters that are not allowed in an XML 1.0 document
+XML_INVALID_RE = re.compile('[^\x09\x0A\x0D\x20-\uD7FF\uE000-\uFFFD\U00010000-\U0010FFFF]')
+
+
+def testcase_record(tc):
+    """
+    Return a `dict`, serializable to JSON, of the results of the finished `TestCase` in *tc*.
+
+    The record includes the name, state, and timing of the test case and the state, return code,
+    reasons, resource usage, and number of attempts for the `Runner` and `Differ` objects. The
+    sys.stdout and sys.stderr are included only for objects that did not pass, to limit the size of
+    the record.
+    """
+    results = dict()
+    for name, data in (tc.results or dict()).items():
+        item = dict(state=data.state.text if data.state else None,
+                    returncode=data.returncode,
+                    reasons=data.reasons,
+                    resources=data.resources,
+                    attempts=data.attempts)
+        if (data.state is not None) and (data.state.level > 0):
+            item['stdout'] = data.stdout
+            item['stderr'] = data.stderr
+        results[name] = item
+
+    return dict(name=tc.name(),
+                state=tc.state.text if tc.state else None,
+                start_time=tc.start_time,
+                duration=tc.time,
+                results=results)
+
+
+class ResultWriter(object):
+    """
+    Base class for objects that record the results of test cases to a file during a call to the
+    `moosetest.run` function, in addition to the output of the `Formatter` object.
+
+    The `write` method is called as each `TestCase` finishes and the `complete` method is called
+    when all test cases have finished.
+    """
+    def __init__(self, filename):
+        self._filename = filename
+
+    def write(self, tc):
+        """
+        Record the results of the finished `TestCase` in *tc*.
+        """
+        pass
+
+    def complete(self, testcases, duration):
+        """
+        Record the results of the `TestCase` objects in *testcases* and the total *duration* (in
+        seconds) of the run, after all of the test cases have finished.
+        """
+        pass
+
+
+class JSONLinesWriter(ResultWriter):
+    """
+    Append a JSON record (see `testcase_record`) per line to *filename* as each test case finishes.
+
+    The lines are written by a thread, which flushes the file and calls `os.fsync` at most every
+    *sync_interval* seconds. This makes the results available to other processes during a run
+    without the `run` function waiting for the disk. The thread is started by the first call to
+    `write` after the object is created or `complete` is called, thus the object may be used for
+    many runs.
+    """
+    def __init__(self, filename, sync_interval=5.):
+        ResultWriter.__init__(self, filename)
+        self._sync_interval = sync_interval
+        self._queue = queue.Queue()
+        self._thread = None
+
+    def write(self, tc):
+        """
+        Add the record of the `TestCase` in *tc* to the queue of lines to be written. (override)
+        """
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._target, daemon=True)
+            self._thread.start()
+        self._queue.put(json.dumps(testcase_record(tc)) + '\n')
+
+    def complete(self, testcases, duration):
+        """
+        Write the remaining lines and close the file. (override)
+        """
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread.join()
+            self._thread = None
+
+    def _target(self):
+        """
+        Function for the thread that writes the lines in the queue to the file.
+        """
+        try:
+            fid = open(self._filename, 'a')
+        except OSError:
+            logging.getLogger(__name__).warning("Failed to open the results file '%s'.",
+                                                self._filename)
+            fid = None
+
+        last_sync = time.time()
+        while True:
+            try:
+                line = self._queue.get(timeout=self._sync_interval)
+            except queue.Empty:
+                line = ''
+            if (line is not None) and (fid is not None):
+                fid.write(line)
+
+            if (fid is not None) and ((line is None) or
+                                      (time.time() - last_sync >= self._sync_interval)):
+                fid.flush()
+                os.fsync(fid.fileno())
+                last_sync = time.time()
+
+            if line is None:
+                break
+
+        if fid is not None:
+            fid.close()
+
+
+class JUnitWriter(ResultWriter):
+    """
+    Write the results of all test cases to *filename* in the JUnit XML format, when the run is
+    complete.
+
+    Test cases with a SKIP state are reported as skipped, those with a DIFF or ERROR state as
+    failures, and those with a more severe state as errors.
+
+    The ANSI escape sequences (e.g., colors) and the characters that XML does not allow are removed
+    from the reasons and output (see `JUnitWriter.text`).
+    """
+    @staticmethod
+    def text(text):
+        """
+        Return *text* without ANSI escape sequences and characters that are invalid in XML 1.0.
+        """
+        return XML_INVALID_RE.sub('', mooseutils.strip_color(text))
+
+    def complete(self, testcases, duration):
+        """
+        Write the XML file for the `TestCase` objects in *testcases*. (override)
+        """
+        testcases = list(testcases)
+        counts = dict(failures=0, errors=0, skipped=0)
+        suite = ET.Element('testsuite', name='moosetest', tests=str(len(testcases)))
+        for tc in testcases:
+            classname, _, name = tc.name().rpartition(':')
+            case = ET.SubElement(suite,
+                                 'testcase',
+                                 name=name,
+                                 classname=classname,
+                                 time=f'{tc.time:.3f}')
+
+            state = tc.state
+            if state in (None, TestCase.Result.PASS):
+                continue
+
+            data = (tc.results or dict()).values()
+            message = '; '.join(r for d in data for r in (d.reasons or []))
+            if state == TestCase.Result.SKIP:
+                tag = 'skipped'
+            elif state in (TestCase.Result.TIMEOUT, TestCase.Result.DIFF, TestCase.Result.ERROR):
+                tag = 'failure'
+            else:
+                tag = 'error'
+            counts[tag if tag == 'skipped' else f'{tag}s'] += 1
+            ET.SubElement(case,
+                          tag,
+                          message=JUnitWriter.text(message or state.text),
+                          type=state.text)
+
+            stdout = ''.join(d.stdout or '' for d in data)
+            stderr = ''.join(d.stderr or '' for d in data)
+            if stdout:
+                ET.SubElement(case, 'system-out').text = JUnitWriter.text(stdout)
+            if stderr:
+                ET.SubElement(case, 'system-err').text = JUnitWriter.text(stderr)
+
+        for key, value in counts.items():
+            suite.set(key, str(value))
+        suite.set('time', f'{duration:.3f}')
+
+        try:
+            mooseutils.atomic_write(self._filename,
+                                    lambda fid: ET.ElementTree(suite).write(
+                                        fid, encoding='utf-8', xml_declaration=True),
+                                    mode='wb')
+        except OSError:
+            logging.getLogger(__name__).warning("Failed to write the JUnit file '%s'.",
+                                                self._filename)
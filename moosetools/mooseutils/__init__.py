@@ -13,7 +13,7 @@ from .mooseutils import touch, unique_list, gold, make_chunks, camel_to_space
 from .mooseutils import text_diff, unidiff, text_unidiff, run_profile, list_files, check_output, run_time
 from .mooseutils import generate_filebase, recursive_update, fuzzyEqual, fuzzyAbsoluteEqual
 from .gitutils import is_git_repo, git_commit, git_commit_message, git_merge_commits, git_ls_files
-from .gitutils import git_root_dir, git_init_submodule, git_submodule_status, git_version
+from .gitutils import git_changed_files, git_root_dir, git_init_submodule, git_submodule_status, git_version
 from .gitutils import git_authors, git_lines, git_committers, git_localpath, git_repo
 from .message import mooseDebug, mooseWarning, mooseMessage, mooseError
 from .MooseException import MooseException
@@ -28,9 +28,10 @@ from .yaml_load import yaml_load, yaml_write, IncludeYamlFile
 from .MooseDataFrame import MooseDataFrame
 from .PostprocessorReader import PostprocessorReader
 from .VectorPostprocessorReader import VectorPostprocessorReader
-from .color_text import color_text
+from .color_text import color_text, strip_color
 from .log import color_log
 from .CurrentWorkingDirectory import CurrentWorkingDirectory
+from .atomic_write import atomic_write
 
 try:
     from .ImageDiffer import ImageDiffer
@@ -0,0 +1,29 @@
+#* This file is part of MOOSETOOLS repository
+#* https://www.github.com/idaholab/moosetools
+#*
+#* All rights reserved, see COPYRIGHT for full restrictions
+#* https://github.com/idaholab/moosetools/blob/main/COPYRIGHT
+#*
+#* Licensed under LGPL 2.1, please see LICENSE for details
+#* https://www.gnu.org/licenses/lgpl-2.1.html
+
+import os
+
+
+def atomic_write(filename, write, mode='w'):
+    """
+    Create or replace *filename* by calling *write* with the file object opened with *mode*.
+
+    The content is written to a temporary file that is then moved to *filename*, so a concurrent
+    reader never sees a partial file. If an exception is raised the temporary file is removed and
+    the exception is raised again.
+    """
+    tmp = f'{filename}.{os.getpid()}.tmp'
+    try:
+        with open(tmp, mode) as fid:
+            write(fid)
+        os.replace(tmp, filename)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
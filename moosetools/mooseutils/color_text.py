@@ -7,8 +7,12 @@
 #* Licensed under LGPL 2.1, please see LICENSE for details
 #* https://www.gnu.org/licenses/lgpl-2.1.html
 
+import re
 import colored
 
+# ANSI escape sequences, e.g., the color codes added by `color_text` and `colorText`
+ANSI_RE = re.compile(r'\x1b(\[[0-?]*[ -/]*[@-~]|[@-Z\\-_])')
+
 
 def color_text(text, fg=None, bg=None):
     output = ''
@@ -20,3 +24,10 @@ def color_text(text, fg=None, bg=None):
     if (fg is not None) or (bg is not None):
         output += colored.attr('reset')
     return output
+
+
+def strip_color(text):
+    """
+    Return *text* with the ANSI escape sequences (e.g., colors) removed.
+    """
+    return ANSI_RE.sub('', text)
@@ -65,6 +65,21 @@ def git_ls_files(working_dir=os.getcwd(), recurse_submodules=False, exclude=None
     return out
 
 
+def git_changed_files(ref, working_dir=os.getcwd()):
+    """
+    Return a set of the files (absolute paths) changed since the merge base of the commit *ref* and
+    HEAD, including uncommitted changes and untracked files, via 'git diff' and 'git ls-files'.
+
+    The merge base is used such that changes on *ref* that are not in HEAD (e.g., when the current
+    branch is behind 'origin/main') are not included.
+    """
+    root = check_output(['git', 'rev-parse', '--show-toplevel'], cwd=working_dir).strip('\n')
+    base = check_output(['git', 'merge-base', ref, 'HEAD'], cwd=root).strip('\n')
+    out = check_output(['git', 'diff', '--name-only', base, '--'], cwd=root).split('\n')
+    out += check_output(['git', 'ls-files', '--others', '--exclude-standard'], cwd=root).split('\n')
+    return set(os.path.abspath(os.path.join(root, fname)) for fname in out if fname)
+
+
 def git_root_dir(working_dir=os.getcwd()):
     """
     Return the top-level git directory by running 'git rev-parse --show-toplevel'.
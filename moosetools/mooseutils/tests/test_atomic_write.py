@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+#* This file is part of MOOSETOOLS repository
+#* https://www.github.com/idaholab/moosetools
+#*
+#* All rights reserved, see COPYRIGHT for full restrictions
+#* https://github.com/idaholab/moosetools/blob/main/COPYRIGHT
+#*
+#* Licensed under LGPL 2.1, please see LICENSE for details
+#* https://www.gnu.org/licenses/lgpl-2.1.html
+
+import os
+import shutil
+import tempfile
+import unittest
+from moosetools import mooseutils
+
+
+class Test(unittest.TestCase):
+    def setUp(self):
+        self._dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self._dir)
+        self._filename = os.path.join(self._dir, 'out.txt')
+
+    def testWrite(self):
+        mooseutils.atomic_write(self._filename, lambda fid: fid.write('one'))
+        mooseutils.atomic_write(self._filename, lambda fid: fid.write(b'two'), mode='wb')
+        with open(self._filename, 'r') as fid:
+            self.assertEqual(fid.read(), 'two')
+        self.assertEqual(os.listdir(self._dir), ['out.txt'])
+
+    def testError(self):
+        mooseutils.atomic_write(self._filename, lambda fid: fid.write('one'))
+
+        def write(fid):
+            fid.write('partial')
+            raise TypeError('not serializable')
+
+        with self.assertRaises(TypeError):
+            mooseutils.atomic_write(self._filename, write)
+        with open(self._filename, 'r') as fid:
+            self.assertEqual(fid.read(), 'one')
+        self.assertEqual(os.listdir(self._dir), ['out.txt'])
+
+        with self.assertRaises(OSError):
+            mooseutils.atomic_write(os.path.join(self._dir, 'missing', 'out.txt'),
+                                    lambda fid: fid.write('one'))
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2, buffer=True)
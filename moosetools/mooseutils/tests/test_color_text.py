@@ -0,0 +1,24 @@
+#!/usr/bin/env python3
+#* This file is part of MOOSETOOLS repository
+#* https://www.github.com/idaholab/moosetools
+#*
+#* All rights reserved, see COPYRIGHT for full restrictions
+#* https://github.com/idaholab/moosetools/blob/main/COPYRIGHT
+#*
+#* Licensed under LGPL 2.1, please see LICENSE for details
+#* https://www.gnu.org/licenses/lgpl-2.1.html
+
+import unittest
+from moosetools import mooseutils
+
+
+class Test(unittest.TestCase):
+    def testStripColor(self):
+        self.assertEqual(mooseutils.strip_color('\x1b[38;5;1mred\x1b[0m grey'), 'red grey')
+        self.assertEqual(mooseutils.strip_color(mooseutils.colorText('green', 'GREEN')), 'green')
+        self.assertEqual(mooseutils.strip_color('\x1b[1;31mbold\x1b[0m\x1b[2K'), 'bold')
+        self.assertEqual(mooseutils.strip_color('no color [0m'), 'no color [0m')
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2, buffer=True)
@@ -48,6 +48,54 @@ class Test(unittest.TestCase):
         files = mooseutils.git_ls_files()
         self.assertIn(os.path.abspath(__file__), files)
 
+    def testGitChangedFiles(self):
+        with tempfile.TemporaryDirectory() as loc:
+            git = lambda *args: subprocess.run(
+                ['git', '-c', 'user.name=a', '-c', 'user.email=b', *args],
+                cwd=loc,
+                check=True,
+                capture_output=True)
+            git('init')
+            for name in ('a.txt', 'b.txt', 'c.txt'):
+                with open(os.path.join(loc, name), 'w') as fid:
+                    fid.write(name)
+            git('add', 'a.txt', 'b.txt', 'c.txt')
+            git('commit', '-m', 'initial')
+            self.assertEqual(mooseutils.git_changed_files('HEAD', loc), set())
+
+            with open(os.path.join(loc, 'a.txt'), 'w') as fid:
+                fid.write('changed')
+            os.remove(os.path.join(loc, 'b.txt'))
+            os.makedirs(os.path.join(loc, 'sub'))
+            with open(os.path.join(loc, 'sub', 'd.txt'), 'w') as fid:
+                fid.write('new')
+
+            root = os.path.realpath(loc)
+            files = mooseutils.git_changed_files('HEAD', os.path.join(loc, 'sub'))
+            self.assertEqual(
+                files, {
+                    os.path.join(root, 'a.txt'),
+                    os.path.join(root, 'b.txt'),
+                    os.path.join(root, 'sub', 'd.txt')
+                })
+
+            # Changes on the reference that are not on the current branch are not included
+            git('add', '-A')
+            git('commit', '-m', 'branch')
+            git('branch', 'branch')
+            git('checkout', '-b', 'upstream', 'HEAD~1')
+            with open(os.path.join(loc, 'c.txt'), 'w') as fid:
+                fid.write('upstream')
+            git('commit', '-a', '-m', 'upstream')
+            git('checkout', 'branch')
+            files = mooseutils.git_changed_files('upstream', loc)
+            self.assertEqual(
+                files, {
+                    os.path.join(root, 'a.txt'),
+                    os.path.join(root, 'b.txt'),
+                    os.path.join(root, 'sub', 'd.txt')
+                })
+
     @unittest.skipIf(not mooseutils.is_git_repo(), "Not a Git repository")
     def testGitRootDir(self):
         root = mooseutils.git_root_dir()